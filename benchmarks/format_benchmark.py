@@ -0,0 +1,203 @@
+"""
+Benchmarks helpers.format_content over synthetic contents, against the previous generic formatter.
+
+Usage, from the repository root:
+    PYTHONPATH=. python benchmarks/format_benchmark.py [--contents 500] [--pages 5] [--repeat 20]
+"""
+import argparse
+import random
+import time
+from types import SimpleNamespace
+
+from graphlit_api import enums
+
+from graphlit_tools import helpers
+
+def legacy_format_content(content, include_text=True):
+    results = []
+
+    results.append(f"**Content ID:** {content.id}")
+
+    if content.type == enums.ContentTypes.FILE:
+        results.append(f"**File Type:** [{content.file_type}]")
+        results.append(f"**File Name:** {content.file_name}")
+    else:
+        results.append(f"**Type:** [{content.type}]")
+        if content.type not in [enums.ContentTypes.PAGE, enums.ContentTypes.EMAIL]:
+            results.append(f"**Name:** {content.name}")
+
+    if content.uri:
+        results.append(f"**URI:** {content.uri}")
+    if content.creation_date:
+        results.append(f"**Ingestion Date:** {content.creation_date}")
+    if content.original_date:
+        results.append(f"**Author Date:** {content.original_date}")
+
+    if content.issue:
+        issue_attributes = [
+            ("Title", content.issue.title),
+            ("Identifier", content.issue.identifier),
+            ("Type", content.issue.type),
+            ("Project", content.issue.project),
+            ("Team", content.issue.team),
+            ("Status", content.issue.status),
+            ("Priority", content.issue.priority),
+        ]
+        results.extend([f"**{label}:** {value}" for label, value in issue_attributes if value])
+
+        if content.issue.labels:
+            results.append(f"**Labels:** {', '.join(content.issue.labels)}")
+
+    if content.email:
+        email_attributes = [
+            ("Subject", content.email.subject),
+            ("Sensitivity", content.email.sensitivity.name if content.email.sensitivity else None),
+            ("Priority", content.email.priority.name if content.email.priority else None),
+            ("Importance", content.email.importance.name if content.email.importance else None),
+            ("Labels", ', '.join(content.email.labels) if content.email.labels else None),
+            ("To", ', '.join(f"{r.name} <{r.email}>" for r in content.email.to) if content.email.to else None),
+            ("From", ', '.join(f"{r.name} <{r.email}>" for r in getattr(content.email, "from", []))),
+            ("CC", ', '.join(f"{r.name} <{r.email}>" for r in content.email.cc) if content.email.cc else None),
+            ("BCC", ', '.join(f"{r.name} <{r.email}>" for r in content.email.bcc) if content.email.bcc else None),
+        ]
+        results.extend([f"**{label}:** {value}" for label, value in email_attributes if value])
+
+    if content.document:
+        document_attributes = [
+            ("Title", content.document.title),
+            ("Author", content.document.author),
+        ]
+        results.extend([f"**{label}:** {value}" for label, value in document_attributes if value])
+
+    if content.audio:
+        audio_attributes = [
+            ("Title", content.audio.title),
+            ("Host", content.audio.author),
+            ("Episode", content.audio.episode),
+            ("Series", content.audio.series),
+        ]
+        results.extend([f"**{label}:** {value}" for label, value in audio_attributes if value])
+
+    if content.image:
+        image_attributes = [
+            ("Description", content.image.description),
+            ("Software", content.image.software),
+            ("Make", content.image.make),
+            ("Model", content.image.model),
+        ]
+        results.extend([f"**{label}:** {value}" for label, value in image_attributes if value])
+
+    if content.links:
+        if content.type in [enums.ContentTypes.PAGE]:
+            results.extend([f"**{link.link_type} Link:** {link.uri}" for link in content.links[:100]])
+
+    if include_text:
+        if content.pages:
+            for page in content.pages:
+                if page.chunks:
+                    results.append(f"**Page #{page.index + 1}:**")
+                    results.extend([chunk.text for chunk in page.chunks])
+                    results.append("\n---\n")
+
+        if content.segments:
+            for segment in content.segments:
+                results.append(f"**Transcript Segment [{segment.start_time}-{segment.end_time}]:**")
+                results.append(segment.text)
+                results.append("\n---\n")
+
+        if content.frames:
+            for frame in content.frames:
+                results.append(f"**Frame #{frame.index + 1}:**")
+                results.append(frame.text)
+                results.append("\n---\n")
+
+        if not content.pages and not content.segments and not content.frames and content.markdown:
+            results.append(content.markdown)
+            results.append("\n")
+    else:
+        results.append("\n")
+
+    return results
+
+def synthetic_content(index: int, pages: int, rng: random.Random) -> SimpleNamespace:
+    content_type = rng.choice([enums.ContentTypes.PAGE, enums.ContentTypes.FILE, enums.ContentTypes.EMAIL, enums.ContentTypes.ISSUE, enums.ContentTypes.MESSAGE])
+
+    content = SimpleNamespace(
+        id=f"content-{index}", type=content_type, name=f"Content {index}", uri=f"https://example.com/{index}",
+        file_type=enums.FileTypes.DOCUMENT if content_type == enums.ContentTypes.FILE else None, file_name=f"file-{index}.pdf",
+        creation_date="2025-01-01T00:00:00Z", original_date=None, relevance=None,
+        issue=None, email=None, document=None, audio=None, image=None, links=None, pages=None, segments=None, frames=None, markdown=None
+    )
+
+    if content_type == enums.ContentTypes.ISSUE:
+        content.issue = SimpleNamespace(title="Fix crash", identifier=f"GL-{index}", type="Bug", project="Tools", team=None, status="Open", priority=None, labels=["bug"])
+    elif content_type == enums.ContentTypes.EMAIL:
+        recipient = SimpleNamespace(name="Jane", email="jane@example.com")
+        content.email = SimpleNamespace(subject="Hello", sensitivity=None, priority=None, importance=None, labels=None, to=[recipient], cc=None, bcc=None)
+    elif content_type == enums.ContentTypes.FILE:
+        content.document = SimpleNamespace(title="Report", author=None)
+    elif content_type == enums.ContentTypes.PAGE:
+        content.links = [SimpleNamespace(link_type=enums.LinkTypes.WEB, uri=f"https://example.com/{index}/{link}") for link in range(20)]
+
+    if content_type == enums.ContentTypes.MESSAGE:
+        content.markdown = "Message text. " * 20
+    else:
+        content.pages = [
+            SimpleNamespace(index=page, relevance=None, chunks=[SimpleNamespace(text="Lorem ipsum dolor sit amet. " * 10, relevance=None) for _ in range(4)])
+            for page in range(pages)
+        ]
+
+    return content
+
+def synthetic_email_file(index: int) -> SimpleNamespace:
+    # NOTE: an uploaded .eml file, which is a FILE content with email metadata
+    recipient = SimpleNamespace(name="Jane", email="jane@example.com")
+
+    return SimpleNamespace(
+        id=f"content-{index}", type=enums.ContentTypes.FILE, name=f"Content {index}", uri=f"https://example.com/{index}.eml",
+        file_type=enums.FileTypes.EMAIL, file_name=f"message-{index}.eml",
+        creation_date="2025-01-01T00:00:00Z", original_date=None, relevance=None,
+        issue=None, document=None, audio=None, image=None, links=None, pages=None, segments=None, frames=None,
+        email=SimpleNamespace(subject="Hello", sensitivity=None, priority=None, importance=None, labels=None, to=[recipient], cc=[recipient], bcc=None),
+        markdown="Message text. " * 20
+    )
+
+def measure(formatter, contents, repeat: int) -> float:
+    timings = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+
+        for content in contents:
+            formatter(content)
+
+        timings.append(time.perf_counter() - start)
+
+    return sorted(timings)[len(timings) // 2] / len(contents) * 1e6
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--contents", type=int, default=500)
+    parser.add_argument("--pages", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    contents = [synthetic_content(index, args.pages, rng) for index in range(args.contents)]
+
+    for content in [*contents, synthetic_email_file(len(contents))]:
+        assert helpers.format_content(content) == legacy_format_content(content), f"Formatting differs for [{content.id}]"
+        assert helpers.format_content(content, False) == legacy_format_content(content, False), f"Formatting differs for [{content.id}]"
+
+    legacy_us = measure(legacy_format_content, contents, args.repeat)
+    current_us = measure(helpers.format_content, contents, args.repeat)
+
+    metadata_legacy_us = measure(lambda content: legacy_format_content(content, False), contents, args.repeat)
+    metadata_current_us = measure(lambda content: helpers.format_content(content, False), contents, args.repeat)
+
+    print(f"contents: {args.contents}, pages per content: {args.pages}")
+    print(f"with text: legacy {legacy_us:.2f} us/item, current {current_us:.2f} us/item ({legacy_us / current_us:.2f}x)")
+    print(f"metadata only: legacy {metadata_legacy_us:.2f} us/item, current {metadata_current_us:.2f} us/item ({metadata_legacy_us / metadata_current_us:.2f}x)")
+
+if __name__ == "__main__":
+    main()
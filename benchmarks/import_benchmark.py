@@ -0,0 +1,47 @@
+"""
+Benchmarks import time of graphlit_tools in fresh interpreter processes.
+
+Usage:
+    python benchmarks/import_benchmark.py [--repeat 5]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+SCENARIOS = {
+    "import graphlit (dependency floor)": "import graphlit",
+    "import graphlit_tools": "import graphlit_tools",
+    "from graphlit_tools import WebSearchTool": "from graphlit_tools import WebSearchTool",
+    "all graphlit_tools exports": "import graphlit_tools\nfor name in graphlit_tools.__all__: getattr(graphlit_tools, name)",
+}
+
+TIMER = """
+import time
+start = time.perf_counter()
+{statement}
+print((time.perf_counter() - start) * 1000)
+"""
+
+def measure(statement: str, repeat: int) -> float:
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    environment = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [root, os.environ.get("PYTHONPATH")])))
+
+    timings = []
+
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", TIMER.format(statement=statement)], env=environment, capture_output=True, text=True, check=True)
+        timings.append(float(output.stdout.strip()))
+
+    return sorted(timings)[len(timings) // 2]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for label, statement in SCENARIOS.items():
+        print(f"{label}: median {measure(statement, args.repeat):.1f} ms")
+
+if __name__ == "__main__":
+    main()
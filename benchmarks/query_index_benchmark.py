@@ -0,0 +1,79 @@
+"""
+Checks the accuracy of QueryIndex MinHash signatures against true Jaccard similarity, and benchmarks lookups.
+
+Exits with status 1 if the mean estimate error exceeds the tolerance, so it can gate MinHash changes.
+
+Usage, from the repository root:
+    PYTHONPATH=. python benchmarks/query_index_benchmark.py [--pairs 2000] [--words 12] [--queries 1000] [--tolerance 0.05]
+"""
+import argparse
+import random
+import sys
+import time
+
+from graphlit_tools.queries import QueryIndex
+
+def synthetic_pair(rng: random.Random, words: int, vocabulary: int):
+    left = set(rng.sample(range(vocabulary), words))
+
+    # NOTE: replace a random number of words, so true similarities cover the whole range
+    replaced = rng.randint(0, words)
+
+    right = set(rng.sample(sorted(left), words - replaced))
+
+    while len(right) < words:
+        right.add(rng.randrange(vocabulary))
+
+    return frozenset(f"word{index}" for index in left), frozenset(f"word{index}" for index in right)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pairs", type=int, default=2000)
+    parser.add_argument("--words", type=int, default=12)
+    parser.add_argument("--vocabulary", type=int, default=10000)
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("--tolerance", type=float, default=0.05, help="Maximum mean absolute error of the similarity estimate.")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    index = QueryIndex()
+
+    errors = []
+
+    for _ in range(args.pairs):
+        left, right = synthetic_pair(rng, args.words, args.vocabulary)
+
+        true_similarity = len(left & right) / len(left | right)
+
+        estimate = sum(1 for a, b in zip(index.signature(left), index.signature(right)) if a == b) / index.num_perm
+
+        errors.append(estimate - true_similarity)
+
+    mean_error = sum(abs(error) for error in errors) / len(errors)
+    bias = sum(errors) / len(errors)
+
+    queries = [" ".join(rng.sample([f"word{word}" for word in range(args.vocabulary)], args.words)) for _ in range(args.queries)]
+
+    start = time.perf_counter()
+
+    for key, query in enumerate(queries):
+        index.add(key, query)
+
+    add_us = (time.perf_counter() - start) / len(queries) * 1e6
+
+    start = time.perf_counter()
+
+    hits = sum(1 for query in queries if index.lookup(query) is not None)
+
+    lookup_us = (time.perf_counter() - start) / len(queries) * 1e6
+
+    print(f"pairs: {args.pairs}, words: {args.words}, hash functions: {index.num_perm}")
+    print(f"similarity estimate: mean absolute error {mean_error:.3f}, bias {bias:+.3f}, max error {max(abs(error) for error in errors):.3f}")
+    print(f"add: {add_us:.1f} us/query, lookup: {lookup_us:.1f} us/query, exact hits {hits}/{len(queries)}")
+
+    if mean_error > args.tolerance:
+        print(f"FAILED: mean absolute error {mean_error:.3f} exceeds tolerance {args.tolerance}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
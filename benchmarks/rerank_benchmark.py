@@ -0,0 +1,59 @@
+"""
+Benchmarks client-side re-ranking of retrieval chunks with NumPy cosine similarity.
+
+Usage, from the repository root:
+    PYTHONPATH=. python benchmarks/rerank_benchmark.py [--chunks 10000] [--dimensions 256] [--repeat 20]
+"""
+import argparse
+import random
+import time
+
+import numpy as np
+
+from graphlit_tools.rerank import HashingEmbedder, Reranker, cosine_similarity
+
+WORDS = ["graph", "content", "feed", "crawl", "agent", "vector", "search", "summary", "invoice", "contract",
+         "meeting", "transcript", "email", "issue", "page", "image", "model", "prompt", "entity", "person"]
+
+def synthetic_chunks(count: int, words_per_chunk: int = 60, seed: int = 42):
+    rng = random.Random(seed)
+
+    return [" ".join(rng.choices(WORDS, k=words_per_chunk)) for _ in range(count)]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chunks", type=int, default=10000)
+    parser.add_argument("--dimensions", type=int, default=256)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    chunks = synthetic_chunks(args.chunks)
+    embedder = HashingEmbedder(args.dimensions)
+    reranker = Reranker(embedder)
+    query = "contract invoice summary"
+
+    start = time.perf_counter()
+    matrix = embedder.embed(chunks)
+    embed_ms = (time.perf_counter() - start) * 1000
+
+    query_vector = embedder.embed([query])[0]
+
+    timings = []
+
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        scores = cosine_similarity(query_vector, matrix)
+        np.argsort(-scores, kind="stable")
+        timings.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    reranker.rerank(query, chunks, limit=10)
+    end_to_end_ms = (time.perf_counter() - start) * 1000
+
+    print(f"chunks: {args.chunks}, dimensions: {args.dimensions}")
+    print(f"embed (hashing): {embed_ms:.1f} ms")
+    print(f"score + sort: median {sorted(timings)[len(timings) // 2]:.2f} ms, min {min(timings):.2f} ms")
+    print(f"rerank end-to-end: {end_to_end_ms:.1f} ms")
+
+if __name__ == "__main__":
+    main()
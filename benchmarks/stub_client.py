@@ -0,0 +1,157 @@
+"""
+Stub Graphlit client for offline benchmarks, with configurable latency and payload sizes.
+
+Responses mimic the shape of the generated Graphlit API responses, for the fields the tools read.
+Stub methods take the keyword arguments the tools pass, and ignore those which don't affect the response.
+"""
+import asyncio
+import json
+import random
+from collections import Counter
+from types import SimpleNamespace
+from typing import Any, Dict
+
+from format_benchmark import synthetic_content
+
+# NOTE: holds its configuration along with the call counters reported by benchmarks
+class StubGraphlitClient: # pylint: disable=too-many-instance-attributes
+    """
+    Stub for the Graphlit API client.
+
+    Args:
+        latency (float): Simulated round trip per API call, in seconds. Defaults to 0.05.
+        jitter (float): Maximum random latency added per API call, in seconds. Defaults to 0.
+        results (int): Number of results per query. Defaults to 10.
+        pages (int): Number of text pages per content. Defaults to 5.
+        polls_until_done (int): Number of feed status polls before a feed reports done. Defaults to 1.
+        seed (int): Random seed, for repeatable payloads. Defaults to 42.
+    """
+    def __init__(self, latency: float = 0.05, jitter: float = 0.0, results: int = 10, pages: int = 5, polls_until_done: int = 1, seed: int = 42):
+        self.latency = latency
+        self.jitter = jitter
+        self.results = results
+        self.polls_until_done = polls_until_done
+
+        self.rng = random.Random(seed)
+        self.calls: Counter = Counter()
+        self.feed_polls: Dict[str, int] = {}
+
+        self.contents = [synthetic_content(index, pages, self.rng) for index in range(max(results, 1))]
+
+        # NOTE: every content has a screenshot, so the describe web page tool finds an image to describe
+        for content in self.contents:
+            content.image_uri = f"{content.uri}/screenshot.png"
+
+    async def _respond(self, operation: str, **response: Any) -> SimpleNamespace:
+        self.calls[operation] += 1
+
+        delay = self.latency + (self.rng.uniform(0, self.jitter) if self.jitter > 0 else 0)
+
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        return SimpleNamespace(**response)
+
+    @staticmethod
+    def _message(text: str) -> SimpleNamespace:
+        return SimpleNamespace(message=text, tool_calls=None)
+
+    async def query_contents(self, **kwargs) -> SimpleNamespace:
+        content_filter = kwargs.get("filter")
+
+        limit = getattr(content_filter, "limit", None) or self.results
+        excluded = {reference.id for reference in getattr(content_filter, "exclude_contents", None) or []}
+
+        results = [content for content in self.contents if content.id not in excluded][:limit]
+
+        return await self._respond("query_contents", contents=SimpleNamespace(results=results))
+
+    async def get_content(self, **kwargs) -> SimpleNamespace:
+        content = next((content for content in self.contents if content.id == kwargs.get("id")), self.contents[0])
+
+        return await self._respond("get_content", content=content)
+
+    async def ingest_uri(self, **_kwargs) -> SimpleNamespace:
+        return await self._respond("ingest_uri", ingest_uri=SimpleNamespace(id=self.contents[0].id))
+
+    async def ingest_encoded_file(self, *_args, **_kwargs) -> SimpleNamespace:
+        return await self._respond("ingest_encoded_file", ingest_encoded_file=SimpleNamespace(id=self.contents[0].id))
+
+    async def screenshot_page(self, **_kwargs) -> SimpleNamespace:
+        return await self._respond("screenshot_page", screenshot_page=SimpleNamespace(id=self.contents[0].id))
+
+    async def search_web(self, **kwargs) -> SimpleNamespace:
+        results = [
+            SimpleNamespace(uri=f"https://example.com/{index}", title=f"Result {index}", text="Lorem ipsum dolor sit amet. " * 20)
+            for index in range(kwargs.get("limit") or self.results)
+        ]
+
+        return await self._respond("search_web", search_web=SimpleNamespace(results=results))
+
+    async def map_web(self, **kwargs) -> SimpleNamespace:
+        results = [f"{kwargs['uri'].rstrip('/')}/page-{index}" for index in range(self.results * 10)]
+
+        return await self._respond("map_web", map_web=SimpleNamespace(results=results))
+
+    async def query_persons(self, **kwargs) -> SimpleNamespace:
+        results = [
+            SimpleNamespace(id=f"person-{index}", name=f"Person {index}", email=f"person{index}@example.com", uri=None, education=None, occupation="Engineer")
+            for index in range(getattr(kwargs.get("filter"), "limit", None) or self.results)
+        ]
+
+        return await self._respond("query_persons", persons=SimpleNamespace(results=results))
+
+    async def query_organizations(self, **kwargs) -> SimpleNamespace:
+        results = [
+            SimpleNamespace(id=f"organization-{index}", name=f"Organization {index}", email=None, uri=f"https://example{index}.com")
+            for index in range(getattr(kwargs.get("filter"), "limit", None) or self.results)
+        ]
+
+        return await self._respond("query_organizations", organizations=SimpleNamespace(results=results))
+
+    async def summarize_text(self, **kwargs) -> SimpleNamespace:
+        return await self._respond("summarize_text", summarize_text=SimpleNamespace(items=[SimpleNamespace(text=kwargs["text"][:200])]))
+
+    async def extract_text(self, **kwargs) -> SimpleNamespace:
+        extractions = [
+            SimpleNamespace(value=json.dumps({"title": f"Item {index}", "summary": kwargs["text"][:100]}))
+            for index in range(self.results)
+        ]
+
+        return await self._respond("extract_text", extract_text=extractions)
+
+    async def describe_image(self, **kwargs) -> SimpleNamespace:
+        return await self._respond("describe_image", describe_image=SimpleNamespace(message=self._message(f"Description of [{kwargs['uri']}].")))
+
+    async def prompt_conversation(self, **kwargs) -> SimpleNamespace:
+        conversation = SimpleNamespace(id=kwargs.get("id") or "conversation-0")
+
+        return await self._respond("prompt_conversation", prompt_conversation=SimpleNamespace(conversation=conversation, message=self._message("Lorem ipsum dolor sit amet. " * 20)))
+
+    async def query_microsoft_teams_teams(self, **_kwargs) -> SimpleNamespace:
+        results = [SimpleNamespace(team_id="team-0", team_name="Team")]
+
+        return await self._respond("query_microsoft_teams_teams", microsoft_teams_teams=SimpleNamespace(results=results))
+
+    async def query_microsoft_teams_channels(self, **_kwargs) -> SimpleNamespace:
+        results = [SimpleNamespace(channel_id="channel-0", channel_name="General")]
+
+        return await self._respond("query_microsoft_teams_channels", microsoft_teams_channels=SimpleNamespace(results=results))
+
+    async def create_feed(self, **_kwargs) -> SimpleNamespace:
+        feed_id = f"feed-{len(self.feed_polls)}"
+
+        self.feed_polls[feed_id] = 0
+
+        return await self._respond("create_feed", create_feed=SimpleNamespace(id=feed_id))
+
+    async def is_feed_done(self, feed_id: str, **_kwargs) -> SimpleNamespace:
+        self.feed_polls[feed_id] = self.feed_polls.get(feed_id, 0) + 1
+
+        return await self._respond("is_feed_done", is_feed_done=SimpleNamespace(result=self.feed_polls[feed_id] >= self.polls_until_done))
+
+class StubGraphlit:
+    """Stub for the Graphlit class, which only holds the client."""
+
+    def __init__(self, client: StubGraphlitClient):
+        self.client = client
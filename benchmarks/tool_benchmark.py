@@ -0,0 +1,302 @@
+"""
+Offline benchmark suite for the Graphlit tools, against a stub Graphlit client.
+
+Measures throughput and p50/p99 latency of each tool's arun and run, feed notifier wall time and status calls,
+format_content CPU time and memory, and import time. Results are written as JSON, to compare across upgrades.
+
+Usage, from the repository root:
+    PYTHONPATH=. python benchmarks/tool_benchmark.py [--latency 0.05] [--jitter 0] [--results 10] [--pages 5]
+        [--requests 200] [--concurrency 20] [--sync-requests 20] [--feed-requests 20] [--feed-sync-requests 2]
+        [--feeds 100] [--feed-interval 0.1] [--output results.json] [--fixtures fixtures.jsonl.gz] [--speed 1.0]
+
+With --fixtures, tools replay recorded Graphlit API responses rather than using the stub client.
+"""
+import argparse
+import asyncio
+import functools
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Awaitable, Callable, Dict, List
+
+from pydantic import BaseModel
+
+from import_benchmark import SCENARIOS, measure as measure_import
+from stub_client import StubGraphlit, StubGraphlitClient
+
+from graphlit_tools import (
+    ContentRetrievalTool, PersonRetrievalTool, OrganizationRetrievalTool,
+    ExtractTextTool, ExtractURLTool, ExtractWebPageTool,
+    PromptTool, DescribeImageTool, DescribeWebPageTool, GenerateSummaryTool, GenerateBulletsTool, GenerateHeadlinesTool,
+    GenerateSocialMediaPostsTool, GenerateQuestionsTool, GenerateKeywordsTool, GenerateChaptersTool,
+    URLIngestTool, LocalIngestTool, WebScrapeTool, WebSearchTool, WebMapTool, WebCrawlTool, TargetedCrawlTool,
+    RSSIngestTool, RedditIngestTool, NotionIngestTool, MicrosoftEmailIngestTool, GoogleEmailIngestTool,
+    GitHubIssueIngestTool, JiraIssueIngestTool, LinearIssueIngestTool, MicrosoftTeamsIngestTool, DiscordIngestTool, SlackIngestTool,
+    FeedNotifier, helpers
+)
+from graphlit_tools.replay import replay_graphlit
+
+# NOTE: placeholder credentials, since feed tools read them from the environment before creating a feed
+FEED_ENVIRONMENT = {
+    name: "benchmark" for name in [
+        "DISCORD_BOT_TOKEN", "SLACK_BOT_TOKEN", "NOTION_API_KEY", "NOTION_DATABASE_ID", "LINEAR_API_KEY",
+        "GITHUB_PERSONAL_ACCESS_TOKEN", "JIRA_EMAIL", "JIRA_TOKEN",
+        "MICROSOFT_EMAIL_REFRESH_TOKEN", "MICROSOFT_EMAIL_CLIENT_ID", "MICROSOFT_EMAIL_CLIENT_SECRET",
+        "GOOGLE_EMAIL_REFRESH_TOKEN", "GOOGLE_EMAIL_CLIENT_ID", "GOOGLE_EMAIL_CLIENT_SECRET",
+        "MICROSOFT_TEAMS_TEAM_ID", "MICROSOFT_TEAMS_CHANNEL_ID", "MICROSOFT_TEAMS_REFRESH_TOKEN",
+        "MICROSOFT_TEAMS_CLIENT_ID", "MICROSOFT_TEAMS_CLIENT_SECRET",
+    ]
+}
+
+TEXT = "Lorem ipsum dolor sit amet. " * 100
+
+class Extraction(BaseModel):
+    title: str
+    summary: str
+
+def percentile(timings: List[float], fraction: float) -> float:
+    ordered = sorted(timings)
+
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+def summarize(timings: List[float], elapsed: float) -> Dict[str, float]:
+    return {
+        "requests": len(timings),
+        "throughput_per_second": len(timings) / elapsed if elapsed > 0 else 0.0,
+        "p50_ms": percentile(timings, 0.50) * 1000,
+        "p99_ms": percentile(timings, 0.99) * 1000,
+        "max_ms": max(timings) * 1000,
+    }
+
+async def measure_async(call: Callable[[], Awaitable[Any]], requests: int, concurrency: int) -> Dict[str, float]:
+    semaphore = asyncio.Semaphore(concurrency)
+    timings = []
+
+    async def timed():
+        async with semaphore:
+            start = time.perf_counter()
+
+            await call()
+
+            timings.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+
+    await asyncio.gather(*(timed() for _ in range(requests)))
+
+    return summarize(timings, time.perf_counter() - start)
+
+def measure_sync(call: Callable[[], Any], requests: int) -> Dict[str, float]:
+    timings = []
+
+    start = time.perf_counter()
+
+    for _ in range(requests):
+        call_start = time.perf_counter()
+
+        call()
+
+        timings.append(time.perf_counter() - call_start)
+
+    return summarize(timings, time.perf_counter() - start)
+
+def create_graphlit(args) -> Any:
+    if args.fixtures is not None:
+        return replay_graphlit(args.fixtures, args.speed)
+
+    return StubGraphlit(StubGraphlitClient(latency=args.latency, jitter=args.jitter, results=args.results, pages=args.pages))
+
+def tool_scenarios(graphlit: Any, file_path: str) -> Dict[str, Any]:
+    return {
+        "ContentRetrievalTool": (ContentRetrievalTool(graphlit), { "search": "quarterly revenue" }),
+        "PersonRetrievalTool": (PersonRetrievalTool(graphlit), { "search": "engineer" }),
+        "OrganizationRetrievalTool": (OrganizationRetrievalTool(graphlit), { "search": "software" }),
+        "ExtractTextTool": (ExtractTextTool(graphlit, output_model=Extraction), { "text": TEXT }),
+        "ExtractURLTool": (ExtractURLTool(graphlit, output_model=Extraction), { "url": "https://example.com/report.pdf" }),
+        "ExtractWebPageTool": (ExtractWebPageTool(graphlit, output_model=Extraction), { "url": "https://example.com" }),
+        "PromptTool": (PromptTool(graphlit), { "prompt": "Summarize the quarterly report." }),
+        "DescribeImageTool": (DescribeImageTool(graphlit, use_cache=False), { "prompt": "Describe the chart.", "url": "https://example.com/chart.png" }),
+        "DescribeWebPageTool": (DescribeWebPageTool(graphlit), { "url": "https://example.com" }),
+        "GenerateSummaryTool": (GenerateSummaryTool(graphlit), { "text": TEXT }),
+        "GenerateBulletsTool": (GenerateBulletsTool(graphlit), { "text": TEXT }),
+        "GenerateHeadlinesTool": (GenerateHeadlinesTool(graphlit), { "text": TEXT }),
+        "GenerateSocialMediaPostsTool": (GenerateSocialMediaPostsTool(graphlit), { "text": TEXT }),
+        "GenerateQuestionsTool": (GenerateQuestionsTool(graphlit), { "text": TEXT }),
+        "GenerateKeywordsTool": (GenerateKeywordsTool(graphlit), { "text": TEXT }),
+        "GenerateChaptersTool": (GenerateChaptersTool(graphlit), { "text": TEXT }),
+        "URLIngestTool": (URLIngestTool(graphlit), { "url": "https://example.com/report.pdf" }),
+        "LocalIngestTool": (LocalIngestTool(graphlit), { "file_path": file_path }),
+        "WebScrapeTool": (WebScrapeTool(graphlit), { "url": "https://example.com" }),
+        "WebSearchTool": (WebSearchTool(graphlit, use_cache=False), { "search": "graphlit" }),
+        "WebMapTool": (WebMapTool(graphlit), { "url": "https://example.com" }),
+        "TargetedCrawlTool": (TargetedCrawlTool(graphlit), { "url": "https://example.com", "query": "page", "limit": 5 }),
+    }
+
+def feed_tool_scenarios(graphlit: Any) -> Dict[str, Any]:
+    # NOTE: feed tools wait on the shared feed notifier, so each call takes at least one status check interval
+    return {
+        "WebCrawlTool": (WebCrawlTool(graphlit), { "url": "https://example.com" }),
+        "RSSIngestTool": (RSSIngestTool(graphlit), { "url": "https://example.com/feed.xml" }),
+        "RedditIngestTool": (RedditIngestTool(graphlit), { "subreddit_name": "python" }),
+        "NotionIngestTool": (NotionIngestTool(graphlit), {}),
+        "MicrosoftEmailIngestTool": (MicrosoftEmailIngestTool(graphlit), {}),
+        "GoogleEmailIngestTool": (GoogleEmailIngestTool(graphlit), {}),
+        "GitHubIssueIngestTool": (GitHubIssueIngestTool(graphlit), { "repository_name": "graphlit-tools-python", "repository_owner": "graphlit" }),
+        "JiraIssueIngestTool": (JiraIssueIngestTool(graphlit), { "url": "https://example.atlassian.net", "project": "GL" }),
+        "LinearIssueIngestTool": (LinearIssueIngestTool(graphlit), { "project": "Tools" }),
+        "MicrosoftTeamsIngestTool": (MicrosoftTeamsIngestTool(graphlit), {}),
+        "DiscordIngestTool": (DiscordIngestTool(graphlit), { "channel_name": "general" }),
+        "SlackIngestTool": (SlackIngestTool(graphlit), { "channel_name": "general" }),
+    }
+
+async def measure_scenarios(scenarios: Dict[str, Any], requests: int, concurrency: int) -> Dict[str, Any]:
+    return {
+        name: { "arun": await measure_async(functools.partial(tool.arun, **arguments), requests, concurrency) }
+        for name, (tool, arguments) in scenarios.items()
+    }
+
+async def benchmark_tools(args, file_path: str) -> Dict[str, Any]:
+    graphlit = create_graphlit(args)
+
+    results = await measure_scenarios(tool_scenarios(graphlit, file_path), args.requests, args.concurrency)
+
+    results.update(await measure_scenarios(feed_tool_scenarios(graphlit), args.feed_requests, args.concurrency))
+
+    return results
+
+def benchmark_tools_sync(args, file_path: str) -> Dict[str, Any]:
+    graphlit = create_graphlit(args)
+
+    results = {
+        name: measure_sync(functools.partial(tool.run, **arguments), args.sync_requests)
+        for name, (tool, arguments) in tool_scenarios(graphlit, file_path).items()
+    }
+
+    results.update({
+        name: measure_sync(functools.partial(tool.run, **arguments), args.feed_sync_requests)
+        for name, (tool, arguments) in feed_tool_scenarios(graphlit).items()
+    })
+
+    return results
+
+async def poll_feed(client: Any, feed_id: str, interval: float):
+    # NOTE: the per-feed polling loop which the feed notifier replaced, as a baseline
+    while not await helpers.is_feed_done(client, feed_id):
+        await asyncio.sleep(interval)
+
+async def benchmark_feed_notifier(args) -> Dict[str, Any]:
+    # NOTE: intervals are scaled down from the notifier defaults, so a run takes seconds rather than minutes
+    waiters = {
+        "polling": lambda client, feed_id: poll_feed(client, feed_id, args.feed_interval),
+        "notifier": FeedNotifier(min_interval=args.feed_interval, max_interval=args.feed_interval * 10, tick=args.feed_interval).wait,
+    }
+
+    results = {}
+
+    for name, wait in waiters.items():
+        client = StubGraphlitClient(latency=args.latency, jitter=args.jitter, results=args.results, pages=args.pages, polls_until_done=args.feed_polls)
+
+        start = time.perf_counter()
+
+        await asyncio.gather(*(wait(client, f"feed-{index}") for index in range(args.feeds)))
+
+        elapsed = time.perf_counter() - start
+
+        results[name] = {
+            "feeds": args.feeds,
+            "wall_ms": elapsed * 1000,
+            "status_calls": client.calls["is_feed_done"],
+            "status_calls_per_feed": client.calls["is_feed_done"] / args.feeds,
+        }
+
+    return results
+
+def benchmark_format(args) -> Dict[str, Any]:
+    client = StubGraphlitClient(latency=0, results=args.results * 10, pages=args.pages)
+    contents = client.contents
+
+    start = time.process_time()
+
+    for _ in range(10):
+        for content in contents:
+            helpers.format_content(content)
+
+    cpu = (time.process_time() - start) / (10 * len(contents))
+
+    tracemalloc.start()
+
+    text = "\n".join(helpers.format_contents_sync(contents))
+
+    _, peak = tracemalloc.get_traced_memory()
+
+    tracemalloc.stop()
+
+    return {
+        "contents": len(contents),
+        "pages_per_content": args.pages,
+        "cpu_us_per_content": cpu * 1e6,
+        "peak_memory_kib": peak / 1024,
+        "output_kib": len(text.encode("utf-8")) / 1024,
+    }
+
+def benchmark_import(args) -> Dict[str, float]:
+    return {label: measure_import(statement, args.import_repeat) for label, statement in SCENARIOS.items()}
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency", type=float, default=0.05, help="Simulated API round trip, in seconds.")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Maximum random latency added per API call, in seconds.")
+    parser.add_argument("--results", type=int, default=10, help="Results per query.")
+    parser.add_argument("--pages", type=int, default=5, help="Text pages per content.")
+    parser.add_argument("--requests", type=int, default=200, help="Async requests per tool.")
+    parser.add_argument("--concurrency", type=int, default=20, help="Concurrent async requests per tool.")
+    parser.add_argument("--sync-requests", type=int, default=20, help="Sequential sync requests per tool.")
+    parser.add_argument("--feed-requests", type=int, default=20, help="Async requests per feed tool.")
+    parser.add_argument("--feed-sync-requests", type=int, default=2, help="Sequential sync requests per feed tool.")
+    parser.add_argument("--feeds", type=int, default=100, help="Concurrently pending feeds in the feed notifier benchmark.")
+    parser.add_argument("--feed-polls", type=int, default=3, help="Status checks before each feed reports done, in the feed notifier benchmark.")
+    parser.add_argument("--feed-interval", type=float, default=0.1, help="Seconds between status checks, in the feed notifier benchmark.")
+    parser.add_argument("--import-repeat", type=int, default=3, help="Fresh interpreters per import scenario, or 0 to skip.")
+    parser.add_argument("--fixtures", default=None, help="Path of a recorded fixture file to replay, rather than using the stub client.")
+    parser.add_argument("--speed", type=float, default=None, help="Replay speed relative to the recorded latency. Defaults to no delay.")
+    parser.add_argument("--output", default=None, help="Path of the JSON results file. Defaults to stdout.")
+    args = parser.parse_args()
+
+    for name, value in FEED_ENVIRONMENT.items():
+        os.environ.setdefault(name, value)
+
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = os.path.join(directory, "report.txt")
+
+        with open(file_path, "w", encoding="utf-8") as file:
+            file.write(TEXT)
+
+        report = {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "parameters": vars(args),
+            "tools": asyncio.run(benchmark_tools(args, file_path)),
+            "feed_notifier": asyncio.run(benchmark_feed_notifier(args)),
+            "format_content": benchmark_format(args),
+        }
+
+        for name, summary in benchmark_tools_sync(args, file_path).items():
+            report["tools"][name]["run"] = summary
+
+    if args.import_repeat > 0:
+        report["import_ms"] = benchmark_import(args)
+
+    output = json.dumps(report, indent=2)
+
+    if args.output is not None:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(output)
+    else:
+        print(output)
+
+if __name__ == "__main__":
+    main()
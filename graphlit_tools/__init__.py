@@ -1,37 +1,138 @@
-from .base_tool import BaseTool
-from .crewai_converter import CrewAIConverter
-from .griptape_converter import GriptapeConverter
-from .exceptions import ToolException
-from .retrieval.content_retrieval_tool import ContentRetrievalTool
-from .retrieval.person_retrieval_tool import PersonRetrievalTool
-from .retrieval.organization_retrieval_tool import OrganizationRetrievalTool
-from .extraction.extract_text_tool import ExtractTextTool
-from .extraction.extract_url_tool import ExtractURLTool
-from .extraction.extract_web_page_tool import ExtractWebPageTool
-from .generation.prompt_tool import PromptTool, PromptToolInput
-from .generation.describe_image_tool import DescribeImageTool
-from .generation.describe_web_page_tool import DescribeWebPageTool
-from .generation.generate_summary_tool import GenerateSummaryTool
-from .generation.generate_bullets_tool import GenerateBulletsTool
-from .generation.generate_headlines_tool import GenerateHeadlinesTool
-from .generation.generate_social_media_posts_tool import GenerateSocialMediaPostsTool
-from .generation.generate_questions_tool import GenerateQuestionsTool
-from .generation.generate_keywords_tool import GenerateKeywordsTool
-from .generation.generate_chapters_tool import GenerateChaptersTool
-from .ingestion.url_ingest_tool import URLIngestTool
-from .ingestion.local_ingest_tool import LocalIngestTool
-from .ingestion.web_scrape_tool import WebScrapeTool
-from .ingestion.web_crawl_tool import WebCrawlTool
-from .ingestion.web_search_tool import WebSearchTool
-from .ingestion.web_map_tool import WebMapTool
-from .ingestion.reddit_ingest_tool import RedditIngestTool
-from .ingestion.notion_ingest_tool import NotionIngestTool
-from .ingestion.microsoft_email_ingest_tool import MicrosoftEmailIngestTool
-from .ingestion.google_email_ingest_tool import GoogleEmailIngestTool
-from .ingestion.github_issue_ingest_tool import GitHubIssueIngestTool
-from .ingestion.jira_issue_ingest_tool import JiraIssueIngestTool
-from .ingestion.linear_issue_ingest_tool import LinearIssueIngestTool
-from .ingestion.microsoft_teams_ingest_tool import MicrosoftTeamsIngestTool
-from .ingestion.discord_ingest_tool import DiscordIngestTool
-from .ingestion.slack_ingest_tool import SlackIngestTool
-from .ingestion.rss_ingest_tool import RSSIngestTool
+"""
+Graphlit agent tools.
+
+Tools and converters are imported lazily on first access (PEP 562), so importing one tool
+doesn't pay for importing every tool module and optional agent framework.
+"""
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+_exports = {
+    "BaseTool": ".base_tool",
+    "export_tools": ".base_tool",
+    "CrewAIConverter": ".crewai_converter",
+    "GriptapeConverter": ".griptape_converter",
+    "LangChainConverter": ".langchain_converter",
+    "AutoGenConverter": ".autogen_converter",
+    "MCPServer": ".mcp_server",
+    "ToolClient": ".serve",
+    "RemoteTool": ".serve",
+    "Recorder": ".replay",
+    "Replayer": ".replay",
+    "replay_graphlit": ".replay",
+    "FeedNotifier": ".feeds",
+    "FeedWebhookReceiver": ".feeds",
+    "wait_for_feed": ".feeds",
+    "ToolException": ".exceptions",
+    "ResultCache": ".cache",
+    "QueryIndex": ".queries",
+    "Reranker": ".rerank",
+    "HashingEmbedder": ".rerank",
+    "ContentResult": ".results",
+    "PersonResult": ".results",
+    "OrganizationResult": ".results",
+    "render_markdown": ".results",
+    "ContentRetrievalTool": ".retrieval.content_retrieval_tool",
+    "PersonRetrievalTool": ".retrieval.person_retrieval_tool",
+    "OrganizationRetrievalTool": ".retrieval.organization_retrieval_tool",
+    "ExtractTextTool": ".extraction.extract_text_tool",
+    "ExtractURLTool": ".extraction.extract_url_tool",
+    "ExtractWebPageTool": ".extraction.extract_web_page_tool",
+    "PromptTool": ".generation.prompt_tool",
+    "PromptToolInput": ".generation.prompt_tool",
+    "DescribeImageTool": ".generation.describe_image_tool",
+    "DescribeWebPageTool": ".generation.describe_web_page_tool",
+    "GenerateSummaryTool": ".generation.generate_summary_tool",
+    "GenerateBulletsTool": ".generation.generate_bullets_tool",
+    "GenerateHeadlinesTool": ".generation.generate_headlines_tool",
+    "GenerateSocialMediaPostsTool": ".generation.generate_social_media_posts_tool",
+    "GenerateQuestionsTool": ".generation.generate_questions_tool",
+    "GenerateKeywordsTool": ".generation.generate_keywords_tool",
+    "GenerateChaptersTool": ".generation.generate_chapters_tool",
+    "URLIngestTool": ".ingestion.url_ingest_tool",
+    "LocalIngestTool": ".ingestion.local_ingest_tool",
+    "WebScrapeTool": ".ingestion.web_scrape_tool",
+    "WebCrawlTool": ".ingestion.web_crawl_tool",
+    "TargetedCrawlTool": ".ingestion.targeted_crawl_tool",
+    "WebSearchTool": ".ingestion.web_search_tool",
+    "WebMapTool": ".ingestion.web_map_tool",
+    "RedditIngestTool": ".ingestion.reddit_ingest_tool",
+    "NotionIngestTool": ".ingestion.notion_ingest_tool",
+    "MicrosoftEmailIngestTool": ".ingestion.microsoft_email_ingest_tool",
+    "GoogleEmailIngestTool": ".ingestion.google_email_ingest_tool",
+    "GitHubIssueIngestTool": ".ingestion.github_issue_ingest_tool",
+    "JiraIssueIngestTool": ".ingestion.jira_issue_ingest_tool",
+    "LinearIssueIngestTool": ".ingestion.linear_issue_ingest_tool",
+    "MicrosoftTeamsIngestTool": ".ingestion.microsoft_teams_ingest_tool",
+    "DiscordIngestTool": ".ingestion.discord_ingest_tool",
+    "SlackIngestTool": ".ingestion.slack_ingest_tool",
+    "RSSIngestTool": ".ingestion.rss_ingest_tool",
+}
+
+__all__ = list(_exports)
+
+def __getattr__(name: str) -> Any:
+    module_name = _exports.get(name)
+
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+
+    # NOTE: cache on the package, so later lookups bypass __getattr__
+    globals()[name] = value
+
+    return value
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
+if TYPE_CHECKING:
+    from .base_tool import BaseTool, export_tools
+    from .crewai_converter import CrewAIConverter
+    from .griptape_converter import GriptapeConverter
+    from .langchain_converter import LangChainConverter
+    from .autogen_converter import AutoGenConverter
+    from .mcp_server import MCPServer
+    from .serve import ToolClient, RemoteTool
+    from .replay import Recorder, Replayer, replay_graphlit
+    from .feeds import FeedNotifier, FeedWebhookReceiver, wait_for_feed
+    from .exceptions import ToolException
+    from .cache import ResultCache
+    from .queries import QueryIndex
+    from .rerank import Reranker, HashingEmbedder
+    from .results import ContentResult, PersonResult, OrganizationResult, render_markdown
+    from .retrieval.content_retrieval_tool import ContentRetrievalTool
+    from .retrieval.person_retrieval_tool import PersonRetrievalTool
+    from .retrieval.organization_retrieval_tool import OrganizationRetrievalTool
+    from .extraction.extract_text_tool import ExtractTextTool
+    from .extraction.extract_url_tool import ExtractURLTool
+    from .extraction.extract_web_page_tool import ExtractWebPageTool
+    from .generation.prompt_tool import PromptTool, PromptToolInput
+    from .generation.describe_image_tool import DescribeImageTool
+    from .generation.describe_web_page_tool import DescribeWebPageTool
+    from .generation.generate_summary_tool import GenerateSummaryTool
+    from .generation.generate_bullets_tool import GenerateBulletsTool
+    from .generation.generate_headlines_tool import GenerateHeadlinesTool
+    from .generation.generate_social_media_posts_tool import GenerateSocialMediaPostsTool
+    from .generation.generate_questions_tool import GenerateQuestionsTool
+    from .generation.generate_keywords_tool import GenerateKeywordsTool
+    from .generation.generate_chapters_tool import GenerateChaptersTool
+    from .ingestion.url_ingest_tool import URLIngestTool
+    from .ingestion.local_ingest_tool import LocalIngestTool
+    from .ingestion.web_scrape_tool import WebScrapeTool
+    from .ingestion.web_crawl_tool import WebCrawlTool
+    from .ingestion.targeted_crawl_tool import TargetedCrawlTool
+    from .ingestion.web_search_tool import WebSearchTool
+    from .ingestion.web_map_tool import WebMapTool
+    from .ingestion.reddit_ingest_tool import RedditIngestTool
+    from .ingestion.notion_ingest_tool import NotionIngestTool
+    from .ingestion.microsoft_email_ingest_tool import MicrosoftEmailIngestTool
+    from .ingestion.google_email_ingest_tool import GoogleEmailIngestTool
+    from .ingestion.github_issue_ingest_tool import GitHubIssueIngestTool
+    from .ingestion.jira_issue_ingest_tool import JiraIssueIngestTool
+    from .ingestion.linear_issue_ingest_tool import LinearIssueIngestTool
+    from .ingestion.microsoft_teams_ingest_tool import MicrosoftTeamsIngestTool
+    from .ingestion.discord_ingest_tool import DiscordIngestTool
+    from .ingestion.slack_ingest_tool import SlackIngestTool
+    from .ingestion.rss_ingest_tool import RSSIngestTool
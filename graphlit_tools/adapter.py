@@ -0,0 +1,103 @@
+from typing import Any, Dict, List, Optional, Union
+import pydantic_core
+from pydantic import BaseModel
+
+from .base_tool import BaseTool
+from . import helpers
+
+def parse_arguments(tool: BaseTool, arguments: Optional[Union[Dict[str, Any], BaseModel]] = None) -> Dict[str, Any]:
+    """
+    Validates tool call arguments against the tool's arguments schema.
+
+    Args:
+        tool (BaseTool): The tool to be called.
+        arguments (Optional[Union[Dict[str, Any], BaseModel]]): The arguments, as a JSON object or an arguments schema instance.
+
+    Returns:
+        Dict[str, Any]: The validated keyword arguments for the tool.
+    """
+    if not isinstance(arguments, tool.args_schema):
+        arguments = tool.args_schema.model_validate(arguments or {})
+
+    # NOTE: shallow conversion, so enums and nested models are passed through as-is
+    return dict(arguments)
+
+def format_result(result: Any) -> str:
+    """
+    Formats a tool result as text, for agent frameworks which expect string results.
+
+    Args:
+        result (Any): The tool result, as text, structured results or any other value.
+
+    Returns:
+        str: The result text.
+    """
+    if result is None:
+        return ""
+
+    if isinstance(result, str):
+        return result
+
+    if isinstance(result, list) and all(hasattr(item, "to_markdown") for item in result):
+        return "\n".join(item.to_markdown() for item in result)
+
+    # NOTE: models, dataclasses and lists of them are serialized as JSON, rather than their Python repr
+    return pydantic_core.to_json(result, fallback=str).decode()
+
+async def ainvoke(tool: BaseTool, arguments: Optional[Union[Dict[str, Any], BaseModel]] = None) -> Any:
+    """
+    Calls a tool with validated arguments, using its async path.
+
+    Args:
+        tool (BaseTool): The tool to be called.
+        arguments (Optional[Union[Dict[str, Any], BaseModel]]): The arguments, as a JSON object or an arguments schema instance.
+
+    Returns:
+        Any: The tool result.
+    """
+    return await tool.arun(**parse_arguments(tool, arguments))
+
+def invoke(tool: BaseTool, arguments: Optional[Union[Dict[str, Any], BaseModel]] = None) -> Any:
+    return helpers.run_async(ainvoke, tool, arguments)
+
+def default_tools(graphlit: Optional[Any] = None) -> List[BaseTool]:
+    """
+    Creates every tool which needs no configuration beyond a Graphlit client.
+
+    Extraction tools are excluded, since they require a model schema.
+
+    Args:
+        graphlit (Optional[Graphlit]): An optional Graphlit instance shared by all tools.
+            If not provided, a new Graphlit instance will be created.
+
+    Returns:
+        List[BaseTool]: The tools.
+    """
+    # NOTE: imported on first use, so importing the adapter doesn't import the Graphlit client and every tool
+    from graphlit import Graphlit # pylint: disable=import-outside-toplevel
+
+    from . import ( # pylint: disable=import-outside-toplevel
+        ContentRetrievalTool, PersonRetrievalTool, OrganizationRetrievalTool,
+        PromptTool, DescribeImageTool, DescribeWebPageTool,
+        GenerateSummaryTool, GenerateBulletsTool, GenerateHeadlinesTool, GenerateSocialMediaPostsTool,
+        GenerateQuestionsTool, GenerateKeywordsTool, GenerateChaptersTool,
+        URLIngestTool, LocalIngestTool, WebScrapeTool, WebCrawlTool, TargetedCrawlTool, WebSearchTool, WebMapTool,
+        RedditIngestTool, NotionIngestTool, MicrosoftEmailIngestTool, GoogleEmailIngestTool,
+        GitHubIssueIngestTool, JiraIssueIngestTool, LinearIssueIngestTool, MicrosoftTeamsIngestTool,
+        DiscordIngestTool, SlackIngestTool, RSSIngestTool
+    )
+
+    graphlit = graphlit or Graphlit()
+
+    tool_classes = [
+        ContentRetrievalTool, PersonRetrievalTool, OrganizationRetrievalTool,
+        PromptTool, DescribeImageTool, DescribeWebPageTool,
+        GenerateSummaryTool, GenerateBulletsTool, GenerateHeadlinesTool, GenerateSocialMediaPostsTool,
+        GenerateQuestionsTool, GenerateKeywordsTool, GenerateChaptersTool,
+        URLIngestTool, LocalIngestTool, WebScrapeTool, WebCrawlTool, TargetedCrawlTool, WebSearchTool, WebMapTool,
+        RedditIngestTool, NotionIngestTool, MicrosoftEmailIngestTool, GoogleEmailIngestTool,
+        GitHubIssueIngestTool, JiraIssueIngestTool, LinearIssueIngestTool, MicrosoftTeamsIngestTool,
+        DiscordIngestTool, SlackIngestTool, RSSIngestTool
+    ]
+
+    return [tool_class(graphlit) for tool_class in tool_classes]
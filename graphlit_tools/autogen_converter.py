@@ -0,0 +1,58 @@
+import asyncio
+from typing import Any, cast
+from pydantic import BaseModel
+from .base_tool import BaseTool
+from . import adapter
+
+AutoGenBaseTool: Any = None
+
+try:
+    from autogen_core import CancellationToken
+    from autogen_core.tools import BaseTool as AutoGenBaseTool
+except ImportError:
+    AutoGenBaseTool = None
+
+if AutoGenBaseTool:
+    class AutoGenConverter(AutoGenBaseTool):
+        """Tool to convert Graphlit tools into AutoGen tools."""
+
+        def __init__(self, graphlit_tool: BaseTool, **kwargs: Any):
+            super().__init__(
+                args_type=graphlit_tool.args_schema,
+                return_type=str,
+                name=graphlit_tool.function_name,
+                description=graphlit_tool.description,
+                **kwargs,
+            )
+
+            self.graphlit_tool = graphlit_tool
+
+        async def run(self, args: BaseModel, cancellation_token: CancellationToken) -> str:
+            call = asyncio.ensure_future(adapter.ainvoke(self.graphlit_tool, args))
+
+            # NOTE: cancelling the token cancels the tool call in flight
+            cancellation_token.link_future(call)
+
+            return adapter.format_result(await call)
+
+        @classmethod
+        def from_tool(cls, tool: Any, **kwargs: Any) -> "AutoGenConverter":
+            if not isinstance(tool, BaseTool):
+                raise ValueError(f"Expected a Graphlit tool, got {type(tool)}")
+
+            tool = cast(BaseTool, tool)
+
+            if tool.args_schema is None:
+                raise ValueError("Invalid arguments JSON schema.")
+
+            return cls(tool, **kwargs)
+else:
+    class AutoGenConverter:
+        """Fallback AutoGenConverter if autogen-core is not installed."""
+
+        @classmethod
+        def from_tool(cls, tool: Any, **kwargs: Any) -> "AutoGenConverter":
+            raise ImportError(
+                "AutoGenConverter requires the autogen-core package. "
+                "Install it using pip install graphlit-tools[autogen]."
+            )
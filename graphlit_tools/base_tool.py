@@ -1,7 +1,53 @@
+import copy
+import re
 from abc import abstractmethod
-from typing import Any, Type, Dict
+from functools import lru_cache
+from typing import Any, Type, Dict, Iterable, List
 from pydantic import BaseModel
 
+TOOL_FORMATS = ("openai", "anthropic", "mcp")
+
+@lru_cache(maxsize=None)
+def _cached_json_schema(args_schema: Type[BaseModel]) -> Dict[str, Any]:
+    return args_schema.model_json_schema()
+
+def _json_schema(args_schema: Type[BaseModel]) -> Dict[str, Any]:
+    # NOTE: schema generation is cached, but callers get their own copy, since they often amend the schema
+    return copy.deepcopy(_cached_json_schema(args_schema))
+
+@lru_cache(maxsize=None)
+def _function_name(name: str) -> str:
+    # NOTE: LLM tool names only allow letters, digits, underscores and hyphens
+    return re.sub(r"[^a-zA-Z0-9_-]+", "_", name).strip("_").lower()[:64]
+
+def _tool_definition(args_schema: Type[BaseModel], name: str, description: str, tool_format: str) -> Dict[str, Any]:
+    schema = _json_schema(args_schema)
+
+    if tool_format == "openai":
+        return {
+            "name": name,
+            "description": description,
+            "parameters": schema
+        }
+
+    function_name = _function_name(name)
+
+    if tool_format == "anthropic":
+        return {
+            "name": function_name,
+            "description": description,
+            "input_schema": schema
+        }
+
+    if tool_format == "mcp":
+        return {
+            "name": function_name,
+            "description": description,
+            "inputSchema": schema
+        }
+
+    raise ValueError(f"Unsupported tool format [{tool_format}], expected one of {TOOL_FORMATS}.")
+
 class BaseTool(BaseModel):
     """
     Abstract base class for tools.
@@ -89,8 +135,25 @@ class BaseTool(BaseModel):
 
     @property
     def json_schema(self) -> Dict[str, Any]:
-        """Get the tool's JSON schema."""
-        return self.args_schema.model_json_schema()
+        """Get the tool's JSON schema, which is generated once per arguments schema, and copied per call."""
+        return _json_schema(self.args_schema)
+
+    @property
+    def function_name(self) -> str:
+        """Get the tool's name, restricted to the characters allowed in LLM tool calling, i.e. graphlit_web_search_tool."""
+        return _function_name(self.name)
+
+    def to_tool(self, tool_format: str) -> Dict[str, Any]:
+        """
+        Creates a tool definition in the given format, from the cached JSON schema.
+
+        Args:
+            tool_format (str): The tool format: openai, anthropic or mcp.
+
+        Returns:
+            dict: The tool definition.
+        """
+        return _tool_definition(self.args_schema, self.name, self.description, tool_format)
 
     def to_openai_tool(self) -> Dict[str, Any]:
         """
@@ -99,8 +162,37 @@ class BaseTool(BaseModel):
         Returns:
             dict: The tool definition for OpenAI.
         """
-        return {
-            "name": self.name,
-            "description": self.description,
-            "parameters": self.json_schema
-        }
+        return self.to_tool("openai")
+
+    def to_anthropic_tool(self) -> Dict[str, Any]:
+        """
+        Creates a tool definition compatible with Anthropic tool use.
+
+        Returns:
+            dict: The tool definition for Anthropic.
+        """
+        return self.to_tool("anthropic")
+
+    def to_mcp_tool(self) -> Dict[str, Any]:
+        """
+        Creates a tool definition compatible with the Model Context Protocol (MCP) tools list.
+
+        Returns:
+            dict: The tool definition for MCP.
+        """
+        return self.to_tool("mcp")
+
+def export_tools(tools: Iterable[BaseTool], tool_format: str = "openai") -> List[Dict[str, Any]]:
+    """
+    Exports tool definitions for many tools at once.
+
+    JSON schemas are generated once per arguments schema, so exporting the same tools again only copies them.
+
+    Args:
+        tools (Iterable[BaseTool]): The tools to be exported.
+        tool_format (str): The tool format: openai, anthropic or mcp. Defaults to openai.
+
+    Returns:
+        List[Dict[str, Any]]: The tool definitions.
+    """
+    return [tool.to_tool(tool_format) for tool in tools]
@@ -1,5 +1,6 @@
 from typing import Any, cast
 from .base_tool import BaseTool
+from . import adapter
 
 CrewAIBaseTool: Any = None
 
@@ -16,21 +17,19 @@ if CrewAIBaseTool:
 
         def _run(
             self,
-            *args: Any,
             **kwargs: Any,
         ) -> Any:
             tool = cast(BaseTool, self.graphlit_tool)
 
-            return tool.run(*args, **kwargs)
+            return adapter.format_result(adapter.invoke(tool, kwargs))
 
         async def _arun(
             self,
-            *args: Any,
             **kwargs: Any,
         ) -> Any:
             tool = cast(BaseTool, self.graphlit_tool)
 
-            return await tool.arun(*args, **kwargs)
+            return adapter.format_result(await adapter.ainvoke(tool, kwargs))
 
         @classmethod
         def from_tool(cls, tool: Any, **kwargs: Any) -> "CrewAIConverter":
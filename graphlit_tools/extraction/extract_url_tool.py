@@ -1,6 +1,6 @@
 import logging
 import json
-from typing import Optional, Type
+from typing import Optional, Type, List, Union
 
 from graphlit import Graphlit
 from graphlit_api import exceptions, input_types, enums
@@ -14,7 +14,7 @@ logger = logging.getLogger(__name__)
 
 class ExtractURLInput(BaseModel):
     url: str = Field(description="URL of cloud-hosted file to be ingested into knowledge base")
-    model_schema: str = Field(description="Pydantic model JSON schema which describes the data which will be extracted. JSON schema needs be of type 'object' and include 'properties' and 'required' fields.")
+    model_schema: Optional[str] = Field(description="Pydantic model JSON schema which describes the data which will be extracted. JSON schema needs be of type 'object' and include 'properties' and 'required' fields. Optional if the tool was configured with an output model.", default=None)
     prompt: Optional[str] = Field(description="Text prompt which is provided to LLM to guide data extraction, optional.", default=None)
 
 class ExtractURLTool(BaseTool):
@@ -30,11 +30,15 @@ class ExtractURLTool(BaseTool):
     specification_id: Optional[str] = Field(None, exclude=True)
     correlation_id: Optional[str] = Field(None, exclude=True)
 
+    output_model: Optional[Type[BaseModel]] = Field(None, exclude=True)
+    json_lines: bool = Field(False, exclude=True)
+
     model_config = {
         "arbitrary_types_allowed": True
     }
 
-    def __init__(self, graphlit: Optional[Graphlit] = None, workflow_id: Optional[str] = None, specification_id: Optional[str] = None, correlation_id: Optional[str] = None, **kwargs):
+    def __init__(self, graphlit: Optional[Graphlit] = None, workflow_id: Optional[str] = None, specification_id: Optional[str] = None, correlation_id: Optional[str] = None,
+                 output_model: Optional[Type[BaseModel]] = None, json_lines: bool = False, **kwargs):
         """
         Initializes the ExtractURLTool.
 
@@ -44,6 +48,10 @@ class ExtractURLTool(BaseTool):
             workflow_id (Optional[str]): ID for the workflow to use when ingesting files. Defaults to None.
             specification_id (Optional[str]): ID for the LLM specification to use. Defaults to None.
             correlation_id (Optional[str]): Correlation ID for tracking requests. Defaults to None.
+            output_model (Optional[Type[BaseModel]]): Pydantic model class to validate extracted data into.
+                If provided, the tool returns model instances rather than a JSON string, and always extracts with the
+                model's JSON schema, ignoring any model_schema passed to the tool. Defaults to None.
+            json_lines (bool): Whether to return compact JSON Lines, one extraction per line. Defaults to False.
             **kwargs: Additional keyword arguments for the BaseTool superclass.
         """
         super().__init__(**kwargs)
@@ -51,8 +59,16 @@ class ExtractURLTool(BaseTool):
         self.workflow_id = workflow_id
         self.specification_id = specification_id
         self.correlation_id = correlation_id
+        self.output_model = output_model
+        self.json_lines = json_lines
+
+    async def _arun(self, url: str, model_schema: Optional[str] = None, prompt: Optional[str] = None) -> Optional[Union[str, List[BaseModel]]]:
+        # NOTE: always extract with the output model's schema, since extractions are validated into the output model
+        if self.output_model is not None:
+            model_schema = json.dumps(self.output_model.model_json_schema())
+        elif model_schema is None:
+            raise ToolException('Invalid model JSON schema.')
 
-    async def _arun(self, url: str, model_schema: str, prompt: Optional[str] = None) -> Optional[str]:
         content_id = None
 
         try:
@@ -112,11 +128,7 @@ class ExtractURLTool(BaseTool):
             if response.extract_text is None:
                 raise ToolException('Failed to extract text.')
 
-            extractions = response.extract_text
-
-            json_array = json.loads('[' + ','.join(extraction.value for extraction in extractions) + ']')
-
-            return json.dumps(json_array, indent=4)
+            return helpers.format_extractions(response.extract_text, self.output_model, self.json_lines)
         except exceptions.GraphQLClientError as e:
             logger.error(str(e))
             print(str(e))
@@ -126,5 +138,5 @@ class ExtractURLTool(BaseTool):
             print(str(e))
             raise ToolException(str(e)) from e
 
-    def _run(self, url: str, model_schema: str, prompt: Optional[str] = None) -> Optional[str]:
+    def _run(self, url: str, model_schema: Optional[str] = None, prompt: Optional[str] = None) -> Optional[Union[str, List[BaseModel]]]:
         return helpers.run_async(self._arun, url, model_schema, prompt)
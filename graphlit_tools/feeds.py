@@ -0,0 +1,429 @@
+"""
+Feed completion notifications, shared by all pending feeds on an event loop.
+
+Feeds are checked with adaptive polling, starting soon after creation and backing off while a feed is still running.
+Due feeds are checked together once per tick, with a bounded number of status calls, so polling cost doesn't grow with the number of feeds.
+A webhook receiver can push feed events, which trigger an immediate status check, and relax polling to a safety net.
+"""
+import asyncio
+import json
+import logging
+import weakref
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from . import helpers
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class _PendingFeed:
+    client: Any
+    future: asyncio.Future
+    interval: float
+    next_poll: float
+    waiters: int = 0
+
+# NOTE: the polling settings are public attributes, which can be tuned on the shared notifier
+class FeedNotifier: # pylint: disable=too-many-instance-attributes
+    """
+    Notifies waiters when feeds are done, with one polling task for all pending feeds.
+
+    Once per tick, the most overdue feeds are checked together, up to the batch size. Feeds beyond the batch size
+    are checked on following ticks.
+
+    Args:
+        min_interval (float): Seconds before the first status check, and between early checks. Defaults to 1.
+        max_interval (float): Maximum seconds between status checks of a feed. Defaults to 10.
+        backoff (float): Factor by which the interval grows after each check of a running feed. Defaults to 1.5.
+        tick (float): Minimum seconds between rounds of status checks, unless poked. Defaults to 1.
+        batch_size (int): Maximum number of status checks per tick. Defaults to 10.
+        concurrency (int): Maximum number of concurrent status calls within a tick. Defaults to 8.
+    """
+    def __init__(self, min_interval: float = 1.0, max_interval: float = 10.0, backoff: float = 1.5,
+                 tick: float = 1.0, batch_size: int = 10, concurrency: int = 8):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.tick = tick
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+
+        # NOTE: set by a webhook receiver, in which case polling is only a safety net for missed events
+        self.push_enabled = False
+
+        self.polls = 0
+
+        self._pending: Dict[str, _PendingFeed] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    async def wait(self, client: Any, feed_id: str, timeout: Optional[float] = None) -> Optional[bool]:
+        """
+        Waits for a feed to be done.
+
+        Args:
+            client: The Graphlit API client, i.e. graphlit.client.
+            feed_id (str): The feed ID.
+            timeout (Optional[float]): Maximum seconds to wait. Defaults to None, to wait until done.
+
+        Returns:
+            Optional[bool]: True once the feed is done, or None if its status is unavailable.
+        """
+        loop = asyncio.get_running_loop()
+
+        pending = self._pending.get(feed_id)
+
+        if pending is None:
+            interval = self.max_interval if self.push_enabled else self.min_interval
+
+            pending = _PendingFeed(client, loop.create_future(), interval, loop.time() + interval)
+
+            self._pending[feed_id] = pending
+
+            self._schedule()
+
+        pending.waiters += 1
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(pending.future), timeout)
+        finally:
+            pending.waiters -= 1
+
+            # NOTE: stop checking feeds nobody is waiting for, i.e. after a timeout or cancellation
+            if pending.waiters == 0 and self._pending.get(feed_id) is pending:
+                del self._pending[feed_id]
+
+    def notify(self, feed_id: str, done: Optional[bool] = True):
+        """
+        Notifies waiters that a feed is done, without checking its status.
+
+        Args:
+            feed_id (str): The feed ID.
+            done (Optional[bool]): The result returned to waiters. Defaults to True.
+        """
+        pending = self._pending.pop(feed_id, None)
+
+        if pending is not None and not pending.future.done():
+            pending.future.set_result(done)
+
+    def poke(self, feed_id: str):
+        """
+        Checks a feed's status as soon as possible, i.e. after a webhook event for the feed.
+
+        Args:
+            feed_id (str): The feed ID.
+        """
+        pending = self._pending.get(feed_id)
+
+        if pending is None:
+            return
+
+        pending.next_poll = 0
+
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _schedule(self):
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        else:
+            self._wakeup.set()
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+
+        while self._pending:
+            now = loop.time()
+
+            # NOTE: most overdue first, so feeds beyond the batch size are checked on the next tick
+            due = sorted(
+                ((pending.next_poll, feed_id) for feed_id, pending in self._pending.items() if pending.next_poll <= now)
+            )[:self.batch_size]
+
+            if due:
+                await self._poll([feed_id for _, feed_id in due])
+
+            if not self._pending:
+                break
+
+            delay = max(0.0, min(pending.next_poll for pending in self._pending.values()) - loop.time())
+
+            if due:
+                delay = max(delay, now + self.tick - loop.time())
+
+            self._wakeup.clear()
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _poll(self, feed_ids: List[str]):
+        loop = asyncio.get_running_loop()
+
+        batches: Dict[int, Tuple[Any, List[str]]] = {}
+
+        # NOTE: group by client, since tools may use different Graphlit projects
+        for feed_id in feed_ids:
+            client = self._pending[feed_id].client
+
+            batches.setdefault(id(client), (client, []))[1].append(feed_id)
+
+        statuses: Dict[str, Any] = {}
+
+        for results in await asyncio.gather(*(helpers.are_feeds_done(client, ids, self.concurrency) for client, ids in batches.values())):
+            statuses.update(results)
+
+        self.polls += len(feed_ids)
+
+        for feed_id, response in statuses.items():
+            pending = self._pending.get(feed_id)
+
+            if pending is None:
+                continue
+
+            if isinstance(response, BaseException):
+                del self._pending[feed_id]
+
+                if not pending.future.done():
+                    pending.future.set_exception(response)
+            elif response is None or response:
+                del self._pending[feed_id]
+
+                if not pending.future.done():
+                    pending.future.set_result(response)
+            else:
+                pending.interval = self.max_interval if self.push_enabled else min(pending.interval * self.backoff, self.max_interval)
+                pending.next_poll = loop.time() + pending.interval
+
+_notifiers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, FeedNotifier]" = weakref.WeakKeyDictionary()
+
+def get_feed_notifier() -> FeedNotifier:
+    """
+    Gets the feed notifier shared by all tools on the running event loop.
+
+    Returns:
+        FeedNotifier: The shared feed notifier.
+    """
+    loop = asyncio.get_running_loop()
+
+    notifier = _notifiers.get(loop)
+
+    if notifier is None:
+        notifier = _notifiers[loop] = FeedNotifier()
+
+    return notifier
+
+async def wait_for_feed(client: Any, feed_id: str, timeout: Optional[float] = None, notifier: Optional[FeedNotifier] = None) -> Optional[bool]:
+    """
+    Waits for a feed to be done, using the shared feed notifier.
+
+    Args:
+        client: The Graphlit API client, i.e. graphlit.client.
+        feed_id (str): The feed ID.
+        timeout (Optional[float]): Maximum seconds to wait. Defaults to None, to wait until done.
+        notifier (Optional[FeedNotifier]): An optional feed notifier. Defaults to the shared feed notifier.
+
+    Returns:
+        Optional[bool]: True once the feed is done, or None if its status is unavailable.
+    """
+    notifier = notifier or get_feed_notifier()
+
+    return await notifier.wait(client, feed_id, timeout)
+
+async def stream_feed_contents(client: Any, feed_id: str, search: Optional[str] = None, interval: float = 5.0,
+                               notifier: Optional[FeedNotifier] = None, page_size: int = 100) -> AsyncIterator[Any]:
+    """
+    Yields the contents of a feed as they finish ingesting, rather than once the feed is done.
+
+    While the feed is running, newly finished contents are queried every interval, paging forward from the creation date
+    of the last content yielded. Once the feed is done, its finished contents are paged through by offset one last time,
+    since contents created before the cursor may have finished since.
+
+    Args:
+        client: The Graphlit API client, i.e. graphlit.client.
+        feed_id (str): The feed ID.
+        search (Optional[str]): Optional text to search for within the feed contents.
+        interval (float): Seconds between queries for newly finished contents. Defaults to 5.
+        notifier (Optional[FeedNotifier]): An optional feed notifier. Defaults to the shared feed notifier.
+        page_size (int): Maximum number of contents per query. Defaults to 100.
+
+    Yields:
+        The contents, in order of creation within each query.
+    """
+    seen: Dict[str, None] = {}
+
+    cursor = None
+
+    done = asyncio.ensure_future(wait_for_feed(client, feed_id, notifier=notifier))
+
+    try:
+        while True:
+            # NOTE: check before querying, so the last query after the feed is done sees every content
+            finished = done.done()
+
+            offset = 0
+
+            while True:
+                contents = await helpers.query_finished_contents(client, feed_id, None if finished else cursor, search, page_size, offset)
+
+                new_contents = [content for content in contents if content.id not in seen]
+
+                for content in new_contents:
+                    seen[content.id] = None
+
+                    yield content
+
+                # NOTE: the cursor is inclusive, so contents created at the same time as the last content aren't skipped
+                if not finished and contents:
+                    cursor = contents[-1].creation_date
+
+                if len(contents) < page_size:
+                    break
+
+                if finished:
+                    offset += len(contents)
+                elif not new_contents:
+                    # NOTE: a full page of contents created at the cursor's time, which the last query picks up
+                    break
+
+            if finished:
+                # NOTE: raises the feed status error, if any
+                done.result()
+
+                break
+
+            await asyncio.wait({done}, timeout=interval)
+    finally:
+        if not done.done():
+            done.cancel()
+
+def feed_id_from_event(event: Any) -> Optional[str]:
+    """
+    Gets the feed ID from a webhook event, i.e. {"feed": {"id": "..."}} or {"feedId": "..."}.
+
+    Args:
+        event (Any): The webhook event JSON.
+
+    Returns:
+        Optional[str]: The feed ID, or None if the event isn't about a feed.
+    """
+    if not isinstance(event, dict):
+        return None
+
+    feed = event.get("feed")
+
+    if isinstance(feed, dict) and feed.get("id") is not None:
+        return str(feed["id"])
+
+    if event.get("feedId") is not None:
+        return str(event["feedId"])
+
+    return None
+
+class FeedWebhookReceiver:
+    """
+    Minimal HTTP receiver for feed webhook events, which triggers immediate status checks of pending feeds.
+
+    Point a Graphlit workflow webhook action, or any other event source, at the receiver's URL.
+    Also useful as a local stand-in for push notifications in tests.
+
+    Args:
+        notifier (Optional[FeedNotifier]): The feed notifier to be poked. Defaults to the shared feed notifier, when started.
+        host (str): The host to listen on. Defaults to 127.0.0.1.
+        port (int): The port to listen on. Defaults to 0, for any free port.
+        event_parser (Callable[[Any], Optional[str]]): Gets the feed ID from an event. Defaults to feed_id_from_event.
+    """
+    def __init__(self, notifier: Optional[FeedNotifier] = None, host: str = "127.0.0.1", port: int = 0,
+                 event_parser: Callable[[Any], Optional[str]] = feed_id_from_event):
+        self.notifier = notifier
+        self.host = host
+        self.port = port
+        self.event_parser = event_parser
+
+        self.events = 0
+
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}/"
+
+    async def start(self):
+        self.notifier = self.notifier or get_feed_notifier()
+        self.notifier.push_enabled = True
+
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+
+        self.port = self._server.sockets[0].getsockname()[1]
+
+        logger.info(f'FeedWebhookReceiver: Listening on [{self.url}].')
+
+    async def stop(self):
+        if self.notifier is not None:
+            self.notifier.push_enabled = False
+
+        if self._server is not None:
+            self._server.close()
+
+            await self._server.wait_closed()
+
+            self._server = None
+
+    async def __aenter__(self) -> "FeedWebhookReceiver":
+        await self.start()
+
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.stop()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        status = "200 OK"
+
+        try:
+            request_line = await reader.readline()
+
+            headers = {}
+
+            while True:
+                line = await reader.readline()
+
+                if line in (b"\r\n", b"\n", b""):
+                    break
+
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+            if not request_line.startswith(b"POST "):
+                status = "405 Method Not Allowed"
+            else:
+                body = await reader.readexactly(int(headers.get("content-length", "0")))
+
+                feed_id = self.event_parser(json.loads(body)) if body else None
+
+                self.events += 1
+
+                if feed_id is not None:
+                    logger.debug(f'FeedWebhookReceiver: Received event for feed [{feed_id}].')
+
+                    self.notifier.poke(feed_id)
+        except (ValueError, asyncio.IncompleteReadError) as e:
+            logger.warning(f'FeedWebhookReceiver: Invalid event: {e}')
+
+            status = "400 Bad Request"
+
+        writer.write(f"HTTP/1.1 {status}\r\nContent-Length: 0\r\nConnection: close\r\n\r\n".encode("latin-1"))
+
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
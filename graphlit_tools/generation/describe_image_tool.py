@@ -6,14 +6,19 @@ from graphlit_api import exceptions, input_types
 from pydantic import BaseModel, Field
 
 from ..base_tool import BaseTool
+from ..cache import ResultCache
 from ..exceptions import ToolException
 from .. import helpers
 
 logger = logging.getLogger(__name__)
 
+# NOTE: shared across tool instances, since agents often recreate their tools
+description_cache = ResultCache(max_size=1024)
+
 class DescribeImageInput(BaseModel):
     url: str = Field(description="URL for image to be described with vision LLM")
     prompt: str = Field(description="Text prompt which is provided to vision LLM for completion")
+    content_id: Optional[str] = Field(description="ID of ingested image content, optional. If the image was already described by a workflow, its description will be returned.", default=None)
 
 class DescribeImageTool(BaseTool):
     name: str = "Graphlit image description tool"
@@ -30,8 +35,10 @@ class DescribeImageTool(BaseTool):
     specification_id: Optional[str] = Field(None, exclude=True)
     correlation_id: Optional[str] = Field(None, exclude=True)
 
+    cache: Optional[ResultCache] = Field(None, exclude=True)
+
     def __init__(self, graphlit: Optional[Graphlit] = None, specification_id: Optional[str] = None,
-                 correlation_id: Optional[str] = None, **kwargs):
+                 correlation_id: Optional[str] = None, cache: Optional[ResultCache] = None, use_cache: bool = True, **kwargs):
         """
         Initializes the DescribeImageTool.
 
@@ -40,14 +47,44 @@ class DescribeImageTool(BaseTool):
                 Defaults to a new Graphlit instance if not provided.
             specification_id (Optional[str]): ID for the LLM specification. Defaults to None.
             correlation_id (Optional[str]): Correlation ID for tracking requests. Defaults to None.
+            cache (Optional[ResultCache]): Cache of image descriptions, keyed by image URL, prompt and specification.
+                Defaults to a cache shared by all DescribeImageTool instances.
+            use_cache (bool): Whether to reuse image descriptions from the cache. Defaults to True.
             **kwargs: Additional keyword arguments for the BaseTool superclass.
         """
         super().__init__(**kwargs)
         self.graphlit = graphlit or Graphlit()
         self.specification_id = specification_id
         self.correlation_id = correlation_id
+        self.cache = (cache if cache is not None else description_cache) if use_cache else None
+
+    async def _arun(self, prompt: str, url: str, content_id: Optional[str] = None) -> str:
+        # NOTE: if we've already analyzed the image, via workflow, return the image description
+        if content_id is not None:
+            # Workflow descriptions don't depend on the prompt or specification, so they're cached by content instead
+            workflow_key = ("workflow", content_id)
+
+            message = self.cache.get(workflow_key) if self.cache is not None else None
+
+            if message is None:
+                message = await self._get_image_description(content_id)
+
+                if message is not None and self.cache is not None:
+                    self.cache.set(workflow_key, message)
+
+            if message is not None:
+                return message
+
+        key = ("prompt", url, prompt, self.specification_id)
+
+        if self.cache is not None:
+            message = self.cache.get(key)
+
+            if message is not None:
+                logger.debug(f'DescribeImageTool: Reused cached description for image [{url}].')
+
+                return message
 
-    async def _arun(self, prompt: str, url: str) -> str:
         try:
             response = await self.graphlit.client.describe_image(
                 specification=input_types.EntityReferenceInput(id=self.specification_id) if self.specification_id is not None else None,
@@ -61,6 +98,9 @@ class DescribeImageTool(BaseTool):
 
             message = response.describe_image.message
 
+            if self.cache is not None and message.message is not None:
+                self.cache.set(key, message.message)
+
             return message.message
         except exceptions.GraphQLClientError as e:
             logger.error(str(e))
@@ -71,5 +111,21 @@ class DescribeImageTool(BaseTool):
             print(str(e))
             raise ToolException(str(e)) from e
 
-    def _run(self, prompt: str, url: str) -> str:
-        return helpers.run_async(self._arun, prompt, url)
+    def _run(self, prompt: str, url: str, content_id: Optional[str] = None) -> str:
+        return helpers.run_async(self._arun, prompt, url, content_id)
+
+    async def _get_image_description(self, content_id: str) -> Optional[str]:
+        try:
+            response = await self.graphlit.client.get_content(
+                id=content_id
+            )
+
+            if response.content is None or response.content.image is None:
+                return None
+
+            logger.debug(f'DescribeImageTool: Retrieved content by ID [{content_id}].')
+
+            return response.content.image.description
+        except exceptions.GraphQLClientError as e:
+            logger.error(str(e))
+            raise ToolException(str(e)) from e
@@ -1,5 +1,5 @@
 import logging
-from typing import Optional, Type
+from typing import Optional, Type, List, Union
 
 from graphlit import Graphlit
 from graphlit_api import exceptions, input_types
@@ -49,6 +49,50 @@ class DescribeWebPageTool(BaseTool):
         self.correlation_id = correlation_id
 
     async def _arun(self, url: str, prompt: Optional[str] = None) -> Optional[str]:
+        content_id = await self._screenshot_page(url)
+
+        content = await self._get_content(content_id)
+
+        return await self._describe_content(content, prompt)
+
+    def _run(self, url: str, prompt: Optional[str] = None) -> Optional[str]:
+        return helpers.run_async(self._arun, url, prompt)
+
+    async def adescribe_pages(self, urls: List[str], prompt: Optional[str] = None, workers: Union[int, List[int]] = 4, queue_size: int = 16) -> List[Optional[str]]:
+        """
+        Screenshots and describes many web pages, with screenshots, content retrieval and image description running as overlapping stages.
+
+        Args:
+            urls (List[str]): URLs of web pages to screenshot and describe.
+            prompt (Optional[str]): Text prompt which is provided to vision LLM for screenshot description. Defaults to None.
+            workers (Union[int, List[int]]): Number of concurrent workers for every stage, or a list of three counts
+                for the screenshot, content retrieval and image description stages. Defaults to 4.
+            queue_size (int): Maximum number of pages waiting in front of each stage. Defaults to 16.
+
+        Returns:
+            List[Optional[str]]: Screenshot descriptions, in the order of the provided URLs. Pages which failed are returned as None.
+        """
+        async def describe_content(content):
+            return await self._describe_content(content, prompt)
+
+        results = await helpers.run_pipeline(urls, [self._screenshot_page, self._get_content, describe_content], workers, queue_size)
+
+        descriptions = []
+
+        for url, result in zip(urls, results):
+            if isinstance(result, Exception):
+                logger.error(f'DescribeWebPageTool: Failed to describe web page [{url}]: {result}')
+
+                descriptions.append(None)
+            else:
+                descriptions.append(result)
+
+        return descriptions
+
+    def describe_pages(self, urls: List[str], prompt: Optional[str] = None, workers: Union[int, List[int]] = 4, queue_size: int = 16) -> List[Optional[str]]:
+        return helpers.run_async(self.adescribe_pages, urls, prompt, workers, queue_size)
+
+    async def _screenshot_page(self, url: str) -> str:
         content_id = None
 
         try:
@@ -67,8 +111,9 @@ class DescribeWebPageTool(BaseTool):
         if content_id is None:
             raise ToolException('Invalid content identifier.')
 
-        content = None
+        return content_id
 
+    async def _get_content(self, content_id: str):
         try:
             response = await self.graphlit.client.get_content(
                 id=content_id
@@ -79,16 +124,17 @@ class DescribeWebPageTool(BaseTool):
 
             logger.debug(f'DescribeWebPageTool: Retrieved content by ID [{content_id}].')
 
-            content = response.content
+            return response.content
         except exceptions.GraphQLClientError as e:
             logger.error(str(e))
             raise ToolException(str(e)) from e
 
+    async def _describe_content(self, content, prompt: Optional[str] = None) -> Optional[str]:
         if content.image_uri is None:
-            raise ToolException(f'Invalid image URI for content [{content_id}].')
+            raise ToolException(f'Invalid image URI for content [{content.id}].')
 
         # NOTE: if we've already analyzed the image, via workflow, return the image description
-        if content.image.description is not None:
+        if content.image is not None and content.image.description is not None:
             return content.image.description
 
         default_prompt = """
@@ -118,7 +164,7 @@ class DescribeWebPageTool(BaseTool):
             if response.describe_image is None or response.describe_image.message is None:
                 raise ToolException('Failed to describe screenshot.')
 
-            return response.describe_image.message
+            return response.describe_image.message.message
         except exceptions.GraphQLClientError as e:
             logger.error(str(e))
             print(str(e))
@@ -127,6 +173,3 @@ class DescribeWebPageTool(BaseTool):
             logger.error(str(e))
             print(str(e))
             raise ToolException(str(e)) from e
-
-    def _run(self, url: str, prompt: Optional[str] = None) -> Optional[str]:
-        return helpers.run_async(self._arun, url, prompt)
@@ -1,5 +1,6 @@
 from typing import Any, Dict, cast
 from .base_tool import BaseTool
+from . import adapter
 
 GriptapeBaseTool: Any = None
 
@@ -33,7 +34,7 @@ if GriptapeBaseTool:
 
             # Define the generate method dynamically
             def generate(self, params: Dict[str, Any]) -> TextArtifact:
-                return TextArtifact(str(self.graphlit_tool.run(**params)))
+                return TextArtifact(adapter.format_result(adapter.invoke(self.graphlit_tool, params)))
 
             # Convert the tool's schema
             tool_schema = Schema(graphlit_tool.json_schema)
@@ -1,8 +1,17 @@
 import asyncio
-from typing import Callable, Optional, List, Any, Coroutine
+import json
+import logging
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, Optional, List, Any, Coroutine, Type, Union, NamedTuple, Dict, Iterable
+import pydantic_core
+from pydantic import BaseModel
 from graphlit_api import exceptions, input_types, enums
 from .exceptions import ToolException
 
+logger = logging.getLogger(__name__)
+
 def format_person(person) -> List[str]:
     results = []
 
@@ -43,21 +52,30 @@ def format_organization(organization) -> List[str]:
 
     return results
 
-def format_content(content, include_text: Optional[bool] = True) -> List[str]:
-    results = []
+# NOTE: formatting enums is slow, so labels are formatted once per enum value
+@lru_cache(maxsize=None)
+def _type_label(content_type) -> str:
+    return f"**Type:** [{content_type}]"
+
+@lru_cache(maxsize=None)
+def _file_type_label(file_type) -> str:
+    return f"**File Type:** [{file_type}]"
+
+@lru_cache(maxsize=None)
+def _link_label(link_type) -> str:
+    return f"**{link_type} Link:** "
 
-    # Basic content details
+def _format_header(content, results: List[str]):
     results.append(f"**Content ID:** {content.id}")
 
     if content.type == enums.ContentTypes.FILE:
-        results.append(f"**File Type:** [{content.file_type}]")
+        results.append(_file_type_label(content.file_type))
         results.append(f"**File Name:** {content.file_name}")
     else:
-        results.append(f"**Type:** [{content.type}]")
-        if content.type not in [enums.ContentTypes.PAGE, enums.ContentTypes.EMAIL]:
+        results.append(_type_label(content.type))
+        if content.type not in (enums.ContentTypes.PAGE, enums.ContentTypes.EMAIL):
             results.append(f"**Name:** {content.name}")
 
-    # Optional metadata
     if content.uri:
         results.append(f"**URI:** {content.uri}")
     if content.creation_date:
@@ -65,103 +83,380 @@ def format_content(content, include_text: Optional[bool] = True) -> List[str]:
     if content.original_date:
         results.append(f"**Author Date:** {content.original_date}")
 
-    # Issue details
-    if content.issue:
-        issue_attributes = [
-            ("Title", content.issue.title),
-            ("Identifier", content.issue.identifier),
-            ("Type", content.issue.type),
-            ("Project", content.issue.project),
-            ("Team", content.issue.team),
-            ("Status", content.issue.status),
-            ("Priority", content.issue.priority),
-        ]
-        results.extend([f"**{label}:** {value}" for label, value in issue_attributes if value])
-
-        if content.issue.labels:
-            results.append(f"**Labels:** {', '.join(content.issue.labels)}")
-
-    # Email details
-    if content.email:
-        email_attributes = [
-            ("Subject", content.email.subject),
-            ("Sensitivity", content.email.sensitivity.name if content.email.sensitivity else None),
-            ("Priority", content.email.priority.name if content.email.priority else None),
-            ("Importance", content.email.importance.name if content.email.importance else None),
-            ("Labels", ', '.join(content.email.labels) if content.email.labels else None),
-            ("To", ', '.join(f"{r.name} <{r.email}>" for r in content.email.to) if content.email.to else None),
-            ("From", ', '.join(f"{r.name} <{r.email}>" for r in getattr(content.email, "from", []))),
-            ("CC", ', '.join(f"{r.name} <{r.email}>" for r in content.email.cc) if content.email.cc else None),
-            ("BCC", ', '.join(f"{r.name} <{r.email}>" for r in content.email.bcc) if content.email.bcc else None),
-        ]
-        results.extend([f"**{label}:** {value}" for label, value in email_attributes if value])
-
-    # Document details
-    if content.document:
-        document_attributes = [
-            ("Title", content.document.title),
-            ("Author", content.document.author),
-        ]
-        results.extend([f"**{label}:** {value}" for label, value in document_attributes if value])
-
-    # Audio details
-    if content.audio:
-        audio_attributes = [
-            ("Title", content.audio.title),
-            ("Host", content.audio.author),
-            ("Episode", content.audio.episode),
-            ("Series", content.audio.series),
-        ]
-        results.extend([f"**{label}:** {value}" for label, value in audio_attributes if value])
-
-    # Image details
-    if content.image:
-        image_attributes = [
-            ("Description", content.image.description),
-            ("Software", content.image.software),
-            ("Make", content.image.make),
-            ("Model", content.image.model),
-        ]
-        results.extend([f"**{label}:** {value}" for label, value in image_attributes if value])
-
-    # Links
+def _format_issue(content, results: List[str]):
+    issue = content.issue
+
+    if not issue:
+        return
+
+    if issue.title:
+        results.append(f"**Title:** {issue.title}")
+    if issue.identifier:
+        results.append(f"**Identifier:** {issue.identifier}")
+    if issue.type:
+        results.append(f"**Type:** {issue.type}")
+    if issue.project:
+        results.append(f"**Project:** {issue.project}")
+    if issue.team:
+        results.append(f"**Team:** {issue.team}")
+    if issue.status:
+        results.append(f"**Status:** {issue.status}")
+    if issue.priority:
+        results.append(f"**Priority:** {issue.priority}")
+    if issue.labels:
+        results.append(f"**Labels:** {', '.join(issue.labels)}")
+
+def _format_recipients(recipients) -> str:
+    return ', '.join(f"{r.name} <{r.email}>" for r in recipients)
+
+def _format_email(content, results: List[str]):
+    email = content.email
+
+    if not email:
+        return
+
+    if email.subject:
+        results.append(f"**Subject:** {email.subject}")
+    if email.sensitivity:
+        results.append(f"**Sensitivity:** {email.sensitivity.name}")
+    if email.priority:
+        results.append(f"**Priority:** {email.priority.name}")
+    if email.importance:
+        results.append(f"**Importance:** {email.importance.name}")
+    if email.labels:
+        results.append(f"**Labels:** {', '.join(email.labels)}")
+    if email.to:
+        results.append(f"**To:** {_format_recipients(email.to)}")
+
+    senders = getattr(email, "from", None)
+
+    if senders:
+        results.append(f"**From:** {_format_recipients(senders)}")
+    if email.cc:
+        results.append(f"**CC:** {_format_recipients(email.cc)}")
+    if email.bcc:
+        results.append(f"**BCC:** {_format_recipients(email.bcc)}")
+
+def _format_document(content, results: List[str]):
+    document = content.document
+
+    if not document:
+        return
+
+    if document.title:
+        results.append(f"**Title:** {document.title}")
+    if document.author:
+        results.append(f"**Author:** {document.author}")
+
+def _format_audio(content, results: List[str]):
+    audio = content.audio
+
+    if not audio:
+        return
+
+    if audio.title:
+        results.append(f"**Title:** {audio.title}")
+    if audio.author:
+        results.append(f"**Host:** {audio.author}")
+    if audio.episode:
+        results.append(f"**Episode:** {audio.episode}")
+    if audio.series:
+        results.append(f"**Series:** {audio.series}")
+
+def _format_image(content, results: List[str]):
+    image = content.image
+
+    if not image:
+        return
+
+    if image.description:
+        results.append(f"**Description:** {image.description}")
+    if image.software:
+        results.append(f"**Software:** {image.software}")
+    if image.make:
+        results.append(f"**Make:** {image.make}")
+    if image.model:
+        results.append(f"**Model:** {image.model}")
+
+def _format_links(content, results: List[str]):
     if content.links:
-        if content.type in [enums.ContentTypes.PAGE]:
-            results.extend([f"**{link.link_type} Link:** {link.uri}" for link in content.links[:100]])
-
-    # Include text content if specified
-    if include_text:
-        if content.pages:
-            for page in content.pages:
-                if page.chunks:
-                    results.append(f"**Page #{page.index + 1}:**")
-                    results.extend([chunk.text for chunk in page.chunks])
-                    results.append("\n---\n")
-
-        if content.segments:
-            for segment in content.segments:
-                results.append(f"**Transcript Segment [{segment.start_time}-{segment.end_time}]:**")
-                results.append(segment.text)
+        results.extend([f"{_link_label(link.link_type)}{link.uri}" for link in content.links[:100]])
+
+def _format_text(content, results: List[str]):
+    if content.pages:
+        for page in content.pages:
+            if page.chunks:
+                results.append(f"**Page #{page.index + 1}:**")
+                results.extend([chunk.text for chunk in page.chunks])
                 results.append("\n---\n")
 
-        if content.frames:
-            for frame in content.frames:
-                results.append(f"**Frame #{frame.index + 1}:**")
-                results.append(frame.text)
-                results.append("\n---\n")
+    if content.segments:
+        for segment in content.segments:
+            results.append(f"**Transcript Segment [{segment.start_time}-{segment.end_time}]:**")
+            results.append(segment.text)
+            results.append("\n---\n")
+
+    if content.frames:
+        for frame in content.frames:
+            results.append(f"**Frame #{frame.index + 1}:**")
+            results.append(frame.text)
+            results.append("\n---\n")
+
+    if not content.pages and not content.segments and not content.frames and content.markdown:
+        results.append(content.markdown)
+        results.append("\n")
+
+ContentFormatter = Callable[[Any, Optional[bool]], List[str]]
+
+def compile_content_formatter(*sections: Callable[[Any, List[str]], None]) -> ContentFormatter:
+    """
+    Builds a content formatter from metadata sections, which runs only the sections given, in order.
+
+    Each section appends its Markdown lines to the results. The content header is always formatted first,
+    and the extracted text last, if requested.
+
+    Args:
+        *sections: The metadata section formatters.
+
+    Returns:
+        The content formatter.
+    """
+    def formatter(content, include_text: Optional[bool] = True) -> List[str]:
+        results = []
+
+        _format_header(content, results)
 
-        if not content.pages and not content.segments and not content.frames and content.markdown:
-            results.append(content.markdown)
+        for section in sections:
+            section(content, results)
+
+        if include_text:
+            _format_text(content, results)
+        else:
             results.append("\n")
+
+        return results
+
+    return formatter
+
+# NOTE: every content type gets every metadata section, since any content may carry issue or email metadata, i.e. an uploaded .eml file
+_metadata_sections = (_format_issue, _format_email, _format_document, _format_audio, _format_image)
+
+default_content_formatter = compile_content_formatter(*_metadata_sections)
+
+# NOTE: only web pages list their links
+content_formatters: Dict[Any, ContentFormatter] = {
+    enums.ContentTypes.PAGE: compile_content_formatter(*_metadata_sections, _format_links),
+}
+
+# NOTE: kept apart from content type formatters, since both enums have members with the same value, i.e. EMAIL
+file_formatters: Dict[Any, ContentFormatter] = {}
+
+def register_content_formatter(content_type: Any, formatter: ContentFormatter):
+    """
+    Registers a formatter for a content type, or for a file type, overriding any built-in formatter.
+
+    Args:
+        content_type: The content type (i.e. ContentTypes.PAGE), or the file type (i.e. FileTypes.DOCUMENT) of file contents.
+        formatter: Function which accepts the content and whether to include text, and returns Markdown lines.
+    """
+    if isinstance(content_type, enums.FileTypes):
+        file_formatters[content_type] = formatter
     else:
-        results.append("\n")
+        content_formatters[content_type] = formatter
+
+def format_content(content, include_text: Optional[bool] = True) -> List[str]:
+    formatter = None
+
+    if content.type == enums.ContentTypes.FILE and content.file_type is not None:
+        formatter = file_formatters.get(content.file_type)
+
+    if formatter is None:
+        formatter = content_formatters.get(content.type, default_content_formatter)
+
+    return formatter(content, include_text)
+
+class ContentChunk(NamedTuple):
+    content_id: str
+    uri: Optional[str]
+    locator: str
+    text: str
+    relevance: Optional[float]
+
+def first_relevance(*relevances: Optional[float]) -> Optional[float]:
+    return next((relevance for relevance in relevances if relevance is not None), None)
+
+def content_chunks(content) -> List[ContentChunk]:
+    """
+    Collects the text chunks of a content, with their page, transcript segment or frame locator and relevance.
+
+    Chunks without their own relevance fall back to the relevance of their page, then of their content.
+
+    Args:
+        content: The content to be chunked.
+
+    Returns:
+        The text chunks of the content, in document order.
+    """
+    chunks = []
+
+    # NOTE: only query results have a relevance, not contents fetched by ID
+    relevance = getattr(content, "relevance", None)
+
+    if content.pages:
+        for page in content.pages:
+            if page.chunks:
+                chunks.extend(
+                    ContentChunk(content.id, content.uri, f"Page #{page.index + 1}", chunk.text, first_relevance(chunk.relevance, page.relevance, relevance))
+                    for chunk in page.chunks if chunk is not None and chunk.text
+                )
+
+    if content.segments:
+        chunks.extend(
+            ContentChunk(content.id, content.uri, f"Transcript Segment [{segment.start_time}-{segment.end_time}]", segment.text, first_relevance(segment.relevance, relevance))
+            for segment in content.segments if segment.text
+        )
+
+    if content.frames:
+        chunks.extend(
+            ContentChunk(content.id, content.uri, f"Frame #{frame.index + 1}", frame.text, first_relevance(frame.relevance, relevance))
+            for frame in content.frames if frame.text
+        )
+
+    if not content.pages and not content.segments and not content.frames and content.markdown:
+        chunks.append(ContentChunk(content.id, content.uri, "Text", content.markdown, relevance))
+
+    return chunks
+
+def content_text(content) -> str:
+    return "\n".join(chunk.text for chunk in content_chunks(content))
+
+def top_chunks(contents, limit: int, search: Optional[str] = None, reranker=None) -> List[ContentChunk]:
+    """
+    Selects the most relevant text chunks across contents.
+
+    Args:
+        contents: The contents to select chunks from.
+        limit: The maximum number of chunks to return.
+        search: The search text, used for re-ranking.
+        reranker: Optional client-side Reranker. If provided with search text, chunks are ranked by similarity to the search text,
+            rather than by the relevance returned from the API.
+
+    Returns:
+        The most relevant chunks. Chunks without relevance keep their original order, after ranked chunks.
+    """
+    chunks = [chunk for content in contents for chunk in content_chunks(content)]
+
+    if reranker is not None and search:
+        return reranker.rerank(search, chunks, key=lambda chunk: chunk.text, limit=limit)
+
+    chunks.sort(key=lambda chunk: chunk.relevance if chunk.relevance is not None else float('-inf'), reverse=True)
+
+    return chunks[:limit]
+
+def format_chunk(chunk: ContentChunk) -> List[str]:
+    results = []
+
+    results.append(f"**Content ID:** {chunk.content_id}")
+
+    if chunk.uri:
+        results.append(f"**URI:** {chunk.uri}")
+
+    results.append(f"**{chunk.locator}:**")
+    results.append(chunk.text)
+    results.append("\n---\n")
 
     return results
 
+def format_chunks_text(chunks: Iterable[ContentChunk], results: List[str]):
+    """
+    Formats text chunks as the extracted text section of content Markdown, grouping consecutive chunks of the same page.
+
+    Args:
+        chunks: The text chunks, in document order.
+        results: The Markdown lines, which the text lines are appended to.
+    """
+    locator = None
+
+    for chunk in chunks:
+        if chunk.locator != locator:
+            if locator is not None and locator != "Text":
+                results.append("\n---\n")
+
+            locator = chunk.locator
+
+            if locator != "Text":
+                results.append(f"**{locator}:**")
+
+        results.append(chunk.text)
+
+        if locator == "Text":
+            results.append("\n")
+
+    if locator is not None and locator != "Text":
+        results.append("\n---\n")
+
+def format_extractions(extractions, output_model: Optional[Type[BaseModel]] = None, json_lines: Optional[bool] = False) -> Union[str, List[BaseModel]]:
+    """
+    Converts LLM data extractions into tool output.
+
+    Without an output model, returns the extractions as a JSON array string, or as compact JSON Lines.
+    With an output model, each extraction is validated directly from its JSON string into a model instance,
+    and either the instances or their compact JSON Lines are returned.
+
+    Args:
+        extractions: The extractions returned from the Graphlit API.
+        output_model: Optional Pydantic model class to validate each extraction into.
+        json_lines: Whether to return compact JSON Lines, rather than a JSON array or model instances.
+
+    Returns:
+        The JSON array string, JSON Lines string, or list of model instances.
+    """
+    values = [extraction.value for extraction in extractions if extraction.value is not None]
+
+    if output_model is None:
+        if json_lines:
+            return "\n".join(pydantic_core.to_json(pydantic_core.from_json(value)).decode() for value in values)
+
+        return json.dumps(json.loads('[' + ','.join(values) + ']'), indent=4)
+
+    instances = [output_model.model_validate_json(value) for value in values]
+
+    if json_lines:
+        return "\n".join(instance.model_dump_json() for instance in instances)
+
+    return instances
+
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_loop_lock = threading.Lock()
+
+def get_background_loop() -> asyncio.AbstractEventLoop:
+    """
+    Gets the shared event loop, which runs forever on a daemon thread.
+
+    Used to run async functions synchronously from within a running event loop, without blocking on that loop.
+
+    Returns:
+        asyncio.AbstractEventLoop: The shared event loop.
+    """
+    global _background_loop # pylint: disable=global-statement
+
+    with _background_loop_lock:
+        if _background_loop is None or _background_loop.is_closed():
+            loop = asyncio.new_event_loop()
+
+            threading.Thread(target=loop.run_forever, name="graphlit-tools-loop", daemon=True).start()
+
+            _background_loop = loop
+
+        return _background_loop
+
 def run_async(coro_func: Callable[..., Coroutine[Any, Any, Any]], *args, **kwargs) -> Any:
     """
     Runs an async function synchronously, handling event loops properly.
 
+    If called from within a running event loop, the async function is run on the shared background loop,
+    rather than creating a new event loop for each call.
+
     Args:
         coro_func: The asynchronous function to be run.
         *args: Positional arguments to pass to the async function.
@@ -171,55 +466,422 @@ def run_async(coro_func: Callable[..., Coroutine[Any, Any, Any]], *args, **kwarg
         The result of the async function execution.
     """
     try:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            # If the loop is already running, ensure the coroutine runs within it
-            return loop.run_until_complete(coro_func(*args, **kwargs))
-        else:
-            # If no loop is running, use asyncio.run
-            return asyncio.run(coro_func(*args, **kwargs))
+        asyncio.get_running_loop()
     except RuntimeError:
-        # Handle case where the event loop is closed
-        new_loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(new_loop)
-        return new_loop.run_until_complete(coro_func(*args, **kwargs))
+        # If no loop is running, use asyncio.run
+        return asyncio.run(coro_func(*args, **kwargs))
+
+    # If the loop is already running, it can't be re-entered, so run the coroutine on the shared loop thread
+    return asyncio.run_coroutine_threadsafe(coro_func(*args, **kwargs), get_background_loop()).result()
+
+def reciprocal_rank_fusion(result_lists: List[List[Any]], key: Callable[[Any], Any] = lambda result: result.id, k: int = 60) -> List[Any]:
+    """
+    Merges ranked result lists with reciprocal rank fusion, removing duplicate results.
+
+    Args:
+        result_lists: The ranked result lists to be merged.
+        key: Function returning the identity of a result, used for deduplication. Defaults to the result ID.
+        k: Rank smoothing constant, which limits the influence of the top ranks. Defaults to 60.
+
+    Returns:
+        The deduplicated results, ordered by descending fused score. The first occurrence of each result is kept.
+    """
+    scores = {}
+    results = {}
+
+    for result_list in result_lists:
+        for rank, result in enumerate(result_list):
+            result_key = key(result)
+
+            scores[result_key] = scores.get(result_key, 0.0) + 1.0 / (k + rank + 1)
+            results.setdefault(result_key, result)
+
+    return [results[result_key] for result_key in sorted(scores, key=scores.get, reverse=True)]
+
+async def gather_with_concurrency(coro_func: Callable[[Any], Coroutine[Any, Any, Any]], items: List[Any], concurrency: int = 8) -> List[Any]:
+    """
+    Runs an async function over many items, with at most a fixed number of calls in flight.
+
+    Args:
+        coro_func: The async function to be run for each item.
+        items: The items to be processed.
+        concurrency: Maximum number of concurrent calls.
+
+    Returns:
+        The results, in the order of the input items. An item which failed has the raised exception in place of its result.
+    """
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+    async def run(item):
+        async with semaphore:
+            return await coro_func(item)
+
+    return await asyncio.gather(*(run(item) for item in items), return_exceptions=True)
+
+async def gather_first(coro_func: Callable[[Any], Coroutine[Any, Any, Any]], items: List[Any], count: int,
+                       timeout: Optional[float] = None, concurrency: int = 8) -> Dict[int, Any]:
+    """
+    Runs an async function over many items, and keeps the first results to succeed, cancelling the calls still in flight.
+
+    Args:
+        coro_func: The async function to be run for each item.
+        items: The items to be processed.
+        count: Number of successful results wanted.
+        timeout: Maximum time per call, in seconds. A call which times out counts as failed.
+        concurrency: Maximum number of concurrent calls.
+
+    Returns:
+        The successful results, keyed by the index of their input item. Calls which failed, returned None or were cancelled are omitted.
+    """
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+    async def run(index: int, item):
+        async with semaphore:
+            return index, await asyncio.wait_for(coro_func(item), timeout)
+
+    tasks = [asyncio.ensure_future(run(index, item)) for index, item in enumerate(items)]
+
+    results = {}
+
+    pending = set(tasks)
+
+    try:
+        while pending and len(results) < count:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+            for task in done:
+                if task.cancelled() or task.exception() is not None:
+                    continue
+
+                index, result = task.result()
+
+                if result is not None and len(results) < count:
+                    results[index] = result
+    finally:
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    return results
+
+async def lookup_entities(query_func: Callable[[str], Coroutine[Any, Any, Optional[list]]], keys: List[str], lookup_cache, cache_scope: tuple,
+                          normalize: Callable[[str], str] = str.strip, result_func: Optional[Callable[[Any], Any]] = None,
+                          concurrency: int = 8, name: str = "lookup") -> Dict[str, Optional[list]]:
+    """
+    Looks up entities for many keys, querying each unique key once, with bounded concurrency.
+
+    Args:
+        query_func: The async function querying the entities matching a normalized key.
+        keys: The keys to look up.
+        lookup_cache: Cache of query results, shared across calls.
+        cache_scope: Query options which affect the results, so they are part of the cache key.
+        normalize: Normalizes a key, so keys differing only in whitespace or case are queried once.
+        result_func: Converts each matched entity, i.e. into a result object. Defaults to None, for the entities as queried.
+        concurrency: Maximum number of concurrent queries.
+        name: Name used in log messages.
+
+    Returns:
+        The matched entities for each input key. Keys whose query failed map to None.
+    """
+    normalized = {key: normalize(key) for key in keys}
+
+    matches = {}
+    pending = []
+
+    for lookup_key in dict.fromkeys(normalized.values()):
+        cached = lookup_cache.get((*cache_scope, lookup_key))
+
+        if cached is not None:
+            matches[lookup_key] = cached
+        else:
+            pending.append(lookup_key)
+
+    responses = await gather_with_concurrency(query_func, pending, concurrency)
+
+    for lookup_key, response in zip(pending, responses):
+        if isinstance(response, BaseException):
+            logger.error(f'{name}: Failed to look up [{lookup_key}]: {response}')
+
+            matches[lookup_key] = None
+        else:
+            matches[lookup_key] = response or []
+
+            lookup_cache.set((*cache_scope, lookup_key), matches[lookup_key])
+
+    logger.debug(f'{name}: Looked up [{len(matches)}] unique key(s), queried [{len(pending)}].')
+
+    if result_func is not None:
+        matches = {lookup_key: [result_func(entity) for entity in entities] if entities is not None else None for lookup_key, entities in matches.items()}
+
+    return {key: matches[lookup_key] for key, lookup_key in normalized.items()}
+
+def join_within_budget(blocks: List[str], budget: Optional[int] = None, separator: str = "\n\n") -> str:
+    """
+    Joins text blocks, truncating the text once it reaches a character budget.
+
+    Args:
+        blocks: The text blocks, most important first.
+        budget: Maximum number of characters. Defaults to None, for no limit.
+        separator: Text placed between blocks.
+
+    Returns:
+        The joined text. Truncated text ends with a marker, so readers know text is missing.
+    """
+    text = separator.join(blocks)
+
+    if budget is None or len(text) <= budget:
+        return text
+
+    marker = "\n\n[truncated]"
+
+    return text[:max(budget - len(marker), 0)] + marker
+
+async def ingest_url(client, url: str, workflow_id: Optional[str] = None, correlation_id: Optional[str] = None):
+    """
+    Ingests a URL synchronously, and gets the ingested content.
+
+    Args:
+        client: The Graphlit API client.
+        url: The URL to be ingested.
+        workflow_id: Optional ID of the workflow to use when ingesting.
+        correlation_id: Optional correlation ID for tracking requests.
+
+    Returns:
+        The ingested content.
+    """
+    try:
+        response = await client.ingest_uri(
+            uri=url,
+            workflow=input_types.EntityReferenceInput(id=workflow_id) if workflow_id is not None else None,
+            is_synchronous=True,
+            correlation_id=correlation_id
+        )
+
+        content_id = response.ingest_uri.id if response.ingest_uri is not None else None
+
+        if content_id is None:
+            raise ToolException('Invalid content identifier.')
+
+        response = await client.get_content(
+            id=content_id
+        )
+
+        return response.content
+    except exceptions.GraphQLClientError as e:
+        raise ToolException(str(e)) from e
+
+async def run_pipeline(items: List[Any], stages: List[Callable[[Any], Coroutine[Any, Any, Any]]],
+                       workers: Union[int, List[int]] = 4, queue_size: int = 16) -> List[Any]:
+    """
+    Runs items through a sequence of async stages, overlapping the stages across items.
+
+    Each stage has its own pool of workers, and consecutive stages are connected by bounded queues,
+    so a slow stage applies backpressure to the stages before it.
+
+    Args:
+        items: The items to be processed.
+        stages: The async functions to apply, in order. Each stage receives the result of the previous stage.
+        workers: Number of concurrent workers, either for every stage or as a list with one count per stage.
+        queue_size: Maximum number of items waiting in front of each stage.
+
+    Returns:
+        The final stage results, in the order of the input items. An item which failed in any stage
+        has the raised exception in place of its result.
+    """
+    worker_counts = workers if isinstance(workers, list) else [workers] * len(stages)
+
+    if len(worker_counts) != len(stages):
+        raise ValueError("Expected one worker count per pipeline stage.")
+
+    results: List[Any] = [None] * len(items)
+    queues: List[asyncio.Queue] = [asyncio.Queue(maxsize=queue_size) for _ in stages]
+
+    async def work(stage_index: int):
+        stage = stages[stage_index]
+        inbox = queues[stage_index]
+        outbox = queues[stage_index + 1] if stage_index + 1 < len(stages) else None
+
+        while True:
+            index, value = await inbox.get()
+
+            try:
+                value = await stage(value)
+
+                if outbox is None:
+                    results[index] = value
+                else:
+                    await outbox.put((index, value))
+            except Exception as e: # pylint: disable=broad-exception-caught
+                results[index] = e
+            finally:
+                inbox.task_done()
+
+    tasks = [asyncio.create_task(work(stage_index)) for stage_index, count in enumerate(worker_counts) for _ in range(max(count, 1))]
+
+    try:
+        for index, item in enumerate(items):
+            await queues[0].put((index, item))
+
+        # NOTE: an item leaves a queue only after it has been handed to the next one, so joining in order drains the pipeline
+        for queue in queues:
+            await queue.join()
+    finally:
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    return results
 
 async def is_feed_done(client, feed_id: str):
     response = await client.is_feed_done(feed_id)
 
     return response.is_feed_done.result if response.is_feed_done is not None else None
 
-async def query_contents(client, feed_id: str, search: Optional[str] = None):
+async def are_feeds_done(client, feed_ids: List[str], concurrency: int = 8) -> Dict[str, Any]:
+    """
+    Checks whether many feeds are done, with at most a fixed number of status calls in flight.
+
+    Args:
+        client: The Graphlit API client.
+        feed_ids: The feed IDs.
+        concurrency: Maximum number of concurrent status calls.
+
+    Returns:
+        The done status of each feed, or the raised exception for a feed whose status call failed.
+    """
+    unique_ids = list(dict.fromkeys(feed_ids))
+
+    async def check(feed_id: str):
+        return await is_feed_done(client, feed_id)
+
+    return dict(zip(unique_ids, await gather_with_concurrency(check, unique_ids, concurrency)))
+
+async def query_finished_contents(client, feed_id: str, created_after: Optional[Any] = None, search: Optional[str] = None, limit: int = 100, offset: int = 0):
+    """
+    Queries a page of the finished contents of a feed, in order of creation.
+
+    Args:
+        client: The Graphlit API client.
+        feed_id: The feed ID.
+        created_after: Optional creation date cursor. Only contents created at or after it are returned.
+        search: Optional text to search for within the feed contents.
+        limit: Maximum number of contents to return.
+        offset: Number of contents to skip.
+
+    Returns:
+        The finished contents, oldest first.
+    """
     try:
         response = await client.query_contents(
             filter=input_types.ContentFilter(
                 search=search,
                 searchType=enums.SearchTypes.HYBRID,
+                states=[enums.EntityState.FINISHED],
+                orderBy=enums.OrderByTypes.CREATION_DATE,
+                direction=enums.OrderDirectionTypes.ASCENDING,
+                limit=limit,
+                offset=offset,
                 feeds=[
                     input_types.EntityReferenceFilter(
                         id=feed_id
                     )
-                ]
+                ],
+                creationDateRange=input_types.DateRangeFilter(**{ "from": created_after }) if created_after is not None else None
             )
         )
 
-        return response.contents.results if response.contents is not None else None
+        return response.contents.results if response.contents is not None and response.contents.results is not None else []
     except exceptions.GraphQLClientError as e:
-        print(str(e))
-        return None
+        raise ToolException(str(e)) from e
 
-async def format_feed_contents(client, feed_id: str, search: Optional[str] = None):
+async def query_contents(client, feed_id: str, search: Optional[str] = None, reranker=None):
     try:
-        contents = await query_contents(client, feed_id, search)
+        response = await client.query_contents(
+            filter=input_types.ContentFilter(
+                search=search,
+                searchType=enums.SearchTypes.HYBRID,
+                feeds=[
+                    input_types.EntityReferenceFilter(
+                        id=feed_id
+                    )
+                ]
+            )
+        )
 
-        results = []
+        contents = response.contents.results if response.contents is not None else None
+
+        if contents is not None and reranker is not None and search:
+            contents = reranker.rerank(search, contents, key=content_text)
+
+        return contents
+    except exceptions.GraphQLClientError as e:
+        raise ToolException(str(e)) from e
+
+# NOTE: result sets at least this large are formatted off the event loop, in chunks of this size
+FORMAT_OFFLOAD_THRESHOLD = 50
+FORMAT_CHUNK_SIZE = 25
+
+_format_executor: Optional[Executor] = None
+_format_executor_lock = threading.Lock()
+
+def _get_format_executor() -> Executor:
+    global _format_executor # pylint: disable=global-statement
+
+    # NOTE: contents are formatted from the background loop and from caller threads, which may race to create the executor
+    with _format_executor_lock:
+        if _format_executor is None:
+            _format_executor = ThreadPoolExecutor(thread_name_prefix="graphlit-format")
+
+        return _format_executor
+
+def format_contents_sync(contents) -> List[str]:
+    results = []
 
-        for content in contents:
-            results.extend(format_content(content))
+    for content in contents:
+        results.extend(format_content(content))
+
+    return results
+
+async def format_contents(contents, executor: Optional[Executor] = None, threshold: Optional[int] = None, chunk_size: Optional[int] = None) -> str:
+    """
+    Formats contents as Markdown text, without blocking the event loop for large result sets.
+
+    Small result sets are formatted inline. Larger result sets are split into chunks, which are formatted
+    in an executor and reassembled in their original order.
+
+    Args:
+        contents: The contents to be formatted.
+        executor: Executor for formatting large result sets. Defaults to a shared thread pool.
+            A process pool can be used for CPU parallelism, with the built-in formatters.
+        threshold: Minimum number of contents to format in the executor. Defaults to FORMAT_OFFLOAD_THRESHOLD.
+        chunk_size: Number of contents per executor task. Defaults to FORMAT_CHUNK_SIZE.
+
+    Returns:
+        The Markdown text.
+    """
+    threshold = threshold if threshold is not None else FORMAT_OFFLOAD_THRESHOLD
+    chunk_size = max(chunk_size if chunk_size is not None else FORMAT_CHUNK_SIZE, 1)
+
+    if len(contents) < threshold:
+        return "\n".join(format_contents_sync(contents))
+
+    loop = asyncio.get_running_loop()
+    executor = executor or _get_format_executor()
+
+    parts = await asyncio.gather(
+        *(loop.run_in_executor(executor, format_contents_sync, contents[index:index + chunk_size]) for index in range(0, len(contents), chunk_size))
+    )
+
+    return "\n".join(line for part in parts for line in part)
+
+async def format_feed_contents(client, feed_id: str, search: Optional[str] = None, reranker=None, executor: Optional[Executor] = None):
+    try:
+        contents = await query_contents(client, feed_id, search, reranker)
 
-        text = "\n".join(results)
+        text = await format_contents(contents or [], executor)
 
         return text
     except exceptions.GraphQLClientError as e:
-        print(str(e))
         raise ToolException(str(e)) from e
@@ -1,7 +1,6 @@
 import logging
-import time
 import os
-from typing import Optional, Type
+from typing import Optional, Type, Union, List, AsyncIterator
 
 from graphlit import Graphlit
 from graphlit_api import exceptions, input_types, enums
@@ -9,6 +8,8 @@ from pydantic import BaseModel, Field
 
 from ..base_tool import BaseTool
 from ..exceptions import ToolException
+from ..feeds import stream_feed_contents, wait_for_feed
+from ..results import ContentResult, content_results
 from .. import helpers
 
 logger = logging.getLogger(__name__)
@@ -30,12 +31,13 @@ class DiscordIngestTool(BaseTool):
 
     workflow_id: Optional[str] = Field(None, exclude=True)
     correlation_id: Optional[str] = Field(None, exclude=True)
+    structured: bool = Field(False, exclude=True)
 
     model_config = {
         "arbitrary_types_allowed": True
     }
 
-    def __init__(self, graphlit: Optional[Graphlit] = None, workflow_id: Optional[str] = None, correlation_id: Optional[str] = None, **kwargs):
+    def __init__(self, graphlit: Optional[Graphlit] = None, workflow_id: Optional[str] = None, correlation_id: Optional[str] = None, structured: bool = False, **kwargs):
         """
         Initializes the DiscordIngestTool.
 
@@ -44,16 +46,47 @@ class DiscordIngestTool(BaseTool):
                 If not provided, a new Graphlit instance will be created.
             workflow_id (Optional[str]): ID for the workflow to use when ingesting messages. Defaults to None.
             correlation_id (Optional[str]): Correlation ID for tracking requests. Defaults to None.
+            structured (bool): Whether to return ContentResult objects rather than Markdown text. Defaults to False.
             **kwargs: Additional keyword arguments for the BaseTool superclass.
         """
         super().__init__(**kwargs)
         self.graphlit = graphlit or Graphlit()
         self.workflow_id = workflow_id
         self.correlation_id = correlation_id
+        self.structured = structured
 
-    async def _arun(self, channel_name: str, search: Optional[str] = None, read_limit: Optional[int] = None) -> Optional[str]:
-        feed_id = None
+    async def _arun(self, channel_name: str, search: Optional[str] = None, read_limit: Optional[int] = None) -> Optional[Union[str, List[ContentResult]]]:
+        feed_id = await self._create_feed(channel_name, read_limit)
 
+        try:
+            # Wait for feed to complete, since ingestion happens asychronously
+            await wait_for_feed(self.graphlit.client, feed_id)
+
+            logger.debug(f'Completed feed [{feed_id}].')
+        except exceptions.GraphQLClientError as e:
+            logger.error(str(e))
+            raise ToolException(str(e)) from e
+
+        if self.structured:
+            return content_results(await helpers.query_contents(self.graphlit.client, feed_id, search))
+
+        return await helpers.format_feed_contents(self.graphlit.client, feed_id, search)
+
+    def _run(self, channel_name: str, search: Optional[str] = None, read_limit: Optional[int] = None) -> str:
+        return helpers.run_async(self._arun, channel_name, search, read_limit)
+
+    async def astream(self, channel_name: str, search: Optional[str] = None, read_limit: Optional[int] = None) -> AsyncIterator[Union[str, ContentResult]]:
+        """
+        Yields each content as soon as it's ingested, rather than once the feed is done, so downstream work can start early.
+
+        Accepts the same arguments as the tool.
+        """
+        feed_id = await self._create_feed(channel_name, read_limit)
+
+        async for content in stream_feed_contents(self.graphlit.client, feed_id, search):
+            yield ContentResult.from_content(content) if self.structured else "\n".join(helpers.format_content(content))
+
+    async def _create_feed(self, channel_name: str, read_limit: Optional[int] = None) -> str:
         token = os.environ['DISCORD_BOT_TOKEN']
 
         if token is None:
@@ -83,25 +116,7 @@ class DiscordIngestTool(BaseTool):
 
             logger.debug(f'Created feed [{feed_id}].')
 
-            # Wait for feed to complete, since ingestion happens asychronously
-            done = False
-            time.sleep(5)
-
-            while not done:
-                done = await helpers.is_feed_done(self.graphlit.client, feed_id)
-
-                if done is None:
-                    break
-
-                if not done:
-                    time.sleep(5)
-
-            logger.debug(f'Completed feed [{feed_id}].')
+            return feed_id
         except exceptions.GraphQLClientError as e:
             logger.error(str(e))
             raise ToolException(str(e)) from e
-
-        return await helpers.format_feed_contents(self.graphlit.client, feed_id, search)
-
-    def _run(self, channel_name: str, search: Optional[str] = None, read_limit: Optional[int] = None) -> str:
-        return helpers.run_async(self._arun, channel_name, search, read_limit)
@@ -0,0 +1,119 @@
+import logging
+from typing import Optional, Type, Union, List
+
+from graphlit import Graphlit
+from graphlit_api import exceptions
+from pydantic import BaseModel, Field
+
+from ..base_tool import BaseTool
+from ..exceptions import ToolException
+from ..rerank import Reranker
+from ..results import ContentResult, content_results
+from .. import helpers, urls as url_helpers
+
+logger = logging.getLogger(__name__)
+
+class TargetedCrawlInput(BaseModel):
+    url: str = Field(description="URL of web site to be mapped, and crawled for relevant web pages")
+    query: Optional[str] = Field(description="Text describing the web pages of interest, used to rank the mapped URLs, optional.", default=None)
+    include: Optional[List[str]] = Field(description="Glob patterns of URLs to be crawled, i.e. */blog/*, optional.", default=None)
+    exclude: Optional[List[str]] = Field(description="Glob patterns of URLs not to be crawled, i.e. */tag/*, optional.", default=None)
+    max_depth: Optional[int] = Field(description="Maximum path depth of URLs to be crawled, optional.", default=None)
+    limit: Optional[int] = Field(description="Maximum number of web pages to be crawled, optional.", default=20)
+
+class TargetedCrawlTool(BaseTool):
+    name: str = "Graphlit targeted crawl tool"
+    description: str = """Maps web site, and crawls only the web pages relevant to the query, or matching the URL patterns, into knowledge base.
+    Prefer over the web crawl tool when only a few web pages of a large web site are needed.
+    Returns Markdown text and metadata extracted from web pages."""
+    args_schema: Type[BaseModel] = TargetedCrawlInput
+
+    graphlit: Graphlit = Field(None, exclude=True)
+
+    workflow_id: Optional[str] = Field(None, exclude=True)
+    correlation_id: Optional[str] = Field(None, exclude=True)
+    concurrency: int = Field(8, exclude=True)
+    reranker: Optional[Reranker] = Field(None, exclude=True)
+    structured: bool = Field(False, exclude=True)
+    min_score: Optional[float] = Field(0.01, exclude=True)
+
+    model_config = {
+        "arbitrary_types_allowed": True
+    }
+
+    def __init__(self, graphlit: Optional[Graphlit] = None, workflow_id: Optional[str] = None, correlation_id: Optional[str] = None,
+                 concurrency: int = 8, reranker: Optional[Reranker] = None, structured: bool = False, min_score: Optional[float] = 0.01, **kwargs):
+        """
+        Initializes the TargetedCrawlTool.
+
+        Args:
+            graphlit (Optional[Graphlit]): An optional Graphlit instance to interact with the Graphlit API.
+                If not provided, a new Graphlit instance will be created.
+            workflow_id (Optional[str]): ID for the workflow to use when ingesting web pages. Defaults to None.
+            correlation_id (Optional[str]): Correlation ID for tracking requests. Defaults to None.
+            concurrency (int): Maximum number of web pages ingested at once. Defaults to 8.
+            reranker (Optional[Reranker]): An optional re-ranker, to rank mapped URLs by embedding similarity to the query,
+                rather than by words shared with the URL path.
+            structured (bool): Whether to return ContentResult objects rather than Markdown text. Defaults to False.
+            min_score (Optional[float]): Minimum relevance of a mapped URL to the query, for it to be crawled. Defaults to 0.01,
+                which prunes URLs sharing no words with the query. With a re-ranker, the re-ranker's own minimum score applies instead.
+            **kwargs: Additional keyword arguments for the BaseTool superclass.
+        """
+        super().__init__(**kwargs)
+        self.graphlit = graphlit or Graphlit()
+        self.workflow_id = workflow_id
+        self.correlation_id = correlation_id
+        self.concurrency = concurrency
+        self.reranker = reranker
+        self.structured = structured
+        self.min_score = min_score
+
+    async def _arun(self, url: str, query: Optional[str] = None, include: Optional[List[str]] = None, exclude: Optional[List[str]] = None,
+                    max_depth: Optional[int] = None, limit: Optional[int] = None) -> Optional[Union[str, List[ContentResult]]]:
+        limit = limit if limit is not None else 20 # NOTE: default to 20 web pages
+
+        try:
+            response = await self.graphlit.client.map_web(
+                uri=url,
+                correlation_id=self.correlation_id
+            )
+        except exceptions.GraphQLClientError as e:
+            logger.error(str(e))
+            raise ToolException(str(e)) from e
+
+        # NOTE: normalize only to skip duplicates, since web sites may not serve the normalized form of their URLs
+        mapped = list(url_helpers.unique_urls(response.map_web.results or [], normalize=False)) if response.map_web is not None else []
+
+        selected = url_helpers.filter_urls(mapped, include, exclude, max_depth)
+
+        if query:
+            selected = url_helpers.rank_urls(selected, query, self.reranker, self.min_score)
+
+        selected = selected[:limit]
+
+        logger.debug(f'TargetedCrawlTool: Selected [{len(selected)}] of [{len(mapped)}] mapped URL(s) from [{url}].')
+
+        responses = await helpers.gather_with_concurrency(self._ingest_page, selected, self.concurrency)
+
+        contents = {}
+
+        for page_url, response in zip(selected, responses):
+            if isinstance(response, BaseException):
+                logger.error(f'TargetedCrawlTool: Failed to ingest [{page_url}]: {response}')
+            elif response is not None:
+                contents.setdefault(response.id, response)
+
+        if len(selected) > 0 and all(isinstance(response, BaseException) for response in responses):
+            raise responses[0]
+
+        if self.structured:
+            return content_results(list(contents.values()))
+
+        return await helpers.format_contents(list(contents.values()))
+
+    def _run(self, url: str, query: Optional[str] = None, include: Optional[List[str]] = None, exclude: Optional[List[str]] = None,
+             max_depth: Optional[int] = None, limit: Optional[int] = None) -> Optional[Union[str, List[ContentResult]]]:
+        return helpers.run_async(self._arun, url, query, include, exclude, max_depth, limit)
+
+    async def _ingest_page(self, url: str):
+        return await helpers.ingest_url(self.graphlit.client, url, self.workflow_id, self.correlation_id)
@@ -1,6 +1,7 @@
+import asyncio
 import logging
-import time
-from typing import Optional, Type
+from typing import Optional, Type, Union, List, AsyncIterator, Dict
+from urllib.parse import urlparse
 
 from graphlit import Graphlit
 from graphlit_api import exceptions, input_types, enums
@@ -8,6 +9,8 @@ from pydantic import BaseModel, Field
 
 from ..base_tool import BaseTool
 from ..exceptions import ToolException
+from ..feeds import stream_feed_contents, wait_for_feed
+from ..results import ContentResult, content_results
 from .. import helpers
 
 logger = logging.getLogger(__name__)
@@ -27,12 +30,13 @@ class WebCrawlTool(BaseTool):
 
     workflow_id: Optional[str] = Field(None, exclude=True)
     correlation_id: Optional[str] = Field(None, exclude=True)
+    structured: bool = Field(False, exclude=True)
 
     model_config = {
         "arbitrary_types_allowed": True
     }
 
-    def __init__(self, graphlit: Optional[Graphlit] = None, workflow_id: Optional[str] = None, correlation_id: Optional[str] = None, **kwargs):
+    def __init__(self, graphlit: Optional[Graphlit] = None, workflow_id: Optional[str] = None, correlation_id: Optional[str] = None, structured: bool = False, **kwargs):
         """
         Initializes the WebCrawlTool.
 
@@ -41,16 +45,158 @@ class WebCrawlTool(BaseTool):
                 If not provided, a new Graphlit instance will be created.
             workflow_id (Optional[str]): ID for the workflow to use when ingesting web pages. Defaults to None.
             correlation_id (Optional[str]): Correlation ID for tracking requests. Defaults to None.
+            structured (bool): Whether to return ContentResult objects rather than Markdown text. Defaults to False.
             **kwargs: Additional keyword arguments for the BaseTool superclass.
         """
         super().__init__(**kwargs)
         self.graphlit = graphlit or Graphlit()
         self.workflow_id = workflow_id
         self.correlation_id = correlation_id
+        self.structured = structured
 
-    async def _arun(self, url: str, search: Optional[str] = None, read_limit: Optional[int] = None) -> Optional[str]:
-        feed_id = None
+    async def _arun(self, url: str, search: Optional[str] = None, read_limit: Optional[int] = None) -> Optional[Union[str, List[ContentResult]]]:
+        feed_id = await self._create_feed(url, read_limit)
 
+        try:
+            # Wait for feed to complete, since ingestion happens asychronously
+            await wait_for_feed(self.graphlit.client, feed_id)
+
+            logger.debug(f'Completed feed [{feed_id}].')
+        except exceptions.GraphQLClientError as e:
+            logger.error(str(e))
+            raise ToolException(str(e)) from e
+
+        if self.structured:
+            return content_results(await helpers.query_contents(self.graphlit.client, feed_id, search))
+
+        return await helpers.format_feed_contents(self.graphlit.client, feed_id, search)
+
+    def _run(self, url: str, search: Optional[str] = None, read_limit: Optional[int] = None) -> Optional[Union[str, List[ContentResult]]]:
+        return helpers.run_async(self._arun, url, search, read_limit)
+
+    async def astream(self, url: str, search: Optional[str] = None, read_limit: Optional[int] = None) -> AsyncIterator[Union[str, ContentResult]]:
+        """
+        Yields each content as soon as it's ingested, rather than once the feed is done, so downstream work can start early.
+
+        Accepts the same arguments as the tool.
+        """
+        feed_id = await self._create_feed(url, read_limit)
+
+        async for content in stream_feed_contents(self.graphlit.client, feed_id, search):
+            yield ContentResult.from_content(content) if self.structured else "\n".join(helpers.format_content(content))
+
+    async def acrawl(self, urls: List[str], search: Optional[str] = None, read_limit: Optional[int] = None, read_limits: Optional[Dict[str, int]] = None,
+                     page_budget: Optional[int] = None, concurrency: int = 8) -> Optional[Union[str, List[ContentResult]]]:
+        """
+        Crawls many web sites concurrently, and merges their web pages into one result.
+
+        Feeds are created with at most a fixed number of sites in flight, and all of them are tracked by the shared feed notifier,
+        so wall time is bounded by the slowest sites rather than the sum of all sites.
+
+        Args:
+            urls (List[str]): URLs of web sites to be crawled. Duplicate URLs are crawled once.
+            search (Optional[str]): Text to search for within ingested web pages.
+            read_limit (Optional[int]): Maximum number of web pages to crawl per web site. Defaults to 10.
+            read_limits (Optional[Dict[str, int]]): Maximum number of web pages to crawl for specific domains, i.e. {"www.graphlit.com": 50}.
+            page_budget (Optional[int]): Maximum number of web pages to crawl across all web sites. Sites are skipped once the budget is spent.
+                Pages reserved for a site which fails, or which has fewer pages than its limit, are returned to the budget.
+            concurrency (int): Maximum number of web sites crawled at once. Defaults to 8.
+
+        Returns:
+            Optional[Union[str, List[ContentResult]]]: The web pages of all web sites, in the order of the input URLs.
+        """
+        urls = list(dict.fromkeys(urls))
+        remaining = page_budget
+        in_flight = 0
+
+        # NOTE: notified whenever a crawling site settles its reservation, so sites waiting on a spent budget see refunds
+        settled = asyncio.Condition()
+
+        async def reserve(site_limit: int) -> int:
+            nonlocal remaining, in_flight
+
+            async with settled:
+                # NOTE: skip only once no crawling site can refund pages, rather than as soon as the budget looks spent
+                await settled.wait_for(lambda: remaining > 0 or in_flight == 0)
+
+                site_limit = min(site_limit, remaining)
+                remaining -= site_limit
+
+                if site_limit > 0:
+                    in_flight += 1
+
+                return site_limit
+
+        async def refund(pages: int):
+            nonlocal remaining, in_flight
+
+            async with settled:
+                remaining += pages
+                in_flight -= 1
+
+                settled.notify_all()
+
+        async def crawl(url: str):
+            site_limit = (read_limits or {}).get(urlparse(url).netloc, read_limit if read_limit is not None else 10)
+
+            # NOTE: reserve pages from the budget when the feed is created, since crawls finish in any order
+            if remaining is not None:
+                site_limit = await reserve(site_limit)
+
+            if site_limit <= 0:
+                logger.debug(f'WebCrawlTool: Skipped [{url}], page budget spent.')
+                return []
+
+            crawled = 0
+
+            try:
+                feed_id = await self._create_feed(url, site_limit)
+
+                try:
+                    await wait_for_feed(self.graphlit.client, feed_id)
+                except exceptions.GraphQLClientError as e:
+                    raise ToolException(str(e)) from e
+
+                logger.debug(f'Completed feed [{feed_id}].')
+
+                contents = await helpers.query_contents(self.graphlit.client, feed_id, search) or []
+
+                # NOTE: search results don't count the web pages crawled, so only unsearched sites are refunded when short
+                crawled = site_limit if search is not None else len(contents)
+
+                return contents
+            finally:
+                # NOTE: refund the pages a failed or short site didn't crawl, so sites crawled later can use them
+                if remaining is not None:
+                    await refund(max(site_limit - crawled, 0))
+
+        responses = await helpers.gather_with_concurrency(crawl, urls, concurrency)
+
+        contents = {}
+
+        for url, response in zip(urls, responses):
+            if isinstance(response, BaseException):
+                logger.error(f'WebCrawlTool: Failed to crawl [{url}]: {response}')
+                continue
+
+            for content in response:
+                contents.setdefault(content.id, content)
+
+        if len(urls) > 0 and all(isinstance(response, BaseException) for response in responses):
+            raise responses[0]
+
+        logger.debug(f'WebCrawlTool: Crawled [{len(contents)}] web page(s) from [{len(urls)}] web site(s).')
+
+        if self.structured:
+            return content_results(list(contents.values()))
+
+        return await helpers.format_contents(list(contents.values()))
+
+    def crawl(self, urls: List[str], search: Optional[str] = None, read_limit: Optional[int] = None, read_limits: Optional[Dict[str, int]] = None,
+              page_budget: Optional[int] = None, concurrency: int = 8) -> Optional[Union[str, List[ContentResult]]]:
+        return helpers.run_async(self.acrawl, urls, search, read_limit, read_limits, page_budget, concurrency)
+
+    async def _create_feed(self, url: str, read_limit: Optional[int] = None) -> str:
         try:
             response = await self.graphlit.client.create_feed(
                 feed=input_types.FeedInput(
@@ -72,25 +218,7 @@ class WebCrawlTool(BaseTool):
 
             logger.debug(f'Created feed [{feed_id}].')
 
-            # Wait for feed to complete, since ingestion happens asychronously
-            done = False
-            time.sleep(5)
-
-            while not done:
-                done = await helpers.is_feed_done(self.graphlit.client, feed_id)
-
-                if done is None:
-                    break
-
-                if not done:
-                    time.sleep(5)
-
-            logger.debug(f'Completed feed [{feed_id}].')
+            return feed_id
         except exceptions.GraphQLClientError as e:
             logger.error(str(e))
             raise ToolException(str(e)) from e
-
-        return await helpers.format_feed_contents(self.graphlit.client, feed_id, search)
-
-    def _run(self, url: str, search: Optional[str] = None, read_limit: Optional[int] = None) -> Optional[str]:
-        return helpers.run_async(self._arun, url, search, read_limit)
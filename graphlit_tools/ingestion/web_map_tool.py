@@ -1,5 +1,6 @@
 import logging
-from typing import Optional, Type
+from itertools import islice
+from typing import Optional, Type, Union, List, AsyncIterator
 
 from graphlit import Graphlit
 from graphlit_api import exceptions
@@ -7,52 +8,104 @@ from pydantic import BaseModel, Field
 
 from ..base_tool import BaseTool
 from ..exceptions import ToolException
-from .. import helpers
+from .. import helpers, urls as url_helpers
 
 logger = logging.getLogger(__name__)
 
 class WebMapInput(BaseModel):
     url: str = Field(description="URL of the web page to be mapped")
+    allowed_paths: Optional[List[str]] = Field(description="Path patterns of URLs to be mapped, i.e. /blog/.*, optional.", default=None)
+    excluded_paths: Optional[List[str]] = Field(description="Path patterns of URLs not to be mapped, optional.", default=None)
+    offset: Optional[int] = Field(description="Number of mapped URLs to skip, for paging through large web sites, optional.", default=0)
+    limit: Optional[int] = Field(description="Maximum number of mapped URLs to be returned, optional.", default=None)
+    summarize: Optional[bool] = Field(description="Whether to return counts of URLs by path prefix, rather than the URLs themselves. Use first on large web sites.", default=False)
 
 class WebMapTool(BaseTool):
     name: str = "Graphlit web map tool"
     description: str = """Accepts web page URL as string.
     Enumerates the web pages at or beneath the provided URL using web sitemap.
-    Returns list of mapped URIs from web site."""
+    Returns list of mapped URIs from web site, or a summary of URL counts by path prefix."""
     args_schema: Type[BaseModel] = WebMapInput
 
     graphlit: Graphlit = Field(None, exclude=True)
 
     workflow_id: Optional[str] = Field(None, exclude=True)
     correlation_id: Optional[str] = Field(None, exclude=True)
+    structured: bool = Field(False, exclude=True)
+    summary_depth: int = Field(2, exclude=True)
 
     model_config = {
         "arbitrary_types_allowed": True
     }
 
-    def __init__(self, graphlit: Optional[Graphlit] = None, correlation_id: Optional[str] = None, **kwargs):
+    def __init__(self, graphlit: Optional[Graphlit] = None, correlation_id: Optional[str] = None, structured: bool = False, summary_depth: int = 2, **kwargs):
+        """
+        Initializes the WebMapTool.
+
+        Args:
+            graphlit (Optional[Graphlit]): An optional Graphlit instance to interact with the Graphlit API.
+                If not provided, a new Graphlit instance will be created.
+            correlation_id (Optional[str]): Correlation ID for tracking requests. Defaults to None.
+            structured (bool): Whether to return a list of URLs rather than newline-separated text. Defaults to False.
+            summary_depth (int): Number of path segments grouped in URL summaries. Defaults to 2.
+            **kwargs: Additional keyword arguments for the BaseTool superclass.
+        """
         super().__init__(**kwargs)
         self.graphlit = graphlit or Graphlit()
         self.correlation_id = correlation_id
+        self.structured = structured
+        self.summary_depth = summary_depth
+
+    async def _arun(self, url: str, allowed_paths: Optional[List[str]] = None, excluded_paths: Optional[List[str]] = None,
+                    offset: Optional[int] = None, limit: Optional[int] = None, summarize: Optional[bool] = None) -> Optional[Union[str, List[str]]]:
+        results = await self._map_web(url, allowed_paths, excluded_paths)
+
+        if results is None:
+            return None
+
+        logger.debug(f'Completed web map, found [{len(results)}] results.')
+
+        # NOTE: dedupe and page lazily, so only the requested page of URLs is materialized; URLs are returned as mapped,
+        # since web sites may not serve their normalized form
+        mapped = url_helpers.unique_urls(results, normalize=False)
+
+        if summarize:
+            return url_helpers.summarize_urls(mapped, self.summary_depth)
+
+        start = offset or 0
+
+        page = islice(mapped, start, start + limit if limit is not None else None)
+
+        if self.structured:
+            return list(page)
 
-    async def _arun(self, url: str) -> Optional[str]:
+        return '\n'.join(page)
+
+    def _run(self, url: str, allowed_paths: Optional[List[str]] = None, excluded_paths: Optional[List[str]] = None,
+             offset: Optional[int] = None, limit: Optional[int] = None, summarize: Optional[bool] = None) -> Optional[Union[str, List[str]]]:
+        return helpers.run_async(self._arun, url, allowed_paths, excluded_paths, offset, limit, summarize)
+
+    async def astream(self, url: str, allowed_paths: Optional[List[str]] = None, excluded_paths: Optional[List[str]] = None) -> AsyncIterator[str]:
+        """
+        Yields each distinct URL of the web map, as mapped, without building the joined result text.
+
+        Accepts the same path patterns as the tool.
+        """
+        results = await self._map_web(url, allowed_paths, excluded_paths)
+
+        for mapped_url in url_helpers.unique_urls(results or [], normalize=False):
+            yield mapped_url
+
+    async def _map_web(self, url: str, allowed_paths: Optional[List[str]] = None, excluded_paths: Optional[List[str]] = None) -> Optional[List[str]]:
         try:
             response = await self.graphlit.client.map_web(
                 uri=url,
+                allowed_paths=allowed_paths,
+                excluded_paths=excluded_paths,
                 correlation_id=self.correlation_id
             )
 
-            results = response.map_web.results if response.map_web is not None else None
-
-            if results is not None:
-                logger.debug(f'Completed web map, found [{len(results)}] results.')
-
-                return '\n'.join(result for result in results) if results is not None else None
-            else:
-                return None
+            return response.map_web.results if response.map_web is not None else None
         except exceptions.GraphQLClientError as e:
             logger.error(str(e))
             raise ToolException(str(e)) from e
-
-    def _run(self, url: str) -> Optional[str]:
-        return helpers.run_async(self._arun, url)
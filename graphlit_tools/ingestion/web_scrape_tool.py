@@ -1,5 +1,5 @@
 import logging
-from typing import Optional, Type
+from typing import Optional, Type, Union
 
 from graphlit import Graphlit
 from graphlit_api import exceptions, input_types
@@ -7,6 +7,7 @@ from pydantic import BaseModel, Field
 
 from ..base_tool import BaseTool
 from ..exceptions import ToolException
+from ..results import ContentResult
 from .. import helpers
 
 logger = logging.getLogger(__name__)
@@ -24,12 +25,13 @@ class WebScrapeTool(BaseTool):
 
     workflow_id: Optional[str] = Field(None, exclude=True)
     correlation_id: Optional[str] = Field(None, exclude=True)
+    structured: bool = Field(False, exclude=True)
 
     model_config = {
         "arbitrary_types_allowed": True
     }
 
-    def __init__(self, graphlit: Optional[Graphlit] = None, workflow_id: Optional[str] = None, correlation_id: Optional[str] = None, **kwargs):
+    def __init__(self, graphlit: Optional[Graphlit] = None, workflow_id: Optional[str] = None, correlation_id: Optional[str] = None, structured: bool = False, **kwargs):
         """
         Initializes the WebScrapeTool.
 
@@ -38,14 +40,16 @@ class WebScrapeTool(BaseTool):
                 If not provided, a new Graphlit instance will be created.
             workflow_id (Optional[str]): ID for the workflow to use when ingesting web pages. Defaults to None.
             correlation_id (Optional[str]): Correlation ID for tracking requests. Defaults to None.
+            structured (bool): Whether to return a ContentResult object rather than Markdown text. Defaults to False.
             **kwargs: Additional keyword arguments for the BaseTool superclass.
         """
         super().__init__(**kwargs)
         self.graphlit = graphlit or Graphlit()
         self.workflow_id = workflow_id
         self.correlation_id = correlation_id
+        self.structured = structured
 
-    async def _arun(self, url: str) -> Optional[str]:
+    async def _arun(self, url: str) -> Optional[Union[str, ContentResult]]:
         content_id = None
 
         try:
@@ -74,6 +78,9 @@ class WebScrapeTool(BaseTool):
 
             logger.debug(f'WebScrapeTool: Retrieved content by ID [{content_id}].')
 
+            if self.structured:
+                return ContentResult.from_content(response.content)
+
             results = helpers.format_content(response.content)
 
             text = "\n".join(results)
@@ -83,5 +90,5 @@ class WebScrapeTool(BaseTool):
             logger.error(str(e))
             raise ToolException(str(e)) from e
 
-    def _run(self, url: str) -> Optional[str]:
+    def _run(self, url: str) -> Optional[Union[str, ContentResult]]:
         return helpers.run_async(self._arun, url)
@@ -1,24 +1,33 @@
 import logging
-from typing import Optional, Type
+from collections import Counter
+from typing import Dict, Optional, Type
 
 from graphlit import Graphlit
 from graphlit_api import exceptions, enums
 from pydantic import BaseModel, Field
 
 from ..base_tool import BaseTool
+from ..cache import ResultCache
 from ..exceptions import ToolException
+from ..queries import QueryIndex, normalize_query
 from .. import helpers
 
 logger = logging.getLogger(__name__)
 
+# NOTE: shared across tool instances, since agents often recreate their tools; expires hourly, since web results go stale
+search_cache = ResultCache(max_size=1024, ttl=3600)
+
 class WebSearchInput(BaseModel):
     search: str = Field(description="Text to search for within web pages across the Internet")
     search_limit: Optional[int] = Field(description="Maximum number of web pages to be returned from web search", default=10)
+    fetch_limit: Optional[int] = Field(description="Number of top web pages to be fetched in full, rather than returned as snippets, optional.", default=None)
 
-class WebSearchTool(BaseTool):
+# NOTE: fetch and cache options are separate fields and constructor arguments, like the other tools' options
+class WebSearchTool(BaseTool): # pylint: disable=too-many-instance-attributes
     name: str = "Graphlit web search tool"
     description: str = """Accepts search query as string.
     Performs web search based on search query. Format the search query as what would be entered into a Google search.
+    Optionally fetches the full text of the top web pages, in place of a follow-up web scrape.
     Returns URL, title and relevant Markdown text from resulting web pages."""
     args_schema: Type[BaseModel] = WebSearchInput
 
@@ -26,18 +35,102 @@ class WebSearchTool(BaseTool):
 
     workflow_id: Optional[str] = Field(None, exclude=True)
     correlation_id: Optional[str] = Field(None, exclude=True)
+    fetch_timeout: Optional[float] = Field(30.0, exclude=True)
+    fetch_budget: Optional[int] = Field(None, exclude=True)
+    concurrency: int = Field(8, exclude=True)
+
+    cache: Optional[ResultCache] = Field(None, exclude=True)
+    query_index: Optional[QueryIndex] = Field(None, exclude=True)
+    counters: Counter = Field(None, exclude=True)
 
     model_config = {
         "arbitrary_types_allowed": True
     }
 
-    def __init__(self, graphlit: Optional[Graphlit] = None, correlation_id: Optional[str] = None, **kwargs):
+    def __init__(self, graphlit: Optional[Graphlit] = None, workflow_id: Optional[str] = None, correlation_id: Optional[str] = None, # pylint: disable=too-many-arguments
+                 fetch_timeout: Optional[float] = 30.0, fetch_budget: Optional[int] = None, concurrency: int = 8,
+                 cache: Optional[ResultCache] = None, use_cache: bool = True, query_index: Optional[QueryIndex] = None, **kwargs):
+        """
+        Initializes the WebSearchTool.
+
+        Args:
+            graphlit (Optional[Graphlit]): An optional Graphlit instance to interact with the Graphlit API.
+                If not provided, a new Graphlit instance will be created.
+            workflow_id (Optional[str]): ID for the workflow to use when fetching web pages. Defaults to None.
+            correlation_id (Optional[str]): Correlation ID for tracking requests. Defaults to None.
+            fetch_timeout (Optional[float]): Maximum time to fetch each web page, in seconds. Defaults to 30.
+            fetch_budget (Optional[int]): Maximum number of characters returned when fetching web pages. Defaults to None, for no limit.
+            concurrency (int): Maximum number of web pages fetched at once. Defaults to 8.
+            cache (Optional[ResultCache]): Cache of web search results, keyed by normalized search text and search limit.
+                Defaults to a cache shared by all WebSearchTool instances, with entries expiring after an hour.
+            use_cache (bool): Whether to reuse web search results from the cache. Defaults to True.
+            query_index (Optional[QueryIndex]): An optional index of cached searches, to also reuse the results of near-duplicate searches,
+                such as reworded agent queries. Share it along with the cache.
+            **kwargs: Additional keyword arguments for the BaseTool superclass.
+        """
         super().__init__(**kwargs)
         self.graphlit = graphlit or Graphlit()
+        self.workflow_id = workflow_id
         self.correlation_id = correlation_id
+        self.fetch_timeout = fetch_timeout
+        self.fetch_budget = fetch_budget
+        self.concurrency = concurrency
+        self.cache = (cache if cache is not None else search_cache) if use_cache else None
+        self.query_index = query_index if use_cache else None
+        self.counters = Counter()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Get the web search, cache hit and near-duplicate hit statistics of this tool."""
+        return {
+            "searches": self.counters["searches"],
+            "cache_hits": self.counters["cache_hits"],
+            "near_duplicate_hits": self.counters["near_duplicate_hits"],
+            "cache_size": len(self.cache) if self.cache is not None else 0
+        }
+
+    async def _arun(self, search: str, search_limit: Optional[int] = None, fetch_limit: Optional[int] = None) -> Optional[str]:
+        results = await self._search_web(search, search_limit)
+
+        if results is None:
+            return None
+
+        if not fetch_limit:
+            return '\n\n'.join(self._format_result(result) for result in results)
+
+        return helpers.join_within_budget(await self._fetch_results(results, fetch_limit), self.fetch_budget)
+
+    def _run(self, search: str, search_limit: Optional[int] = None, fetch_limit: Optional[int] = None) -> Optional[str]:
+        return helpers.run_async(self._arun, search, search_limit, fetch_limit)
+
+    async def _search_web(self, search: str, search_limit: Optional[int] = None):
+        key = (normalize_query(search), search_limit)
+
+        if self.cache is not None:
+            results = self.cache.get(key)
+
+            if results is not None:
+                self.counters["cache_hits"] += 1
+
+                logger.debug(f'WebSearchTool: Reused cached results for search [{search}].')
+
+                return results
+
+            if self.query_index is not None:
+                similar_key = self.query_index.lookup(search, accept=lambda candidate: candidate[1] == search_limit and candidate in self.cache)
+
+                results = self.cache.get(similar_key) if similar_key is not None else None
+
+                if results is not None:
+                    self.counters["near_duplicate_hits"] += 1
+
+                    logger.debug(f'WebSearchTool: Reused cached results of search [{similar_key[0]}] for search [{search}].')
+
+                    return results
 
-    async def _arun(self, search: str, search_limit: Optional[int] = None) -> Optional[str]:
         try:
+            self.counters["searches"] += 1
+
             response = await self.graphlit.client.search_web(
                 service=enums.SearchServiceTypes.TAVILY,
                 text=search,
@@ -46,16 +139,37 @@ class WebSearchTool(BaseTool):
             )
 
             results = response.search_web.results if response.search_web is not None else None
-
-            if results is not None:
-                logger.debug(f'Completed web search, found [{len(results)}] results.')
-
-                return '\n\n'.join(f'URL: {result.uri}\nTitle: {result.title}\n\n{result.text}' for result in results) if results is not None else None
-            else:
-                return None
         except exceptions.GraphQLClientError as e:
             logger.error(str(e))
             raise ToolException(str(e)) from e
 
-    def _run(self, search: str, search_limit: Optional[int] = None) -> Optional[str]:
-        return helpers.run_async(self._arun, search, search_limit)
+        if results is not None:
+            logger.debug(f'Completed web search, found [{len(results)}] results.')
+
+            if self.cache is not None:
+                self.cache.set(key, results)
+
+                if self.query_index is not None:
+                    self.query_index.add(key, search)
+
+        return results
+
+    async def _fetch_results(self, results, fetch_limit: int):
+        # NOTE: all result URLs are fetched concurrently, and the first pages to succeed win,
+        # so a slow or failing web page is replaced by the next result rather than delaying the search
+        async def fetch(result):
+            return await helpers.ingest_url(self.graphlit.client, result.uri, self.workflow_id, self.correlation_id)
+
+        fetched = await helpers.gather_first(fetch, results, fetch_limit, self.fetch_timeout, self.concurrency)
+
+        logger.debug(f'Fetched [{len(fetched)}] of [{len(results)}] web search results.')
+
+        # Keep search rank order, with fetched web pages in place of their snippets
+        return [
+            '\n'.join(helpers.format_content(fetched[index])) if index in fetched else self._format_result(result)
+            for index, result in enumerate(results)
+        ]
+
+    @staticmethod
+    def _format_result(result) -> str:
+        return f'URL: {result.uri}\nTitle: {result.title}\n\n{result.text}'
@@ -0,0 +1,44 @@
+from typing import Any, cast
+from .base_tool import BaseTool
+from . import adapter
+
+StructuredTool: Any = None
+
+try:
+    from langchain_core.tools import StructuredTool
+except ImportError:
+    StructuredTool = None
+
+class LangChainConverter:
+    """Tool to convert Graphlit tools into LangChain tools, for use with LangChain and LangGraph."""
+
+    @classmethod
+    def from_tool(cls, tool: Any, **kwargs: Any) -> Any:
+        if StructuredTool is None:
+            raise ImportError(
+                "LangChainConverter requires the langchain-core package. "
+                "Install it using pip install graphlit-tools[langchain]."
+            )
+
+        if not isinstance(tool, BaseTool):
+            raise ValueError(f"Expected a Graphlit tool, got {type(tool)}")
+
+        graphlit_tool = cast(BaseTool, tool)
+
+        if graphlit_tool.args_schema is None:
+            raise ValueError("Invalid arguments JSON schema.")
+
+        def run(**arguments: Any) -> str:
+            return adapter.format_result(adapter.invoke(graphlit_tool, arguments))
+
+        async def arun(**arguments: Any) -> str:
+            return adapter.format_result(await adapter.ainvoke(graphlit_tool, arguments))
+
+        return StructuredTool.from_function(
+            func=run,
+            coroutine=arun,
+            name=graphlit_tool.function_name,
+            description=graphlit_tool.description,
+            args_schema=graphlit_tool.args_schema,
+            **kwargs,
+        )
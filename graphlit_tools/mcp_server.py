@@ -0,0 +1,196 @@
+"""
+Model Context Protocol (MCP) server, which exposes Graphlit tools over stdio.
+
+Run with python -m graphlit_tools.mcp_server, after setting the Graphlit environment variables.
+"""
+import asyncio
+import contextlib
+import json
+import logging
+import sys
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from .base_tool import BaseTool
+from . import adapter
+
+logger = logging.getLogger(__name__)
+
+PROTOCOL_VERSION = "2024-11-05"
+
+# JSON-RPC error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+
+class MCPServer:
+    """
+    MCP server for Graphlit tools, which handles tool calls concurrently.
+
+    Tool definitions are exported once, and requests are dispatched to each tool's async path,
+    so a slow tool call doesn't hold up other requests.
+
+    Args:
+        tools (List[BaseTool]): The tools to be served.
+        name (str): The server name reported to clients. Defaults to graphlit-tools.
+        version (str): The server version reported to clients. Defaults to 1.0.0.
+    """
+    def __init__(self, tools: List[BaseTool], name: str = "graphlit-tools", version: str = "1.0.0"):
+        self.tools = {tool.function_name: tool for tool in tools}
+        self.definitions = [tool.to_mcp_tool() for tool in tools]
+        self.name = name
+        self.version = version
+
+    async def handle(self, message: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Handles a JSON-RPC message.
+
+        Args:
+            message (Dict[str, Any]): The JSON-RPC request or notification.
+
+        Returns:
+            Optional[Dict[str, Any]]: The JSON-RPC response, or None for notifications.
+        """
+        request_id = message.get("id")
+        method = message.get("method")
+
+        # NOTE: notifications have no ID, and expect no response
+        if request_id is None:
+            return None
+
+        if not isinstance(method, str):
+            return _error(request_id, INVALID_REQUEST, "Invalid request.")
+
+        handler = self._handlers.get(method)
+
+        if handler is None:
+            return _error(request_id, METHOD_NOT_FOUND, f"Method not found [{method}].")
+
+        return await handler(request_id, message.get("params") or {})
+
+    @property
+    def _handlers(self) -> Dict[str, Callable[[Any, Dict[str, Any]], Awaitable[Dict[str, Any]]]]:
+        return {
+            "initialize": self._initialize,
+            "ping": self._ping,
+            "tools/list": self._list_tools,
+            "tools/call": self._call_tool
+        }
+
+    async def _initialize(self, request_id: Any, _params: Dict[str, Any]) -> Dict[str, Any]:
+        return _result(request_id, {
+            "protocolVersion": PROTOCOL_VERSION,
+            "capabilities": { "tools": {} },
+            "serverInfo": { "name": self.name, "version": self.version }
+        })
+
+    async def _ping(self, request_id: Any, _params: Dict[str, Any]) -> Dict[str, Any]:
+        return _result(request_id, {})
+
+    async def _list_tools(self, request_id: Any, _params: Dict[str, Any]) -> Dict[str, Any]:
+        return _result(request_id, { "tools": self.definitions })
+
+    async def _call_tool(self, request_id: Any, params: Dict[str, Any]) -> Dict[str, Any]:
+        tool = self.tools.get(params.get("name"))
+
+        if tool is None:
+            return _error(request_id, INVALID_PARAMS, f"Unknown tool [{params.get('name')}].")
+
+        try:
+            result = await adapter.ainvoke(tool, params.get("arguments"))
+
+            return _result(request_id, {
+                "content": [{ "type": "text", "text": adapter.format_result(result) }],
+                "isError": False
+            })
+        # NOTE: any tool failure, including argument validation, is reported to the model as a result, rather than ending the request
+        except Exception as e: # pylint: disable=broad-exception-caught
+            logger.error(f'MCPServer: Failed to call tool [{tool.function_name}]: {e}')
+
+            return _result(request_id, {
+                "content": [{ "type": "text", "text": str(e) }],
+                "isError": True
+            })
+
+    async def handle_line(self, line: bytes) -> Optional[Dict[str, Any]]:
+        try:
+            message = json.loads(line)
+        except ValueError:
+            return _error(None, PARSE_ERROR, "Parse error.")
+
+        if not isinstance(message, dict):
+            return _error(None, INVALID_REQUEST, "Invalid request.")
+
+        return await self.handle(message)
+
+    async def serve_lines(self, read_line: Callable[[], Awaitable[bytes]], write_line: Callable[[bytes], Awaitable[None]]):
+        """
+        Serves newline-delimited JSON-RPC messages, handling each request as its own task, until the input is closed.
+
+        Args:
+            read_line (Callable[[], Awaitable[bytes]]): Reads the next line, returning empty bytes once closed.
+            write_line (Callable[[bytes], Awaitable[None]]): Writes a line, including its newline.
+        """
+        write_lock = asyncio.Lock()
+        pending = set()
+
+        async def respond(line: bytes):
+            response = await self.handle_line(line)
+
+            if response is None:
+                return
+
+            async with write_lock:
+                await write_line(json.dumps(response).encode("utf-8") + b"\n")
+
+        while True:
+            line = await read_line()
+
+            if not line:
+                break
+
+            if not line.strip():
+                continue
+
+            task = asyncio.create_task(respond(line))
+
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def serve_stdio(self):
+        """
+        Serves newline-delimited JSON-RPC messages over stdin and stdout, until stdin is closed.
+        """
+        loop = asyncio.get_running_loop()
+
+        # NOTE: stdout carries the protocol, so anything else printed while serving goes to stderr instead
+        output = sys.stdout.buffer
+
+        async def read_line() -> bytes:
+            # NOTE: read stdin on a thread, since pipes aren't supported by every event loop
+            return await loop.run_in_executor(None, sys.stdin.buffer.readline)
+
+        async def write_line(line: bytes):
+            output.write(line)
+            output.flush()
+
+        with contextlib.redirect_stdout(sys.stderr):
+            await self.serve_lines(read_line, write_line)
+
+def _result(request_id: Any, result: Dict[str, Any]) -> Dict[str, Any]:
+    return { "jsonrpc": "2.0", "id": request_id, "result": result }
+
+def _error(request_id: Any, code: int, message: str) -> Dict[str, Any]:
+    return { "jsonrpc": "2.0", "id": request_id, "error": { "code": code, "message": message } }
+
+def main():
+    # NOTE: stdout carries the protocol, so log to stderr
+    logging.basicConfig(stream=sys.stderr, level=logging.INFO)
+
+    asyncio.run(MCPServer(adapter.default_tools()).serve_stdio())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+import random
+import re
+import threading
+import unicodedata
+import zlib
+from collections import OrderedDict
+from typing import Dict, FrozenSet, Hashable, List, Optional, Tuple
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+# NOTE: question words are kept, since "when was X founded" and "who founded X" ask different things
+STOPWORDS = frozenset({
+    "a", "about", "an", "and", "are", "as", "at", "be", "by", "can", "do", "does", "for", "from", "i",
+    "in", "is", "it", "me", "of", "on", "or", "please", "show", "tell", "that", "the", "this", "to", "will",
+    "with"
+})
+
+# NOTE: Mersenne prime, for universal hashing of 32-bit token hashes
+MINHASH_PRIME = (1 << 61) - 1
+
+# NOTE: fixed, so signatures are comparable across indexes and processes
+MINHASH_SEED = 42
+
+def query_tokens(text: str) -> List[str]:
+    """
+    Splits query text into lowercase words, without stopwords.
+
+    Args:
+        text (str): The query text.
+
+    Returns:
+        List[str]: The words, in their original order. If every word is a stopword, all words are kept.
+    """
+    tokens = TOKEN_PATTERN.findall(unicodedata.normalize("NFKC", text).casefold())
+
+    return [token for token in tokens if token not in STOPWORDS] or tokens
+
+def normalize_query(text: str) -> str:
+    """
+    Normalizes query text, so queries differing only in case, whitespace, punctuation or stopwords compare equal.
+
+    Args:
+        text (str): The query text.
+
+    Returns:
+        str: The normalized query text.
+    """
+    return " ".join(query_tokens(text))
+
+def _minhash_coefficients(num_perm: int) -> List[Tuple[int, int]]:
+    rng = random.Random(MINHASH_SEED)
+
+    # NOTE: random odd multipliers below the prime, so each permutation is an independent universal hash
+    return [(rng.randrange(1, MINHASH_PRIME - 1) | 1, rng.randrange(MINHASH_PRIME)) for _ in range(num_perm)]
+
+# NOTE: keeps its settings and hit counters public, along with the private signature and band indexes
+class QueryIndex: # pylint: disable=too-many-instance-attributes
+    """
+    Thread-safe index of recent queries, for finding near-duplicate queries by MinHash signature of their words.
+
+    Signatures are split into bands, so a lookup only compares queries sharing at least one band, rather than every query.
+
+    Args:
+        threshold (float): Minimum estimated word overlap (Jaccard similarity) for a near-duplicate query. Defaults to 0.8.
+        num_perm (int): Number of hash functions per signature. Defaults to 64.
+        bands (int): Number of signature bands. Defaults to 16.
+        max_size (int): Maximum number of queries to keep. Oldest queries are evicted first. Defaults to 1024.
+    """
+    def __init__(self, threshold: float = 0.8, num_perm: int = 64, bands: int = 16, max_size: int = 1024):
+        if num_perm % bands != 0:
+            raise ValueError(f'Number of hash functions [{num_perm}] must be a multiple of the number of bands [{bands}].')
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._coefficients = _minhash_coefficients(num_perm)
+        self._signatures: OrderedDict[Hashable, Tuple[int, ...]] = OrderedDict()
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], set] = {}
+        self._lock = threading.Lock()
+
+    def signature(self, tokens: FrozenSet[str]) -> Tuple[int, ...]:
+        """
+        Gets the MinHash signature of a set of words.
+
+        Args:
+            tokens (FrozenSet[str]): The words.
+
+        Returns:
+            Tuple[int, ...]: The signature.
+        """
+        hashes = [zlib.crc32(token.encode("utf-8")) for token in tokens] or [0]
+
+        return tuple(min((a * value + b) % MINHASH_PRIME for value in hashes) for a, b in self._coefficients)
+
+    def _band_keys(self, signature: Tuple[int, ...]) -> List[Tuple[int, Tuple[int, ...]]]:
+        rows = self.num_perm // self.bands
+
+        return [(band, signature[band * rows:(band + 1) * rows]) for band in range(self.bands)]
+
+    def add(self, key: Hashable, text: str) -> None:
+        """
+        Adds a query to the index.
+
+        Args:
+            key (Hashable): The key returned by lookups of near-duplicate queries, i.e. a cache key.
+            text (str): The query text.
+        """
+        signature = self.signature(frozenset(query_tokens(text)))
+
+        with self._lock:
+            if key in self._signatures:
+                self._remove(key)
+
+            self._signatures[key] = signature
+
+            for band_key in self._band_keys(signature):
+                self._buckets.setdefault(band_key, set()).add(key)
+
+            while len(self._signatures) > self.max_size:
+                self._remove(next(iter(self._signatures)))
+
+    def _remove(self, key: Hashable) -> None:
+        signature = self._signatures.pop(key)
+
+        for band_key in self._band_keys(signature):
+            bucket = self._buckets.get(band_key)
+
+            if bucket is not None:
+                bucket.discard(key)
+
+                if not bucket:
+                    del self._buckets[band_key]
+
+    def lookup(self, text: str, accept=None) -> Optional[Hashable]:
+        """
+        Finds the most similar indexed query, at or above the similarity threshold.
+
+        Args:
+            text (str): The query text.
+            accept (Optional[Callable[[Hashable], bool]]): Optional filter of candidate keys, i.e. to skip expired cache keys.
+
+        Returns:
+            Optional[Hashable]: The key of the near-duplicate query, or None if there is none.
+        """
+        signature = self.signature(frozenset(query_tokens(text)))
+
+        best_key, best_score = None, self.threshold
+
+        with self._lock:
+            candidates = set()
+
+            for band_key in self._band_keys(signature):
+                candidates.update(self._buckets.get(band_key, ()))
+
+            for key in candidates:
+                if accept is not None and not accept(key):
+                    continue
+
+                score = sum(1 for left, right in zip(signature, self._signatures[key]) if left == right) / self.num_perm
+
+                if score >= best_score:
+                    best_key, best_score = key, score
+
+            if best_key is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        return best_key
+
+    def __len__(self) -> int:
+        return len(self._signatures)
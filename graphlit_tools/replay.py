@@ -0,0 +1,200 @@
+"""
+Record and replay of Graphlit API calls, for deterministic load testing without network access.
+
+Recording wraps the client's execute method, and captures each GraphQL operation, its variables and
+the raw response into a gzip-compressed JSON lines fixture file. Replay serves those responses back
+through the same method, so the generated client still parses them into its response models.
+"""
+import asyncio
+import enum
+import gzip
+import hashlib
+import itertools
+import json
+import time
+from collections import defaultdict
+from typing import Any, Dict, Iterator, List, Optional
+
+import httpx
+from graphlit import Graphlit
+from pydantic import BaseModel
+
+from .exceptions import ToolException
+
+def _canonical(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(by_alias=True, exclude_unset=True, mode="json")
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, dict):
+        return {key: _canonical(item) for key, item in value.items() if item is not None}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(item) for item in value]
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+
+    # NOTE: unset sentinels and other placeholders aren't sent, so leave them out of the key
+    return None
+
+def fixture_key(operation_name: Optional[str], variables: Optional[Dict[str, Any]]) -> str:
+    """
+    Gets the key matching a recorded response to a request, from its operation name and variables.
+
+    Args:
+        operation_name (Optional[str]): The GraphQL operation name, i.e. QueryContents.
+        variables (Optional[Dict[str, Any]]): The GraphQL variables.
+
+    Returns:
+        str: The fixture key.
+    """
+    canonical = json.dumps(_canonical(variables or {}), sort_keys=True, separators=(",", ":"))
+
+    return f"{operation_name}:{hashlib.sha1(canonical.encode('utf-8')).hexdigest()}"
+
+class Recorder:
+    """
+    Records Graphlit API calls made through a client, while active.
+
+    Use as a context manager, then save the records as a fixture file.
+
+    Args:
+        client: The Graphlit API client, i.e. graphlit.client.
+    """
+    def __init__(self, client: Any):
+        self.client = client
+        self.records: List[Dict[str, Any]] = []
+
+        self._execute = None
+
+    def __enter__(self) -> "Recorder":
+        self._execute = self.client.execute
+
+        async def execute(query: str, operation_name: Optional[str] = None, variables: Optional[Dict[str, Any]] = None, **kwargs: Any) -> httpx.Response:
+            start = time.perf_counter()
+
+            response = await self._execute(query=query, operation_name=operation_name, variables=variables, **kwargs)
+
+            self.records.append({
+                "operation": operation_name,
+                "key": fixture_key(operation_name, variables),
+                "variables": _canonical(variables or {}),
+                "status": response.status_code,
+                "body": response.text,
+                "elapsed": time.perf_counter() - start,
+            })
+
+            return response
+
+        self.client.execute = execute
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # NOTE: remove the instance attribute, so the class method is used again
+        del self.client.execute
+
+        self._execute = None
+
+    def save(self, path: str):
+        """
+        Saves the records as a gzip-compressed JSON lines fixture file.
+
+        Args:
+            path (str): The fixture file path, i.e. fixtures.jsonl.gz.
+        """
+        with gzip.open(path, "wt", encoding="utf-8") as file:
+            for record in self.records:
+                file.write(json.dumps(record) + "\n")
+
+def load_fixtures(path: str) -> List[Dict[str, Any]]:
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        return [json.loads(line) for line in file if line.strip()]
+
+class Replayer:
+    """
+    Replays recorded Graphlit API responses, in place of network calls.
+
+    Requests are matched to recordings by operation name and variables. If strict is False, a request with
+    unrecorded variables gets the recordings for its operation in turn, so varied load can be driven from few recordings.
+
+    Args:
+        records (List[Dict[str, Any]]): The recorded API calls.
+        speed (Optional[float]): Replay speed relative to the recorded latency, i.e. 2.0 for twice as fast.
+            Defaults to None, for no delay.
+        strict (bool): Whether to fail requests without a recording for their exact variables. Defaults to False.
+    """
+    def __init__(self, records: List[Dict[str, Any]], speed: Optional[float] = None, strict: bool = False):
+        self.speed = speed
+        self.strict = strict
+
+        by_key = defaultdict(list)
+        by_operation = defaultdict(list)
+
+        for record in records:
+            by_key[record["key"]].append(record)
+            by_operation[record["operation"]].append(record)
+
+        self._by_key: Dict[str, Iterator[Dict[str, Any]]] = {key: itertools.cycle(items) for key, items in by_key.items()}
+        self._by_operation: Dict[str, Iterator[Dict[str, Any]]] = {operation: itertools.cycle(items) for operation, items in by_operation.items()}
+
+    @classmethod
+    def from_file(cls, path: str, speed: Optional[float] = None, strict: bool = False) -> "Replayer":
+        return cls(load_fixtures(path), speed, strict)
+
+    def install(self, client: Any) -> Any:
+        """
+        Replaces the client's execute method with replay.
+
+        Args:
+            client: The Graphlit API client, i.e. graphlit.client.
+
+        Returns:
+            The client.
+        """
+        # NOTE: the client calls execute with keyword arguments, so the query argument keeps its name, though responses are matched without it
+        async def execute(query: str, operation_name: Optional[str] = None, variables: Optional[Dict[str, Any]] = None, **_kwargs: Any) -> httpx.Response: # pylint: disable=unused-argument
+            return await self.execute(client.url, operation_name, variables)
+
+        client.execute = execute
+
+        return client
+
+    async def execute(self, url: str, operation_name: Optional[str], variables: Optional[Dict[str, Any]]) -> httpx.Response:
+        records = self._by_key.get(fixture_key(operation_name, variables))
+
+        if records is None and not self.strict:
+            records = self._by_operation.get(operation_name)
+
+        if records is None:
+            raise ToolException(f'No recorded response for operation [{operation_name}].')
+
+        record = next(records)
+
+        if self.speed:
+            await asyncio.sleep(record["elapsed"] / self.speed)
+
+        return httpx.Response(
+            record["status"],
+            content=record["body"].encode("utf-8"),
+            headers={ "content-type": "application/json" },
+            request=httpx.Request("POST", url or "http://replay.invalid")
+        )
+
+def replay_graphlit(path: str, speed: Optional[float] = None, strict: bool = False):
+    """
+    Creates a Graphlit instance, which replays recorded API responses rather than calling the Graphlit API.
+
+    Args:
+        path (str): The fixture file path.
+        speed (Optional[float]): Replay speed relative to the recorded latency. Defaults to None, for no delay.
+        strict (bool): Whether to fail requests without a recording for their exact variables. Defaults to False.
+
+    Returns:
+        Graphlit: The Graphlit instance, to be passed to tool constructors.
+    """
+    # NOTE: a placeholder token avoids requiring a JWT secret, since no requests reach the API
+    graphlit = Graphlit(token="replay", api_uri="http://replay.invalid/graphql")
+
+    Replayer.from_file(path, speed, strict).install(graphlit.client)
+
+    return graphlit
@@ -0,0 +1,131 @@
+import re
+import zlib
+from functools import lru_cache
+from typing import Any, Callable, List, Optional, Protocol, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+class Embedder(Protocol):
+    """Protocol for embedders, which convert texts into a matrix with one embedding row per text."""
+
+    def embed(self, texts: Sequence[str]) -> Any:
+        ...
+
+@lru_cache(maxsize=65536)
+def _token_bucket(token: str, dimensions: int) -> Tuple[int, float]:
+    digest = zlib.crc32(token.encode("utf-8"))
+
+    return digest % dimensions, 1.0 if digest & 0x80000000 else -1.0
+
+class HashingEmbedder:
+    """
+    Deterministic feature-hashing embedder, which needs no model or network access.
+
+    Each lowercased word is hashed into one of a fixed number of signed buckets, so texts sharing words
+    have similar embeddings. Useful for offline tests, and as a cheap lexical re-ranker.
+
+    Args:
+        dimensions (int): Number of embedding dimensions. Defaults to 256.
+    """
+    def __init__(self, dimensions: int = 256):
+        if np is None:
+            raise ImportError(
+                "HashingEmbedder requires the numpy package. "
+                "Install it using pip install graphlit-tools[rerank]."
+            )
+
+        self.dimensions = dimensions
+
+    def embed(self, texts: Sequence[str]) -> Any:
+        matrix = np.zeros((len(texts), self.dimensions), dtype=np.float32)
+
+        for row, text in enumerate(texts):
+            for token in TOKEN_PATTERN.findall(text.lower()):
+                column, sign = _token_bucket(token, self.dimensions)
+
+                matrix[row, column] += sign
+
+        return matrix
+
+def cosine_similarity(query: Any, matrix: Any) -> Any:
+    """
+    Scores every row of a matrix against a query vector, with one vectorized matrix operation.
+
+    Args:
+        query: Query embedding vector.
+        matrix: Candidate embeddings, one row per candidate.
+
+    Returns:
+        Cosine similarity of each candidate to the query.
+    """
+    query_norm = np.linalg.norm(query)
+    row_norms = np.linalg.norm(matrix, axis=1)
+
+    # NOTE: pylint can't infer the members of NumPy's finfo
+    return (matrix @ query) / np.maximum(row_norms * query_norm, np.finfo(np.float32).eps) # pylint: disable=no-member
+
+class Reranker:
+    """
+    Client-side re-ranker, which reorders and prunes results by cosine similarity to the query.
+
+    Args:
+        embedder (Optional[Embedder]): Embedder for the query and candidate texts. Defaults to a HashingEmbedder.
+        min_score (Optional[float]): Minimum cosine similarity for a result to be kept. Defaults to None, for no pruning.
+    """
+    def __init__(self, embedder: Optional[Embedder] = None, min_score: Optional[float] = None):
+        if np is None:
+            raise ImportError(
+                "Reranker requires the numpy package. "
+                "Install it using pip install graphlit-tools[rerank]."
+            )
+
+        self.embedder = embedder or HashingEmbedder()
+        self.min_score = min_score
+
+    def score(self, query: str, texts: Sequence[str]) -> Any:
+        """
+        Scores candidate texts against the query.
+
+        Args:
+            query (str): The query text.
+            texts (Sequence[str]): The candidate texts.
+
+        Returns:
+            Cosine similarity of each candidate text to the query.
+        """
+        if len(texts) == 0:
+            return np.zeros(0, dtype=np.float32)
+
+        embeddings = np.asarray(self.embedder.embed([query, *texts]), dtype=np.float32)
+
+        return cosine_similarity(embeddings[0], embeddings[1:])
+
+    def rerank(self, query: str, items: Sequence[Any], key: Callable[[Any], str] = str, limit: Optional[int] = None) -> List[Any]:
+        """
+        Reorders items by similarity to the query, dropping items below the minimum score.
+
+        Args:
+            query (str): The query text.
+            items (Sequence[Any]): The items to be re-ranked.
+            key (Callable[[Any], str]): Function returning the text of an item. Defaults to str.
+            limit (Optional[int]): Maximum number of items to return. Defaults to None, for all items.
+
+        Returns:
+            List[Any]: The items, most similar first.
+        """
+        scores = self.score(query, [key(item) for item in items])
+
+        order = np.argsort(-scores, kind="stable")
+
+        if self.min_score is not None:
+            order = order[scores[order] >= self.min_score]
+
+        if limit is not None:
+            order = order[:limit]
+
+        return [items[index] for index in order]
@@ -0,0 +1,169 @@
+from dataclasses import dataclass, field
+from typing import Any, Iterable, List, Optional, Tuple
+
+from . import helpers
+
+# NOTE: flat dataclass mirroring the content fields, so it has more attributes than usual
+@dataclass(slots=True)
+class ContentResult: # pylint: disable=too-many-instance-attributes
+    """
+    Lightweight content result, for consumers which don't need Markdown text.
+
+    Only the metadata fields and text chunks of the content are kept, rather than the content returned from the Graphlit API,
+    and Markdown is rendered from them only when requested.
+
+    Attributes:
+        id (str): The content ID.
+        type (Optional[Any]): The content type.
+        name (Optional[str]): The content name.
+        uri (Optional[str]): The content URI.
+        file_type (Optional[Any]): The file type, for file contents.
+        file_name (Optional[str]): The file name, for file contents.
+        creation_date (Optional[Any]): The ingestion date.
+        original_date (Optional[Any]): The authored date.
+        relevance (Optional[float]): The search relevance, if returned from a search query.
+        issue (Optional[Any]): The issue metadata, for issue contents.
+        email (Optional[Any]): The email metadata, for email contents.
+        document (Optional[Any]): The document metadata.
+        audio (Optional[Any]): The audio metadata.
+        image (Optional[Any]): The image metadata.
+        links (Optional[List[Any]]): The links, for web page contents.
+        text_chunks (Tuple[ContentChunk, ...]): The text chunks of the content.
+    """
+    id: str
+    type: Optional[Any] = None
+    name: Optional[str] = None
+    uri: Optional[str] = None
+    file_type: Optional[Any] = None
+    file_name: Optional[str] = None
+    creation_date: Optional[Any] = None
+    original_date: Optional[Any] = None
+    relevance: Optional[float] = None
+    issue: Optional[Any] = field(default=None, repr=False, compare=False)
+    email: Optional[Any] = field(default=None, repr=False, compare=False)
+    document: Optional[Any] = field(default=None, repr=False, compare=False)
+    audio: Optional[Any] = field(default=None, repr=False, compare=False)
+    image: Optional[Any] = field(default=None, repr=False, compare=False)
+    links: Optional[List[Any]] = field(default=None, repr=False, compare=False)
+    text_chunks: Tuple[helpers.ContentChunk, ...] = field(default=(), repr=False, compare=False)
+
+    @classmethod
+    def from_content(cls, content) -> "ContentResult":
+        return cls(
+            id=content.id,
+            type=content.type,
+            name=content.name,
+            uri=content.uri,
+            file_type=content.file_type,
+            file_name=content.file_name,
+            creation_date=content.creation_date,
+            original_date=content.original_date,
+            # NOTE: contents returned by ID, rather than by query, have no relevance
+            relevance=getattr(content, "relevance", None),
+            issue=content.issue,
+            email=content.email,
+            document=content.document,
+            audio=content.audio,
+            image=content.image,
+            links=content.links,
+            text_chunks=tuple(helpers.content_chunks(content))
+        )
+
+    @property
+    def chunks(self) -> List[helpers.ContentChunk]:
+        """Get the text chunks of the content, with their page, transcript segment or frame locator."""
+        return list(self.text_chunks)
+
+    @property
+    def text(self) -> str:
+        """Get the extracted text of the content."""
+        return "\n".join(chunk.text for chunk in self.text_chunks)
+
+    def to_markdown(self, include_text: Optional[bool] = True) -> str:
+        results = helpers.format_content(self, include_text=False)
+
+        if include_text:
+            # NOTE: formatters end metadata-only output with a blank line, in place of the text
+            if results and results[-1] == "\n":
+                results.pop()
+
+            helpers.format_chunks_text(self.text_chunks, results)
+
+        return "\n".join(results)
+
+@dataclass(slots=True)
+class PersonResult:
+    """
+    Lightweight person result, for consumers which don't need Markdown text.
+
+    Attributes:
+        id (str): The person ID.
+        name (Optional[str]): The person name.
+        email (Optional[str]): The person email.
+        uri (Optional[str]): The person URI.
+        education (Optional[str]): The person education.
+        occupation (Optional[str]): The person occupation.
+    """
+    id: str
+    name: Optional[str] = None
+    email: Optional[str] = None
+    uri: Optional[str] = None
+    education: Optional[str] = None
+    occupation: Optional[str] = None
+
+    @classmethod
+    def from_person(cls, person) -> "PersonResult":
+        return cls(
+            id=person.id,
+            name=person.name,
+            email=person.email,
+            uri=person.uri,
+            education=person.education,
+            occupation=person.occupation
+        )
+
+    def to_markdown(self) -> str:
+        return "\n".join(helpers.format_person(self))
+
+@dataclass(slots=True)
+class OrganizationResult:
+    """
+    Lightweight organization result, for consumers which don't need Markdown text.
+
+    Attributes:
+        id (str): The organization ID.
+        name (Optional[str]): The organization name.
+        email (Optional[str]): The organization email.
+        uri (Optional[str]): The organization URI.
+    """
+    id: str
+    name: Optional[str] = None
+    email: Optional[str] = None
+    uri: Optional[str] = None
+
+    @classmethod
+    def from_organization(cls, organization) -> "OrganizationResult":
+        return cls(
+            id=organization.id,
+            name=organization.name,
+            email=organization.email,
+            uri=organization.uri
+        )
+
+    def to_markdown(self) -> str:
+        return "\n".join(helpers.format_organization(self))
+
+def content_results(contents) -> List[ContentResult]:
+    return [ContentResult.from_content(content) for content in contents or []]
+
+def render_markdown(results: Iterable[Any]) -> str:
+    """
+    Renders structured results as the Markdown text returned by the tools.
+
+    Args:
+        results (Iterable[Any]): Content, person or organization results.
+
+    Returns:
+        str: The Markdown text.
+    """
+    return "\n".join(result.to_markdown() for result in results)
@@ -1,5 +1,6 @@
+import asyncio
 import logging
-from typing import Optional, Type, List
+from typing import Optional, Type, List, Union
 
 from graphlit import Graphlit
 from graphlit_api import exceptions, input_types, enums
@@ -7,6 +8,8 @@ from pydantic import BaseModel, Field
 
 from ..base_tool import BaseTool
 from ..exceptions import ToolException
+from ..rerank import Reranker
+from ..results import ContentResult, content_results
 from .. import helpers
 
 logger = logging.getLogger(__name__)
@@ -15,11 +18,13 @@ class ContentRetrievalInput(BaseModel):
     search: str = Field(description="Text to search for within the knowledge base")
     types: Optional[List[enums.ContentTypes]] = Field(description="List of content types (i.e. FILE, PAGE, EMAIL, ISSUE, MESSAGE) to be returned from knowledge base, optional.", default=None)
     limit: Optional[int] = Field(description="Number of contents to return from search query, optional.", default=None)
+    variants: Optional[List[str]] = Field(description="Alternate phrasings of the search text, which are searched concurrently and merged into one result set, optional.", default=None)
 
 class ContentRetrievalTool(BaseTool):
     name: str = "Graphlit content retrieval tool"
     description: str = """Accepts search text as string.
     Optionally accepts a list of content types (i.e. FILE, PAGE, EMAIL, ISSUE, MESSAGE) for filtering the result set.
+    Optionally accepts alternate phrasings of the search text, to improve recall.
     Retrieves contents based on similarity search from knowledge base.
     Returns extracted Markdown text and metadata from contents relevant to the search text.
     Can search through web pages, PDFs, audio transcripts, Slack messages, emails, or any unstructured data ingested into the knowledge base."""
@@ -27,12 +32,18 @@ class ContentRetrievalTool(BaseTool):
 
     graphlit: Graphlit = Field(None, exclude=True)
     search_type: Optional[enums.SearchTypes] = Field(None, exclude=True)
+    search_types: Optional[List[enums.SearchTypes]] = Field(None, exclude=True)
+    chunk_limit: Optional[int] = Field(None, exclude=True)
+    reranker: Optional[Reranker] = Field(None, exclude=True)
+    structured: bool = Field(False, exclude=True)
 
     model_config = {
         "arbitrary_types_allowed": True
     }
 
-    def __init__(self, graphlit: Optional[Graphlit] = None, search_type: Optional[enums.SearchTypes] = None, **kwargs):
+    def __init__(self, graphlit: Optional[Graphlit] = None, search_type: Optional[enums.SearchTypes] = None,
+                 search_types: Optional[List[enums.SearchTypes]] = None, chunk_limit: Optional[int] = None,
+                 reranker: Optional[Reranker] = None, structured: bool = False, **kwargs):
         """
         Initializes the ContentRetrievalTool.
 
@@ -41,20 +52,84 @@ class ContentRetrievalTool(BaseTool):
                 If not provided, a new Graphlit instance will be created.
             search_type (Optional[SearchTypes]): An optional enum specifying the type of search to use: VECTOR, HYBRID or KEYWORD.
                 If not provided, vector search will be used.
+            search_types (Optional[List[SearchTypes]]): An optional list of search types to run concurrently, for each search text.
+                Results are merged with reciprocal rank fusion. If provided, overrides search_type.
+            chunk_limit (Optional[int]): If provided, returns only this many of the most relevant text chunks across the retrieved contents,
+                each with its page, transcript segment or frame locator, rather than the full text of every content.
+            reranker (Optional[Reranker]): An optional client-side re-ranker, which reorders and prunes the retrieved contents,
+                or chunks, by similarity to the search text before formatting.
+            structured (bool): Whether to return ContentResult objects, or ContentChunk tuples in chunk mode, rather than Markdown text.
+                Defaults to False.
             **kwargs: Additional keyword arguments for the BaseTool superclass.
         """
         super().__init__(**kwargs)
         self.graphlit = graphlit or Graphlit()
         self.search_type = search_type
+        self.search_types = search_types
+        self.chunk_limit = chunk_limit
+        self.reranker = reranker
+        self.structured = structured
+
+    async def _arun(self, search: str, types: Optional[List[enums.ContentTypes]] = None, limit: Optional[int] = None, variants: Optional[List[str]] = None) -> Optional[Union[str, List[ContentResult], List[helpers.ContentChunk]]]:
+        limit = limit if limit is not None else 10 # NOTE: default to 10 relevant contents
+
+        searches = list(dict.fromkeys([search] + (variants or [])))
+        search_types = self.search_types or [self.search_type if self.search_type is not None else enums.SearchTypes.HYBRID]
+
+        if len(searches) == 1 and len(search_types) == 1:
+            contents = await self._query_contents(search, types, search_types[0], limit)
+        else:
+            responses = await asyncio.gather(
+                *(self._query_contents(query, types, search_type, limit) for query in searches for search_type in search_types),
+                return_exceptions=True
+            )
+
+            result_lists = [response for response in responses if not isinstance(response, BaseException)]
+
+            if len(result_lists) == 0:
+                raise responses[0]
+
+            contents = helpers.reciprocal_rank_fusion(result_lists)[:limit]
+
+            logger.debug(f'ContentRetrievalTool: Fused [{len(contents)}] content(s) from [{len(result_lists)}] of [{len(responses)}] queries.')
+
+        if self.chunk_limit is not None:
+            chunks = helpers.top_chunks(contents, self.chunk_limit, search, self.reranker)
+
+            if self.structured:
+                return chunks
+
+            results = []
+
+            for chunk in chunks:
+                results.extend(helpers.format_chunk(chunk))
+        else:
+            if self.reranker is not None:
+                contents = self.reranker.rerank(search, contents, key=helpers.content_text)
+
+            if self.structured:
+                return content_results(contents)
+
+            results = []
+
+            for content in contents:
+                results.extend(helpers.format_content(content))
+
+        text = "\n".join(results)
+
+        return text
+
+    def _run(self, search: str, types: Optional[List[enums.ContentTypes]] = None, limit: Optional[int] = None, variants: Optional[List[str]] = None) -> Optional[Union[str, List[ContentResult], List[helpers.ContentChunk]]]:
+        return helpers.run_async(self._arun, search, types, limit, variants)
 
-    async def _arun(self, search: str, types: Optional[List[enums.ContentTypes]] = None, limit: Optional[int] = None) -> Optional[str]:
+    async def _query_contents(self, search: str, types: Optional[List[enums.ContentTypes]], search_type: enums.SearchTypes, limit: int):
         try:
             response = await self.graphlit.client.query_contents(
                 filter=input_types.ContentFilter(
                     types=types,
                     search=search,
-                    searchType=self.search_type if self.search_type is not None else enums.SearchTypes.HYBRID,
-                    limit=limit if limit is not None else 10 # NOTE: default to 10 relevant contents
+                    searchType=search_type,
+                    limit=limit
                 )
             )
 
@@ -63,17 +138,7 @@ class ContentRetrievalTool(BaseTool):
 
             logger.debug(f'ContentRetrievalTool: Retrieved [{len(response.contents.results)}] content(s) given search text [{search}].')
 
-            results = []
-
-            for content in response.contents.results:
-                results.extend(helpers.format_content(content))
-
-            text = "\n".join(results)
-
-            return text
+            return response.contents.results
         except exceptions.GraphQLClientError as e:
             logger.error(str(e))
             raise ToolException(str(e)) from e
-
-    def _run(self, search: str, types: Optional[List[enums.ContentTypes]] = None, limit: Optional[int] = None) -> Optional[str]:
-        return helpers.run_async(self._arun, search, types, limit)
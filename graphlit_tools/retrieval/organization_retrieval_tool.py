@@ -1,12 +1,14 @@
 import logging
-from typing import Optional, Type
+from typing import Optional, Type, List, Dict, Union
 
 from graphlit import Graphlit
 from graphlit_api import exceptions, input_types, enums
 from pydantic import BaseModel, Field
 
 from ..base_tool import BaseTool
+from ..cache import ResultCache
 from ..exceptions import ToolException
+from ..results import OrganizationResult
 from .. import helpers
 
 logger = logging.getLogger(__name__)
@@ -24,12 +26,15 @@ class OrganizationRetrievalTool(BaseTool):
 
     graphlit: Graphlit = Field(None, exclude=True)
     search_type: Optional[enums.SearchTypes] = Field(None, exclude=True)
+    lookup_cache: Optional[ResultCache] = Field(None, exclude=True)
+    structured: bool = Field(False, exclude=True)
 
     model_config = {
         "arbitrary_types_allowed": True
     }
 
-    def __init__(self, graphlit: Optional[Graphlit] = None, search_type: Optional[enums.SearchTypes] = None, **kwargs):
+    def __init__(self, graphlit: Optional[Graphlit] = None, search_type: Optional[enums.SearchTypes] = None, lookup_cache: Optional[ResultCache] = None,
+                 structured: bool = False, **kwargs):
         """
         Initializes the OrganizationRetrievalTool.
 
@@ -38,13 +43,69 @@ class OrganizationRetrievalTool(BaseTool):
                 If not provided, a new Graphlit instance will be created.
             search_type (Optional[SearchTypes]): An optional enum specifying the type of search to use: VECTOR, HYBRID or KEYWORD.
                 If not provided, vector search will be used.
+            lookup_cache (Optional[ResultCache]): An optional cache of batch lookup results, keyed by search text.
+                If not provided, a new in-memory cache will be created.
+            structured (bool): Whether to return OrganizationResult objects rather than Markdown text. Defaults to False.
             **kwargs: Additional keyword arguments for the BaseTool superclass.
         """
         super().__init__(**kwargs)
         self.graphlit = graphlit or Graphlit()
         self.search_type = search_type
+        self.lookup_cache = lookup_cache if lookup_cache is not None else ResultCache(max_size=4096)
+        self.structured = structured
 
-    async def _arun(self, search: str = None, limit: Optional[int] = None) -> Optional[str]:
+    async def _arun(self, search: str = None, limit: Optional[int] = None) -> Optional[Union[str, List[OrganizationResult]]]:
+        organizations = await self._query_organizations(search, limit)
+
+        if organizations is None:
+            return None
+
+        logger.debug(f'OrganizationRetrievalTool: Retrieved [{len(organizations)}] organization(s) given search text [{search}].')
+
+        if self.structured:
+            return [OrganizationResult.from_organization(organization) for organization in organizations]
+
+        results = []
+
+        for organization in organizations:
+            results.extend(helpers.format_organization(organization))
+
+        text = "\n".join(results)
+
+        return text
+
+    def _run(self, search: str = None, limit: Optional[int] = None) -> Optional[Union[str, List[OrganizationResult]]]:
+        return helpers.run_async(self._arun, search, limit)
+
+    async def alookup(self, searches: List[str], limit: Optional[int] = None, concurrency: int = 8) -> Dict[str, Optional[list]]:
+        """
+        Looks up organizations for many names, with bounded concurrency.
+
+        Names are deduplicated, ignoring surrounding whitespace. Results are cached,
+        so repeated names across calls are not queried again.
+
+        Args:
+            searches (List[str]): Names of organizations to look up.
+            limit (Optional[int]): Maximum number of organizations to match per name. Defaults to 10.
+            concurrency (int): Maximum number of concurrent queries. Defaults to 8.
+
+        Returns:
+            Dict[str, Optional[list]]: Matched organizations for each input name, as OrganizationResult objects when structured. Names whose query failed map to None.
+        """
+        async def query(lookup_key: str):
+            return await self._query_organizations(lookup_key, limit)
+
+        return await helpers.lookup_entities(
+            query, searches, self.lookup_cache, (limit, self.search_type),
+            result_func=OrganizationResult.from_organization if self.structured else None,
+            concurrency=concurrency,
+            name="OrganizationRetrievalTool"
+        )
+
+    def lookup(self, searches: List[str], limit: Optional[int] = None, concurrency: int = 8) -> Dict[str, Optional[list]]:
+        return helpers.run_async(self.alookup, searches, limit, concurrency)
+
+    async def _query_organizations(self, search: Optional[str] = None, limit: Optional[int] = None):
         try:
             response = await self.graphlit.client.query_organizations(
                 filter=input_types.OrganizationFilter(
@@ -54,22 +115,10 @@ class OrganizationRetrievalTool(BaseTool):
                 )
             )
 
-            if response.organizations is None or response.organizations.results is None:
+            if response.organizations is None:
                 return None
 
-            logger.debug(f'OrganizationRetrievalTool: Retrieved [{len(response.organizations.results)}] organization(s) given search text [{search}].')
-
-            results = []
-
-            for organization in response.organizations.results:
-                results.extend(helpers.format_organization(organization))
-
-            text = "\n".join(results)
-
-            return text
+            return response.organizations.results
         except exceptions.GraphQLClientError as e:
             logger.error(str(e))
             raise ToolException(str(e)) from e
-
-    def _run(self, search: str = None, limit: Optional[int] = None) -> Optional[str]:
-        return helpers.run_async(self._arun, search, limit)
@@ -1,12 +1,14 @@
 import logging
-from typing import Optional, Type
+from typing import Optional, Type, List, Dict, Union
 
 from graphlit import Graphlit
 from graphlit_api import exceptions, input_types, enums
 from pydantic import BaseModel, Field
 
 from ..base_tool import BaseTool
+from ..cache import ResultCache
 from ..exceptions import ToolException
+from ..results import PersonResult
 from .. import helpers
 
 logger = logging.getLogger(__name__)
@@ -25,12 +27,15 @@ class PersonRetrievalTool(BaseTool):
 
     graphlit: Graphlit = Field(None, exclude=True)
     search_type: Optional[enums.SearchTypes] = Field(None, exclude=True)
+    lookup_cache: Optional[ResultCache] = Field(None, exclude=True)
+    structured: bool = Field(False, exclude=True)
 
     model_config = {
         "arbitrary_types_allowed": True
     }
 
-    def __init__(self, graphlit: Optional[Graphlit] = None, search_type: Optional[enums.SearchTypes] = None, **kwargs):
+    def __init__(self, graphlit: Optional[Graphlit] = None, search_type: Optional[enums.SearchTypes] = None, lookup_cache: Optional[ResultCache] = None,
+                 structured: bool = False, **kwargs):
         """
         Initializes the PersonRetrievalTool.
 
@@ -39,13 +44,71 @@ class PersonRetrievalTool(BaseTool):
                 If not provided, a new Graphlit instance will be created.
             search_type (Optional[SearchTypes]): An optional enum specifying the type of search to use: VECTOR, HYBRID or KEYWORD.
                 If not provided, vector search will be used.
+            lookup_cache (Optional[ResultCache]): An optional cache of batch lookup results, keyed by name or email.
+                If not provided, a new in-memory cache will be created.
+            structured (bool): Whether to return PersonResult objects rather than Markdown text. Defaults to False.
             **kwargs: Additional keyword arguments for the BaseTool superclass.
         """
         super().__init__(**kwargs)
         self.graphlit = graphlit or Graphlit()
         self.search_type = search_type
+        self.lookup_cache = lookup_cache if lookup_cache is not None else ResultCache(max_size=4096)
+        self.structured = structured
 
-    async def _arun(self, search: str = None, email: Optional[str] = None, limit: Optional[int] = None) -> Optional[str]:
+    async def _arun(self, search: str = None, email: Optional[str] = None, limit: Optional[int] = None) -> Optional[Union[str, List[PersonResult]]]:
+        persons = await self._query_persons(search, email, limit)
+
+        if persons is None:
+            return None
+
+        logger.debug(f'PersonRetrievalTool: Retrieved [{len(persons)}] person(s) given search text [{search}].')
+
+        if self.structured:
+            return [PersonResult.from_person(person) for person in persons]
+
+        results = []
+
+        for person in persons:
+            results.extend(helpers.format_person(person))
+
+        text = "\n".join(results)
+
+        return text
+
+    def _run(self, search: str = None, email: Optional[str] = None, limit: Optional[int] = None) -> Optional[Union[str, List[PersonResult]]]:
+        return helpers.run_async(self._arun, search, email, limit)
+
+    async def alookup(self, keys: List[str], by_email: bool = False, limit: Optional[int] = None, concurrency: int = 8) -> Dict[str, Optional[list]]:
+        """
+        Looks up persons for many names or emails, with bounded concurrency.
+
+        Keys are deduplicated, ignoring surrounding whitespace and, for emails, case. Results are cached,
+        so repeated keys across calls are not queried again.
+
+        Args:
+            keys (List[str]): Names or emails of persons to look up.
+            by_email (bool): Whether the keys are emails, rather than search text. Defaults to False.
+            limit (Optional[int]): Maximum number of persons to match per key. Defaults to 10.
+            concurrency (int): Maximum number of concurrent queries. Defaults to 8.
+
+        Returns:
+            Dict[str, Optional[list]]: Matched persons for each input key, as PersonResult objects when structured. Keys whose query failed map to None.
+        """
+        async def query(lookup_key: str):
+            return await self._query_persons(None if by_email else lookup_key, lookup_key if by_email else None, limit)
+
+        return await helpers.lookup_entities(
+            query, keys, self.lookup_cache, (by_email, limit, self.search_type),
+            normalize=lambda key: key.strip().lower() if by_email else key.strip(),
+            result_func=PersonResult.from_person if self.structured else None,
+            concurrency=concurrency,
+            name="PersonRetrievalTool"
+        )
+
+    def lookup(self, keys: List[str], by_email: bool = False, limit: Optional[int] = None, concurrency: int = 8) -> Dict[str, Optional[list]]:
+        return helpers.run_async(self.alookup, keys, by_email, limit, concurrency)
+
+    async def _query_persons(self, search: Optional[str] = None, email: Optional[str] = None, limit: Optional[int] = None):
         try:
             response = await self.graphlit.client.query_persons(
                 filter=input_types.PersonFilter(
@@ -56,22 +119,10 @@ class PersonRetrievalTool(BaseTool):
                 )
             )
 
-            if response.persons is None or response.persons.results is None:
+            if response.persons is None:
                 return None
 
-            logger.debug(f'PersonRetrievalTool: Retrieved [{len(response.persons.results)}] person(s) given search text [{search}].')
-
-            results = []
-
-            for person in response.persons.results:
-                results.extend(helpers.format_person(person))
-
-            text = "\n".join(results)
-
-            return text
+            return response.persons.results
         except exceptions.GraphQLClientError as e:
             logger.error(str(e))
             raise ToolException(str(e)) from e
-
-    def _run(self, search: str = None, email: Optional[str] = None, limit: Optional[int] = None) -> Optional[str]:
-        return helpers.run_async(self._arun, search, email, limit)
@@ -0,0 +1,357 @@
+"""
+Long-lived tool server, which hosts Graphlit tools in one process for many agent workers.
+
+Run with python -m graphlit_tools.serve, after setting the Graphlit environment variables.
+Workers connect with ToolClient, and call tools through RemoteTool proxies.
+
+Tools run with the server's Graphlit credentials, so the server listens on a Unix socket only its user can access by default,
+and requires a shared token to listen on TCP.
+"""
+import argparse
+import asyncio
+import getpass
+import hmac
+import itertools
+import json
+import logging
+import os
+import tempfile
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Type
+
+from pydantic import BaseModel, Field, create_model
+
+from .base_tool import BaseTool
+from .exceptions import ToolException
+from .mcp_server import MCPServer
+from . import adapter, helpers
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PORT = 8765
+
+TOKEN_ENVIRONMENT_VARIABLE = "GRAPHLIT_TOOLS_TOKEN"
+
+# NOTE: tool results can be large, so raise the default 64 KiB line limit
+LINE_LIMIT = 64 * 1024 * 1024
+
+def default_socket_path() -> str:
+    """
+    Gets the default Unix socket path of the tool server, in the user's runtime directory, or a per-user temporary path.
+
+    Returns:
+        str: The socket path.
+    """
+    runtime_directory = os.environ.get("XDG_RUNTIME_DIR")
+
+    if runtime_directory:
+        return os.path.join(runtime_directory, "graphlit-tools.sock")
+
+    return os.path.join(tempfile.gettempdir(), f"graphlit-tools-{getpass.getuser()}.sock")
+
+async def _authenticate(reader: asyncio.StreamReader, token: str) -> bool:
+    # NOTE: the first line of a connection must be {"token": "..."}, before any JSON-RPC request
+    try:
+        message = json.loads(await reader.readline())
+    except ValueError:
+        return False
+
+    return isinstance(message, dict) and hmac.compare_digest(str(message.get("token", "")).encode("utf-8"), token.encode("utf-8"))
+
+async def serve(server: MCPServer, host: Optional[str] = None, port: int = DEFAULT_PORT, path: Optional[str] = None, token: Optional[str] = None):
+    """
+    Serves tools over a Unix socket, or over TCP, as newline-delimited JSON-RPC, until cancelled.
+
+    Each connection is multiplexed, so a worker can have many tool calls in flight at once.
+
+    Args:
+        server (MCPServer): The server which handles tool calls.
+        host (Optional[str]): If provided, listens on TCP on this host, rather than a Unix socket. Requires a token.
+        port (int): The TCP port to listen on. Defaults to 8765.
+        path (Optional[str]): The Unix socket path to listen on. Defaults to default_socket_path(). The socket is only accessible by its user.
+        token (Optional[str]): Shared token, which connections must send before any request. Required for TCP, optional for a Unix socket.
+    """
+    if host is not None and not token:
+        raise ValueError('Serving tools over TCP requires a shared token.')
+
+    async def handle_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        async def write_line(line: bytes):
+            writer.write(line)
+
+            await writer.drain()
+
+        try:
+            if token and not await _authenticate(reader, token):
+                logger.warning('ToolServer: Rejected connection with an invalid token.')
+                return
+
+            await server.serve_lines(reader.readline, write_line)
+        # NOTE: readline raises ValueError for lines over the limit
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError) as e:
+            logger.warning(f'ToolServer: Connection closed: {e}')
+        finally:
+            writer.close()
+
+    if host is not None:
+        socket_server = await asyncio.start_server(handle_connection, host=host, port=port, limit=LINE_LIMIT)
+    else:
+        path = path or default_socket_path()
+
+        # NOTE: create the socket without group or other permissions, so other users can't call tools with our credentials
+        umask = os.umask(0o177)
+
+        try:
+            socket_server = await asyncio.start_unix_server(handle_connection, path=path, limit=LINE_LIMIT)
+        finally:
+            os.umask(umask)
+
+        os.chmod(path, 0o600)
+
+    logger.info(f'ToolServer: Serving [{len(server.tools)}] tool(s) on [{f"{host}:{port}" if host is not None else path}].')
+
+    async with socket_server:
+        await socket_server.serve_forever()
+
+class ToolClient:
+    """
+    Client for the tool server, which multiplexes concurrent tool calls over one connection.
+
+    The connection lives on the shared background event loop, so the client can be used from any event loop,
+    or synchronously.
+
+    Args:
+        host (Optional[str]): If provided, connects to the server over TCP on this host, rather than a Unix socket.
+        port (int): The server TCP port. Defaults to 8765.
+        path (Optional[str]): The server Unix socket path. Defaults to default_socket_path().
+        token (Optional[str]): Shared token of the server. Defaults to the GRAPHLIT_TOOLS_TOKEN environment variable.
+    """
+    def __init__(self, host: Optional[str] = None, port: int = DEFAULT_PORT, path: Optional[str] = None, token: Optional[str] = None):
+        self.address: Optional[Tuple[str, int]] = (host, port) if host is not None else None
+        self.path = path or default_socket_path()
+        self.token = token or os.environ.get(TOKEN_ENVIRONMENT_VARIABLE)
+
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._connection: Optional[Tuple[asyncio.StreamWriter, asyncio.Task]] = None
+        self._connect_lock: Optional[asyncio.Lock] = None
+
+    async def request(self, method: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Sends a JSON-RPC request to the server.
+
+        Args:
+            method (str): The JSON-RPC method.
+            params (Optional[Dict[str, Any]]): The JSON-RPC parameters.
+
+        Returns:
+            Any: The JSON-RPC result.
+        """
+        future = asyncio.run_coroutine_threadsafe(self._request(method, params), helpers.get_background_loop())
+
+        return await asyncio.wrap_future(future)
+
+    async def list_tools(self) -> List["RemoteTool"]:
+        """
+        Lists the tools hosted by the server, as local proxies.
+
+        Returns:
+            List[RemoteTool]: The tool proxies.
+        """
+        result = await self.request("tools/list")
+
+        return [RemoteTool.from_definition(self, definition) for definition in result["tools"]]
+
+    async def call_tool(self, name: str, arguments: Dict[str, Any]) -> str:
+        """
+        Calls a tool hosted by the server.
+
+        Args:
+            name (str): The tool function name, i.e. graphlit_web_search_tool.
+            arguments (Dict[str, Any]): The tool arguments.
+
+        Returns:
+            str: The tool result text.
+        """
+        result = await self.request("tools/call", { "name": name, "arguments": arguments })
+
+        text = "\n".join(item.get("text", "") for item in result.get("content", []))
+
+        if result.get("isError"):
+            raise ToolException(text)
+
+        return text
+
+    async def aclose(self):
+        future = asyncio.run_coroutine_threadsafe(self._close(), helpers.get_background_loop())
+
+        await asyncio.wrap_future(future)
+
+    def close(self):
+        helpers.run_async(self.aclose)
+
+    async def _request(self, method: str, params: Optional[Dict[str, Any]]) -> Any:
+        await self._connect()
+
+        writer, _ = self._connection
+
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+
+        self._pending[request_id] = future
+
+        try:
+            message = { "jsonrpc": "2.0", "id": request_id, "method": method, "params": params or {} }
+
+            writer.write(json.dumps(message, default=str).encode("utf-8") + b"\n")
+
+            await writer.drain()
+
+            return await future
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def _connect(self):
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+
+        async with self._connect_lock:
+            if self._connection is not None and not self._connection[0].is_closing():
+                return
+
+            if self.address is not None:
+                reader, writer = await asyncio.open_connection(*self.address, limit=LINE_LIMIT)
+            else:
+                reader, writer = await asyncio.open_unix_connection(self.path, limit=LINE_LIMIT)
+
+            if self.token:
+                writer.write(json.dumps({ "token": self.token }).encode("utf-8") + b"\n")
+
+            self._connection = (writer, asyncio.create_task(self._read_responses(reader, writer)))
+
+    async def _read_responses(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        error: Exception = ToolException("Tool server closed the connection.")
+
+        try:
+            while True:
+                line = await reader.readline()
+
+                if not line:
+                    break
+
+                response = json.loads(line)
+                future = self._pending.get(response.get("id"))
+
+                if future is None or future.done():
+                    continue
+
+                if "error" in response:
+                    future.set_exception(ToolException(response["error"].get("message", "Tool server error.")))
+                else:
+                    future.set_result(response.get("result"))
+        # NOTE: readline raises ValueError for lines over the limit, as does json.loads for invalid JSON
+        except (ConnectionError, ValueError) as e:
+            error = ToolException(f"Tool server connection failed: {e}")
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(error)
+
+            writer.close()
+
+    async def _close(self):
+        if self._connection is not None:
+            writer, reader_task = self._connection
+
+            writer.close()
+
+            await asyncio.gather(reader_task, return_exceptions=True)
+
+class RemoteArguments(BaseModel):
+    """Arguments schema for remote tools, which reports the server's JSON schema as-is."""
+
+    remote_schema: ClassVar[Dict[str, Any]] = {}
+
+    @classmethod
+    def model_json_schema(cls, *_args, **_kwargs) -> Dict[str, Any]:
+        return cls.remote_schema
+
+_JSON_TYPES = {
+    "string": str,
+    "integer": int,
+    "number": float,
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+}
+
+def _arguments_model(name: str, schema: Dict[str, Any]) -> Type[BaseModel]:
+    required = set(schema.get("required", []))
+    fields = {}
+
+    for field_name, field_schema in schema.get("properties", {}).items():
+        # NOTE: enums and nested schemas are validated by the server, so accept any value locally
+        field_type = _JSON_TYPES.get(field_schema.get("type"), Any)
+
+        if field_name in required:
+            fields[field_name] = (field_type, Field(...))
+        else:
+            fields[field_name] = (Optional[field_type], Field(field_schema.get("default")))
+
+    model = create_model(f"{name}_input", __base__=RemoteArguments, **fields)
+    model.remote_schema = schema
+
+    return model
+
+class RemoteTool(BaseTool):
+    """Proxy for a tool hosted by the tool server."""
+
+    name: str
+    description: str
+    args_schema: Type[BaseModel]
+
+    client: ToolClient = Field(None, exclude=True)
+    remote_name: str = Field("", exclude=True)
+
+    model_config = {
+        "arbitrary_types_allowed": True
+    }
+
+    @classmethod
+    def from_definition(cls, client: ToolClient, definition: Dict[str, Any]) -> "RemoteTool":
+        return cls(
+            name=definition["name"],
+            description=definition.get("description", ""),
+            args_schema=_arguments_model(definition["name"], definition.get("inputSchema", {})),
+            client=client,
+            remote_name=definition["name"]
+        )
+
+    async def _arun(self, **kwargs: Any) -> str:
+        return await self.client.call_tool(self.remote_name, {key: value for key, value in kwargs.items() if value is not None})
+
+    def _run(self, **kwargs: Any) -> str:
+        return helpers.run_async(self._arun, **kwargs)
+
+def main():
+    parser = argparse.ArgumentParser(description="Serves Graphlit tools to agent workers over a local socket.")
+    parser.add_argument("--socket", default=None, help="Unix socket path to listen on. Defaults to a socket in the user's runtime directory.")
+    parser.add_argument("--host", default=None, help="Host to listen on over TCP, rather than a Unix socket. Requires a token.")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="TCP port to listen on.")
+    parser.add_argument("--token", default=os.environ.get(TOKEN_ENVIRONMENT_VARIABLE), help=f"Shared token required from clients. Defaults to the {TOKEN_ENVIRONMENT_VARIABLE} environment variable.")
+
+    args = parser.parse_args()
+
+    if args.host is not None and not args.token:
+        parser.error(f"--host requires a shared token, with --token or the {TOKEN_ENVIRONMENT_VARIABLE} environment variable.")
+
+    logging.basicConfig(level=logging.INFO)
+
+    # NOTE: one Graphlit client, and one set of tool caches, shared by every connection
+    server = MCPServer(adapter.default_tools())
+
+    try:
+        asyncio.run(serve(server, args.host, args.port, args.socket, args.token))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
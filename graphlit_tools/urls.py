@@ -0,0 +1,224 @@
+import fnmatch
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+from urllib.parse import urlparse
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+def url_depth(url: str) -> int:
+    """
+    Gets the path depth of a URL, i.e. 2 for https://www.graphlit.com/blog/post.
+
+    Args:
+        url (str): The URL.
+
+    Returns:
+        int: The number of non-empty path segments.
+    """
+    return len([segment for segment in urlparse(url).path.split("/") if segment])
+
+def filter_urls(urls: Sequence[str], include: Optional[Sequence[str]] = None, exclude: Optional[Sequence[str]] = None,
+                max_depth: Optional[int] = None) -> List[str]:
+    """
+    Filters URLs by glob patterns and path depth.
+
+    Args:
+        urls (Sequence[str]): The URLs to be filtered.
+        include (Optional[Sequence[str]]): Glob patterns, of which a URL must match at least one, i.e. */blog/*. Defaults to None, for any URL.
+        exclude (Optional[Sequence[str]]): Glob patterns, of which a URL must match none, i.e. */tag/*. Defaults to None.
+        max_depth (Optional[int]): Maximum path depth of a URL. Defaults to None, for any depth.
+
+    Returns:
+        List[str]: The matching URLs, in their original order.
+    """
+    return [
+        url for url in urls
+        if (not include or any(fnmatch.fnmatchcase(url, pattern) for pattern in include))
+        and not (exclude and any(fnmatch.fnmatchcase(url, pattern) for pattern in exclude))
+        and (max_depth is None or url_depth(url) <= max_depth)
+    ]
+
+def url_relevance(url: str, query: str) -> float:
+    """
+    Scores a URL against a query, by the fraction of query words found in the URL path.
+
+    Args:
+        url (str): The URL.
+        query (str): The query text.
+
+    Returns:
+        float: The relevance, from 0 to 1.
+    """
+    query_tokens = set(TOKEN_PATTERN.findall(query.lower()))
+
+    if not query_tokens:
+        return 0.0
+
+    parsed = urlparse(url)
+
+    url_tokens = set(TOKEN_PATTERN.findall(f"{parsed.path} {parsed.query}".lower()))
+
+    return len(query_tokens & url_tokens) / len(query_tokens)
+
+def rank_urls(urls: Sequence[str], query: str, reranker: Optional[Any] = None, min_score: Optional[float] = None) -> List[str]:
+    """
+    Orders URLs by relevance to a query, most relevant first.
+
+    Args:
+        urls (Sequence[str]): The URLs to be ranked.
+        query (str): The query text.
+        reranker (Optional[Reranker]): An optional re-ranker, to score URLs by embedding similarity rather than shared words.
+        min_score (Optional[float]): Minimum word relevance for a URL to be kept. Ignored with a re-ranker, which has its own minimum score.
+
+    Returns:
+        List[str]: The ranked URLs. Ties keep their original order.
+    """
+    if reranker is not None:
+        return reranker.rerank(query, list(urls))
+
+    scored = [(url_relevance(url, query), index, url) for index, url in enumerate(urls)]
+
+    return [url for score, _, url in sorted(scored, key=lambda item: (-item[0], item[1])) if min_score is None or score >= min_score]
+
+TRACKING_PARAMETERS = ("utm_", "fbclid", "gclid", "mc_cid", "mc_eid")
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+def normalize_url(url: str) -> str:
+    """
+    Normalizes a URL, so equivalent URLs compare equal.
+
+    Lowercases the scheme and host, drops default ports, fragments and tracking parameters, and trailing slashes from the path.
+    Malformed URLs are returned as given.
+
+    Args:
+        url (str): The URL.
+
+    Returns:
+        str: The normalized URL.
+    """
+    try:
+        parsed = urlparse(url.strip())
+        port = parsed.port
+    except ValueError:
+        # NOTE: keep malformed URLs, i.e. with a non-numeric port, as given, rather than failing the whole web map
+        return url
+
+    scheme = parsed.scheme.lower()
+    host = (parsed.hostname or "").lower()
+
+    if port is not None and port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{port}"
+
+    path = parsed.path.rstrip("/") or "/"
+
+    query = "&".join(
+        parameter for parameter in parsed.query.split("&")
+        if parameter and not parameter.lower().startswith(TRACKING_PARAMETERS)
+    )
+
+    return f"{scheme}://{host}{path}" + (f"?{query}" if query else "")
+
+def unique_urls(urls: Iterable[str], normalize: bool = True) -> Iterator[str]:
+    """
+    Yields URLs, skipping those equivalent to an earlier URL, without materializing the input.
+
+    Args:
+        urls (Iterable[str]): The URLs.
+        normalize (bool): Whether to yield normalized URLs, rather than the first of each set of equivalent URLs as given. Defaults to True.
+
+    Yields:
+        str: Each distinct URL, in first-seen order.
+    """
+    seen = set()
+
+    for url in urls:
+        if not url:
+            continue
+
+        key = normalize_url(url)
+
+        if key not in seen:
+            seen.add(key)
+            yield key if normalize else url
+
+class URLTrie:
+    """
+    Counts URLs by host and path prefix, up to a fixed depth, for a compact summary of a large web site.
+
+    Only prefix counts are kept, so memory is bounded by the number of distinct prefixes rather than the number of URLs.
+
+    Args:
+        max_depth (int): Number of path segments kept beneath each host. Defaults to 2.
+    """
+    def __init__(self, max_depth: int = 2):
+        self.max_depth = max_depth
+        self.count = 0
+        self.children: Dict[str, "URLTrie"] = {}
+
+    def add(self, url: str):
+        parsed = urlparse(url)
+
+        segments = [segment for segment in parsed.path.split("/") if segment][:self.max_depth]
+
+        node = self
+        node.count += 1
+
+        for segment in [f"{parsed.scheme}://{parsed.netloc}", *segments]:
+            child = node.children.get(segment)
+
+            if child is None:
+                child = node.children[segment] = URLTrie(self.max_depth)
+
+            child.count += 1
+            node = child
+
+    def summarize(self, max_children: int = 10) -> str:
+        """
+        Renders the trie as indented path prefixes with URL counts, largest first.
+
+        Args:
+            max_children (int): Maximum number of prefixes listed beneath each node; the rest are folded into one line. Defaults to 10.
+
+        Returns:
+            str: The summary text.
+        """
+        lines = [f"{self.count} URL(s)"]
+
+        def render(node: "URLTrie", prefix: str, indent: int):
+            children = sorted(node.children.items(), key=lambda item: -item[1].count)
+
+            for segment, child in children[:max_children]:
+                path = f"{prefix}/{segment}" if prefix else segment
+
+                lines.append(f"{'  ' * indent}{path} ({child.count})")
+
+                render(child, path, indent + 1)
+
+            if len(children) > max_children:
+                folded = sum(child.count for _, child in children[max_children:])
+
+                lines.append(f"{'  ' * indent}... {len(children) - max_children} more prefix(es) ({folded})")
+
+        render(self, "", 0)
+
+        return "\n".join(lines)
+
+def summarize_urls(urls: Iterable[str], max_depth: int = 2, max_children: int = 10) -> str:
+    """
+    Summarizes URLs as a trie of host and path prefixes with URL counts, i.e. for an LLM to choose which sections of a web site to crawl.
+
+    Args:
+        urls (Iterable[str]): The URLs.
+        max_depth (int): Number of path segments kept beneath each host. Defaults to 2.
+        max_children (int): Maximum number of prefixes listed beneath each node. Defaults to 10.
+
+    Returns:
+        str: The summary text.
+    """
+    trie = URLTrie(max_depth)
+
+    for url in urls:
+        trie.add(url)
+
+    return trie.summarize(max_children)
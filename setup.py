@@ -16,7 +16,10 @@ setup(
     ],
     extras_require={
         "crewai": ["crewai"],  # Extras for CrewAI support
-        "griptape": ["griptape"]  # Extras for Griptape support
+        "griptape": ["griptape"],  # Extras for Griptape support
+        "langchain": ["langchain-core"],  # Extras for LangChain and LangGraph support
+        "autogen": ["autogen-core"],  # Extras for AutoGen support
+        "rerank": ["numpy"]  # Extras for client-side re-ranking
     },
     python_requires='>=3.10',
     author='Unstruk Data Inc.',